@@ -1,25 +1,63 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
-from flask_bcrypt import Bcrypt
 from flask_jwt_extended import create_access_token, JWTManager
 from datetime import datetime, timezone, timedelta
 import os
+import hmac
 from dotenv import load_dotenv
 import db
-from auth import role_required, token_required
+from auth import role_required, token_required, authenticate, invalidate_user, token_claims, user_cache
+import search
+import eligibility
+import exports
+import job_deletion
+from job_deletion import NOT_DELETED
+from response_cache import response_cache
+import passwords
+from json_provider import MongoJSONProvider
+from resume_ai import resume_ai_bp
+import resume_cache
+import resume_jobs
+import prompt_compact
+import metrics
+import logs
+import migrations
+import listings
+import pagination
+import matching
+from listings import JOB_HIDDEN_FIELDS
 from bson import ObjectId
+from pymongo import ReturnDocument, UpdateMany
+from pymongo.errors import DuplicateKeyError
 
 load_dotenv()
 
+logger = logs.get_logger('app')
+
 app = Flask(__name__)
+# ObjectId and datetime fields are encoded by the JSON provider, so routes return documents as-is
+app.json = MongoJSONProvider(app)
 # Allow your React app to communicate with this backend
 CORS(app, origins=["http://localhost:5173"]) 
 
-# Setup JWT and Bcrypt
+# Setup JWT
 app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "super-secret-key-change-it")
 app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(hours=24)
 jwt = JWTManager(app)
-bcrypt = Bcrypt(app)
+
+# Per-route request counts and latency histograms, served at /metrics
+metrics.init_app(app)
+
+# AI Resume Coach routes; the frontend calls them under /api
+app.register_blueprint(resume_ai_bp, url_prefix="/api")
+
+BULK_STATUS_LIMIT = 5000  # applications per PUT /jobs/<job_id>/applications/status
+
+@app.errorhandler(passwords.PasswordPoolBusy)
+def password_pool_busy(e):
+    response = jsonify({"error": "Server is busy, please retry shortly", "code": "ERR_BUSY"})
+    response.headers['Retry-After'] = str(passwords.RETRY_AFTER)
+    return response, 503
 
 # --- AUTHENTICATION ROUTES ---
 # app.py
@@ -41,11 +79,7 @@ def register():
         if existing_coordinator:
             return jsonify({"error": "A coordinator account already exists."}), 403
 
-    existing_user = db.users.find_one({'email': email})
-    if existing_user:
-        return jsonify({"error": "Email already exists"}), 409
-
-    hashed_password = bcrypt.generate_password_hash(password).decode('utf-8')
+    hashed_password = passwords.hash_password(password)
     
     # NEW: Create a full user document with default empty fields
     new_user = {
@@ -81,13 +115,16 @@ def register():
         'experience': []
     }
     
-    result = db.users.insert_one(new_user)
+    # The unique email index rejects duplicates, so no separate lookup is needed
+    try:
+        result = db.users.insert_one(new_user)
+    except DuplicateKeyError:
+        return jsonify({"error": "Email already exists"}), 409
     
-    access_token = create_access_token(identity=str(result.inserted_id))
+    access_token = create_access_token(identity=str(result.inserted_id), additional_claims=token_claims(new_user))
     
-    created_user = db.users.find_one({'_id': result.inserted_id})
-    created_user['_id'] = str(created_user['_id'])
-    del created_user['password']
+    # Echo the document we just inserted instead of reading it back
+    created_user = {k: v for k, v in new_user.items() if k != 'password'}
 
     return jsonify(access_token=access_token, user=created_user), 201
 
@@ -102,9 +139,11 @@ def login():
     
     user = db.users.find_one({'email': email})
 
-    if user and bcrypt.check_password_hash(user['password'], password):
-        access_token = create_access_token(identity=str(user['_id']))
-        user['_id'] = str(user['_id'])
+    if user and passwords.check_password(user['password'], password):
+        # Upgrade hashes made with an older work factor while we have the plaintext
+        if passwords.needs_rehash(user['password']):
+            db.users.update_one({'_id': user['_id']}, {'$set': {'password': passwords.hash_password(password)}})
+        access_token = create_access_token(identity=str(user['_id']), additional_claims=token_claims(user))
         del user['password']
         return jsonify(access_token=access_token, user=user)
     
@@ -115,11 +154,7 @@ def login():
 @app.route('/me', methods=['GET'])
 @token_required
 def get_profile():
-    user = request.current_user
-    user['_id'] = str(user['_id'])
-    if 'password' in user:
-        del user['password']
-    return jsonify(user)
+    return jsonify(request.current_user)
 # app.py
 # app.py
 
@@ -136,20 +171,27 @@ def update_profile():
                      'resume_url', 'skills', 'links']
     
     update_data = {k: v for k, v in data.items() if k in allowed_fields}
+    for field in eligibility.NUMERIC_PROFILE_FIELDS:
+        if isinstance(update_data.get(field), str):
+            try:
+                update_data[field] = float(update_data[field]) if update_data[field].strip() else None
+            except ValueError:
+                return jsonify({'error': f'{field} must be a number'}), 400
     update_data['updated_at'] = datetime.now(timezone.utc)
     
-    # THE FIX IS HERE: We use user['_id'] directly without ObjectId()
-    db.users.update_one(
+    # Update and read back the new document in a single round trip
+    updated_user = db.users.find_one_and_update(
         {'_id': user['_id']}, 
-        {'$set': update_data}
+        {'$set': update_data},
+        projection=db.USER_PUBLIC_FIELDS,
+        return_document=ReturnDocument.AFTER
     )
+    invalidate_user(user['_id'])
+    if not updated_user:
+        return jsonify({'error': 'User not found', 'code': 'ERR_NOT_FOUND'}), 404
+    if matching.PROFILE_FIELDS & update_data.keys():
+        matching.schedule_student(user['_id'])
     
-    # We also fix the find_one call here for consistency
-    updated_user = db.users.find_one({'_id': user['_id']})
-    
-    updated_user['_id'] = str(updated_user['_id'])
-    if 'password' in updated_user:
-        del updated_user['password']
     return jsonify(updated_user)
 
 @app.route('/me/experience', methods=['POST'])
@@ -178,6 +220,9 @@ def add_experience():
         {'_id': user['_id']},
         {'$push': {'experience': experience}}
     )
+    invalidate_user(user['_id'])
+    if experience['technologies']:
+        matching.schedule_student(user['_id'])
     
     return jsonify({'message': 'Experience added successfully'}), 201
 
@@ -197,9 +242,12 @@ def update_experience(exp_id):
         {'_id': user['_id'], 'experience._id': ObjectId(exp_id)}, 
         {'$set': update_fields}
     )
+    invalidate_user(user['_id'])
 
     if result.matched_count == 0:
         return jsonify({'error': 'Experience not found'}), 404
+    if 'technologies' in data:
+        matching.schedule_student(user['_id'])
     
     return jsonify({'message': 'Experience updated successfully'})
 
@@ -212,51 +260,61 @@ def delete_experience(exp_id):
         {'_id': user['_id']},
         {'$pull': {'experience': {'_id': ObjectId(exp_id)}}}
     )
+    invalidate_user(user['_id'])
 
     if result.matched_count == 0:
         return jsonify({'error': 'Experience not found'}), 404
+    matching.schedule_student(user['_id'])
     
     return jsonify({'message': 'Experience deleted successfully'})
 
+@app.route('/me/recommended-jobs', methods=['GET'])
+@token_required
+def get_recommended_jobs():
+    """Open jobs the student qualifies for, best skill match first, from the precomputed job_matches."""
+    try:
+        limit = pagination.page_size(request.args.get('limit'))
+    except ValueError:
+        return jsonify({'error': 'Invalid limit', 'code': 'ERR_VALIDATION'}), 400
+    return jsonify({'jobs': matching.recommended_jobs(request.current_user['_id'], limit)})
+
 # --- JOB ROUTES ---
 
+def _is_personalised_job_listing():
+    return listings.personalised(request.args)
+
 @app.route('/jobs', methods=['GET'])
+@response_cache.cached('jobs', skip=_is_personalised_job_listing)
 def get_jobs():
-    query = {}
-    
-    # ... (rest of the function logic is fine for a public route) ...
-    search_query = request.args.get('q', '')
-    if search_query:
-        query['$or'] = [
-            {'title': {'$regex': search_query, '$options': 'i'}},
-            {'company': {'$regex': search_query, '$options': 'i'}},
-            {'tech_stack': {'$in': [search_query]}}
-        ]
-    
-    if request.args.get('before_deadline', 'true').lower() == 'true':
-        query['deadline'] = {'$gte': datetime.now(timezone.utc)}
-    
-    jobs = list(db.jobs.find(query).sort('deadline', 1))
-    
-    for job in jobs:
-        job['_id'] = str(job['_id'])
-        job['created_by'] = str(job['created_by'])
-        job['deadline'] = job['deadline'].isoformat()
-        job['created_at'] = job['created_at'].isoformat()
-    
-    return jsonify(jobs)
+    # Only jobs the logged-in student qualifies for
+    student = None
+    if _is_personalised_job_listing():
+        error = authenticate()
+        if error is not None:
+            return error
+        student = request.current_user
+    
+    try:
+        query, projection, sort, limit, search_tokens = listings.jobs_plan(request.args, student)
+    except ValueError:
+        return jsonify({'error': 'Invalid limit or cursor'}), 400
+    
+    # The shared listing is cached right after job writes clear the cache, so it must not come
+    # from a lagging secondary; only the uncached per-student listing may read one
+    jobs = db.for_listing(db.jobs) if student is not None else db.jobs
+    cursor = jobs.find(query, projection).sort(sort)
+    if limit is not None:
+        # Fetch one extra row to learn whether another page exists
+        cursor = cursor.limit(limit + 1)
+    return jsonify(listings.jobs_body(list(cursor), limit, search_tokens))
 
 @app.route('/jobs/<job_id>', methods=['GET'])
+@response_cache.cached('jobs')
 def get_job(job_id):
-    job = db.jobs.find_one({'_id': ObjectId(job_id)})
+    job = db.jobs.find_one({'_id': ObjectId(job_id), **NOT_DELETED}, JOB_HIDDEN_FIELDS)
     if not job:
         return jsonify({'error': 'Job not found'}), 404
     
-    job['_id'] = str(job['_id'])
-    job['created_by'] = str(job['created_by'])
-    job['deadline'] = job['deadline'].isoformat()
-    job['created_at'] = job['created_at'].isoformat()
-    
     return jsonify(job)
 
 @app.route('/jobs', methods=['POST'])
@@ -284,11 +342,14 @@ def create_job():
         'created_at': datetime.now(timezone.utc)
     }
     
-    result = db.jobs.insert_one(job)
-    job['_id'] = str(result.inserted_id)
-    job['created_by'] = str(job['created_by'])
-    job['deadline'] = job['deadline'].isoformat()
-    job['created_at'] = job['created_at'].isoformat()
+    result = db.jobs.insert_one({
+        **job,
+        'search_terms': search.search_terms(job),
+        eligibility.INDEX_FIELD: eligibility.build_index(job['eligibility'])
+    })
+    response_cache.invalidate('jobs')
+    job['_id'] = result.inserted_id
+    matching.schedule_job(job['_id'])
     
     return jsonify(job), 201
 
@@ -302,7 +363,7 @@ def create_application():
     data = request.get_json()
     job_id = ObjectId(data['job_id'])
     
-    job = db.jobs.find_one({'_id': job_id})
+    job = db.jobs.find_one({'_id': job_id, **NOT_DELETED})
     if not job:
         return jsonify({'error': 'Job not found', 'code': 'ERR_NOT_FOUND'}), 404
     
@@ -328,10 +389,7 @@ def create_application():
     }
     
     result = db.applications.insert_one(application)
-    application['_id'] = str(result.inserted_id)
-    application['user_id'] = str(application['user_id'])
-    application['job_id'] = str(application['job_id'])
-    application['created_at'] = application['created_at'].isoformat()
+    application['_id'] = result.inserted_id
     
     return jsonify(application), 201
 # app.py
@@ -343,46 +401,86 @@ def create_application():
 def get_applications():
     user = request.current_user
     
-    print(f"--- Fetching applications for user ID: {user['_id']} ---")
-    
     applications = list(db.applications.find({'user_id': user['_id']}))
+    logger.debug('applications fetched', sample=logs.SAMPLE_RATE, user_id=user['_id'], count=len(applications))
     
-    print(f"--- Found {len(applications)} applications in the database ---")
-    
-    for app_doc in applications:
-        # Convert all application fields first
-        app_doc['_id'] = str(app_doc['_id'])
-        app_doc['user_id'] = str(app_doc['user_id'])
-        job_id = app_doc['job_id'] # Keep the ObjectId for the query
-        app_doc['job_id'] = str(app_doc['job_id'])
-        app_doc['created_at'] = app_doc['created_at'].isoformat()
-        
-        # Find the job using the ObjectId
-        job = db.jobs.find_one({'_id': job_id}, {'title': 1, 'company': 1, 'deadline': 1})
-        
-        if job:
-            # THE FIX IS HERE: Ensure all fields from the 'job' object are also converted
-            job['_id'] = str(job['_id']) # Convert the job's _id
-            job['deadline'] = job['deadline'].isoformat()
-            app_doc['job'] = job
-        else:
-            app_doc['job'] = None
+    # Fetch every referenced job in one $in query instead of one find_one per application
+    job_ids = list({app_doc['job_id'] for app_doc in applications})
+    jobs = []
+    if job_ids:
+        jobs = list(db.jobs.find({'_id': {'$in': job_ids}, **NOT_DELETED}, listings.APPLICATION_JOB_FIELDS))
     
-    return jsonify(applications)
+    # Applications of deleted jobs are hidden while their purge is still running
+    return jsonify(listings.attach_jobs(applications, jobs))
 
 @app.route('/jobs/<job_id>/applications', methods=['GET'])
 @token_required # DECORATOR ADDED: Must check token first
 @role_required('coordinator')
 def get_job_applications(job_id):
-    applications = list(db.applications.find({'job_id': ObjectId(job_id)}))
+    job_oid = ObjectId(job_id)
+    # Applicants of a deleted job stay hidden while the purge removes them
+    if not db.jobs.find_one({'_id': job_oid, **NOT_DELETED}, {'_id': 1}):
+        return jsonify({'error': 'Job not found', 'code': 'ERR_NOT_FOUND'}), 404
+
+    if not listings.applicants_paginated(request.args):
+        applications = list(db.applications.find({'job_id': job_oid}))
+        return jsonify(applications)
     
-    for app_doc in applications:
-        app_doc['_id'] = str(app_doc['_id'])
-        app_doc['user_id'] = str(app_doc['user_id'])
-        app_doc['job_id'] = str(app_doc['job_id'])
-        app_doc['created_at'] = app_doc['created_at'].isoformat()
+    try:
+        pipeline, page, limit = listings.applicants_plan(job_oid, request.args, db.users.name)
+    except ValueError:
+        return jsonify({'error': 'Invalid page, limit or sort', 'code': 'ERR_VALIDATION'}), 400
     
-    return jsonify(applications)
+    result = next(db.applications.aggregate(pipeline, allowDiskUse=True))
+    return jsonify(listings.applicants_body(result, page, limit))
+
+@app.route('/jobs/<job_id>/applications/export', methods=['GET'])
+@token_required
+@role_required('coordinator')
+def export_job_applications(job_id):
+    """Streams a job's applicants joined with their profiles as CSV (default) or NDJSON (?format=ndjson)."""
+    fmt = request.args.get('format', 'csv').lower()
+    if fmt not in exports.FORMATS:
+        return jsonify({'error': 'format must be csv or ndjson', 'code': 'ERR_VALIDATION'}), 400
+
+    job_oid = ObjectId(job_id)
+    if not db.jobs.find_one({'_id': job_oid, **NOT_DELETED}, {'_id': 1}):
+        return jsonify({'error': 'Job not found', 'code': 'ERR_NOT_FOUND'}), 404
+
+    return Response(
+        exports.stream(job_oid, fmt),
+        mimetype=exports.FORMATS[fmt],
+        headers={'Content-Disposition': f'attachment; filename="applicants-{job_id}.{fmt}"'}
+    )
+
+@app.route('/jobs/<job_id>/eligible-students', methods=['GET'])
+@token_required
+@role_required('coordinator')
+def get_eligible_students(job_id):
+    """Lists every student who meets a job's eligibility rules, in one indexed query."""
+    job_oid = ObjectId(job_id)
+    job = db.jobs.find_one({'_id': job_oid, **NOT_DELETED}, {'eligibility': 1})
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    students = list(db.for_listing(db.users).find(eligibility.students_query(job), eligibility.STUDENT_FIELDS).sort('ug_cgpa', -1))
+    applied_ids = set(db.for_listing(db.applications).distinct('user_id', {'job_id': job_oid}))
+    
+    for student in students:
+        student['applied'] = student['_id'] in applied_ids
+    
+    return jsonify({'count': len(students), 'students': students})
+
+@app.route('/jobs/<job_id>/top-candidates', methods=['GET'])
+@token_required
+@role_required('coordinator')
+def get_top_candidates(job_id):
+    """Eligible students ranked by skill match and CGPA, from the precomputed job_matches."""
+    try:
+        limit = pagination.page_size(request.args.get('limit'))
+    except ValueError:
+        return jsonify({'error': 'Invalid limit', 'code': 'ERR_VALIDATION'}), 400
+    return jsonify({'candidates': matching.top_candidates(ObjectId(job_id), limit)})
 
 @app.route('/applications/<app_id>/status', methods=['PUT'])
 @token_required # DECORATOR ADDED: Must check token first
@@ -394,8 +492,14 @@ def update_application_status(app_id):
     if 'notes' in data:
         update_data['notes'] = data['notes']
     
+    application = db.applications.find_one({'_id': ObjectId(app_id)}, {'job_id': 1})
+    if not application:
+        return jsonify({'error': 'Application not found'}), 404
+    if not db.jobs.find_one({'_id': application['job_id'], **NOT_DELETED}, {'_id': 1}):
+        return jsonify({'error': 'Job not found', 'code': 'ERR_NOT_FOUND'}), 404
+
     result = db.applications.update_one(
-        {'_id': ObjectId(app_id)},
+        {'_id': application['_id']},
         {'$set': update_data}
     )
 
@@ -404,6 +508,110 @@ def update_application_status(app_id):
     
     return jsonify({'message': 'Application status updated successfully'})
 
+def _bulk_status_changes(data):
+    """
+    Normalises a bulk status request into [(application id string, fields to $set)].
+    Accepts {'status', 'notes'?, 'ids': [...]}, {'updates': [{'id', 'status', 'notes'?}, ...]}
+    or {'status', 'notes'?, 'filter': {'status': ...}}; the filter form returns None for the
+    items and the fields to $set on every matching application.
+    """
+    def fields(item):
+        status = item.get('status')
+        if not isinstance(status, str) or not status:
+            raise ValueError('Each update needs a status')
+        update = {'status': status}
+        if 'notes' in item:
+            if item['notes'] is not None and not isinstance(item['notes'], str):
+                raise ValueError('notes must be a string')
+            update['notes'] = item['notes']
+        return update
+
+    if 'updates' in data:
+        if not isinstance(data['updates'], list) or not all(isinstance(item, dict) for item in data['updates']):
+            raise ValueError('updates must be a list of objects')
+        items = [(str(item.get('id')), fields(item)) for item in data['updates']]
+    elif 'ids' in data:
+        if not isinstance(data['ids'], list):
+            raise ValueError('ids must be a list')
+        update = fields(data)
+        items = [(str(app_id), update) for app_id in data['ids']]
+    elif 'filter' in data:
+        if not isinstance(data['filter'], dict):
+            raise ValueError('filter must be an object')
+        current = data['filter'].get('status')
+        # Only plain status values, never a Mongo operator
+        if current is not None and not isinstance(current, str) and not (
+                isinstance(current, list) and all(isinstance(status, str) for status in current)):
+            raise ValueError('filter.status must be a string or a list of strings')
+        return None, fields(data)
+    else:
+        raise ValueError('Provide ids, updates or filter')
+
+    if len(items) > BULK_STATUS_LIMIT:
+        raise ValueError(f'At most {BULK_STATUS_LIMIT} applications per request')
+    return items, None
+
+@app.route('/jobs/<job_id>/applications/status', methods=['PUT'])
+@token_required
+@role_required('coordinator')
+def bulk_update_application_status(job_id):
+    """
+    Sets the status of many applications for one job in a single bulk write.
+    Returns a result per application: updated, unchanged, not_found or invalid_id;
+    the filter form returns only the matched and modified counts.
+    """
+    job_oid = ObjectId(job_id)
+    data = request.get_json() or {}
+    try:
+        items, filter_update = _bulk_status_changes(data)
+    except ValueError as e:
+        return jsonify({'error': str(e), 'code': 'ERR_VALIDATION'}), 400
+    if not db.jobs.find_one({'_id': job_oid, **NOT_DELETED}, {'_id': 1}):
+        return jsonify({'error': 'Job not found', 'code': 'ERR_NOT_FOUND'}), 404
+
+    query = {'job_id': job_oid}
+    if items is None:
+        # Filter form: e.g. {"status": "Rejected", "filter": {"status": "Applied"}} is one
+        # update_many on the (job_id, status) index, however many applicants it touches
+        current = data['filter'].get('status')
+        if current is not None:
+            query['status'] = {'$in': current} if isinstance(current, list) else current
+        result = db.applications.update_many(query, {'$set': filter_update})
+        return jsonify({'matched': result.matched_count, 'modified': result.modified_count})
+
+    oids = {app_id: ObjectId(app_id) for app_id, _ in items if ObjectId.is_valid(app_id)}
+
+    # One read tells us which ids belong to this job and which already have the requested values
+    existing = {}
+    if oids:
+        for doc in db.applications.find({**query, '_id': {'$in': list(oids.values())}}, {'status': 1, 'notes': 1}):
+            existing[str(doc['_id'])] = doc
+
+    # Ids that need the same $set share one UpdateMany, so the write is a single bulk_write
+    results, groups = [], {}
+    for app_id, update in items:
+        doc = existing.get(app_id)
+        if app_id not in oids:
+            outcome = 'invalid_id'
+        elif doc is None:
+            outcome = 'not_found'
+        elif all(doc.get(key) == value for key, value in update.items()):
+            outcome = 'unchanged'
+        else:
+            outcome = 'updated'
+            groups.setdefault(tuple(sorted(update.items())), []).append(oids[app_id])
+        results.append({'id': app_id, 'result': outcome})
+
+    modified = 0
+    if groups:
+        result = db.applications.bulk_write([
+            UpdateMany({'_id': {'$in': ids}, 'job_id': job_oid}, {'$set': dict(update)})
+            for update, ids in groups.items()
+        ], ordered=False)
+        modified = result.modified_count
+
+    return jsonify({'modified': modified, 'results': results})
+
 # app.py
 
 # --- NEW COORDINATOR-SPECIFIC JOB ROUTES ---
@@ -414,18 +622,13 @@ def update_application_status(app_id):
 def get_coordinator_jobs():
     """Fetches only the jobs created by the currently logged-in coordinator."""
     user = request.current_user
-    jobs = list(db.jobs.find({'created_by': user['_id']}))
+    jobs = list(db.jobs.find({'created_by': user['_id'], **NOT_DELETED}, JOB_HIDDEN_FIELDS))
     
-    # Add application count to each job
-    for job in jobs:
-        job['_id'] = str(job['_id'])
-        job['created_by'] = str(job['created_by'])
-        job['deadline'] = job['deadline'].isoformat()
-        job['created_at'] = job['created_at'].isoformat()
-        app_count = db.applications.count_documents({'job_id': ObjectId(job['_id'])})
-        job['application_count'] = app_count
-
-    return jsonify(jobs)
+    # Count applications per job and status in one grouped aggregation
+    # instead of a count_documents call for every job
+    job_ids = [job['_id'] for job in jobs]
+    rows = db.applications.aggregate(listings.status_counts_pipeline(job_ids)) if job_ids else []
+    return jsonify(listings.attach_status_counts(jobs, rows))
 
 
 @app.route('/jobs/<job_id>', methods=['PUT'])
@@ -436,7 +639,7 @@ def update_job(job_id):
     user = request.current_user
     job_oid = ObjectId(job_id)
     
-    job = db.jobs.find_one({'_id': job_oid})
+    job = db.jobs.find_one({'_id': job_oid, **NOT_DELETED})
     if not job:
         return jsonify({'error': 'Job not found'}), 404
         
@@ -456,7 +659,16 @@ def update_job(job_id):
     if 'deadline' in data:
         update_data['deadline'] = datetime.fromisoformat(data['deadline'].replace('Z', '+00:00'))
 
+    # Keep the search terms in sync with the searchable fields
+    if any(field in update_data for field in search.FIELD_WEIGHTS):
+        update_data['search_terms'] = search.search_terms({**job, **update_data})
+    if 'eligibility' in update_data:
+        update_data[eligibility.INDEX_FIELD] = eligibility.build_index(update_data['eligibility'])
+
     db.jobs.update_one({'_id': job_oid}, {'$set': update_data})
+    response_cache.invalidate('jobs')
+    if matching.JOB_FIELDS & update_data.keys():
+        matching.schedule_job(job_oid)
     
     return jsonify({'message': 'Job updated successfully'})
 
@@ -465,11 +677,14 @@ def update_job(job_id):
 @token_required
 @role_required('coordinator')
 def delete_job(job_id):
-    """Deletes a job posting and all its associated applications."""
+    """
+    Deletes a job posting. The job disappears immediately; its applications are
+    purged in the background, with progress at GET /jobs/<job_id>/deletion.
+    """
     user = request.current_user
     job_oid = ObjectId(job_id)
     
-    job = db.jobs.find_one({'_id': job_oid})
+    job = db.jobs.find_one({'_id': job_oid, **NOT_DELETED})
     if not job:
         return jsonify({'error': 'Job not found'}), 404
         
@@ -477,11 +692,48 @@ def delete_job(job_id):
     if job['created_by'] != user['_id']:
         return jsonify({'error': 'Unauthorized to delete this job'}), 403
         
-    # Delete the job and its applications
-    db.jobs.delete_one({'_id': job_oid})
-    db.applications.delete_many({'job_id': job_oid})
+    job_deletion.delete(job_oid)
+    response_cache.invalidate('jobs')
+    matching.schedule_job(job_oid)
     
-    return jsonify({'message': 'Job and all associated applications deleted successfully'})
+    return jsonify({
+        'message': 'Job deleted; its applications are being removed in the background',
+        'deletion': job_deletion.progress(job_oid)
+    }), 202
+
+@app.route('/jobs/<job_id>/deletion', methods=['GET'])
+@token_required
+@role_required('coordinator')
+def get_job_deletion(job_id):
+    """Progress of a job's background purge: status, total and deleted application counts."""
+    deletion = job_deletion.progress(ObjectId(job_id))
+    if not deletion:
+        return jsonify({'error': 'No deletion in progress for this job', 'code': 'ERR_NOT_FOUND'}), 404
+    return jsonify(deletion)
+
+# --- OPERATIONS ---
+
+@app.route('/stats/cache', methods=['GET'])
+@token_required
+@role_required('coordinator')
+def get_cache_stats():
+    """Hit/miss counters for this worker's caches, plus resume prompt sizes before/after compaction."""
+    return jsonify({
+        'users': user_cache.stats(),
+        'responses': response_cache.stats(),
+        'resume_analysis': resume_cache.stats(),
+        'resume_prompts': prompt_compact.stats(),
+        'resume_jobs': resume_jobs.stats()
+    })
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Prometheus text format. Set METRICS_TOKEN to require 'Authorization: Bearer <token>'."""
+    token = os.getenv('METRICS_TOKEN')
+    if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return jsonify({'error': 'Unauthorized', 'code': 'ERR_UNAUTHORIZED'}), 401
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 if __name__ == '__main__':
+    migrations.run()
     app.run(debug=True, port=5000)
\ No newline at end of file
@@ -0,0 +1,218 @@
+# asgi.py
+#
+# Async serving mode. This ASGI application answers the I/O-bound read
+# endpoints and the Resume Coach chat and analysis on an event loop. It awaits
+# MongoDB through async_db (pymongo's asyncio client) and the LLM through
+# AsyncGroq, so a request waiting on either holds no thread. Every other route,
+# including all writes, goes to the Flask app in app.py through a2wsgi's WSGI
+# adapter on a bounded thread pool, so both modes serve the same API:
+#
+#   pip install uvicorn a2wsgi
+#   uvicorn asgi:app --workers 4
+#
+# Native views are async versions of the Flask views for the same endpoints
+# and run inside Flask's request pipeline, so CORS headers, metrics, the
+# token_required/role_required decorators, the response cache and the error
+# handlers are the Flask app's own. Their query plans come from listings.py.
+# A user-cache miss in the auth decorators still reads the user synchronously.
+# ASGI_WSGI_THREADS (default 16) caps the threads that run bridged requests;
+# PDF parsing and the resume cache run in asyncio's default thread pool.
+
+import io
+import os
+import inspect
+from a2wsgi import WSGIMiddleware
+from a2wsgi.wsgi import build_environ
+from bson import ObjectId
+from flask import request, jsonify
+from werkzeug.exceptions import HTTPException
+
+from app import app as flask_app
+import db
+import async_db
+import listings
+import resume_ai
+from auth import token_required, role_required, authenticate
+from job_deletion import NOT_DELETED
+from response_cache import response_cache
+
+WSGI_THREADS = int(os.getenv('ASGI_WSGI_THREADS', '16'))
+
+# Flask endpoint name -> async view answering it natively
+NATIVE_VIEWS = {
+    'resume_ai.analyze_resume': resume_ai.analyze_resume_async,
+    'resume_ai.chat_about_resume': resume_ai.chat_about_resume_async,
+}
+
+
+def native(endpoint):
+    """Registers an async view for a Flask endpoint; it receives the same view arguments."""
+    def decorator(f):
+        NATIVE_VIEWS[endpoint] = f
+        return f
+    return decorator
+
+
+# --- READ ROUTES (async versions of the views in app.py) ---
+
+@native('get_jobs')
+@response_cache.cached('jobs', skip=lambda: listings.personalised(request.args))
+async def get_jobs():
+    student = None
+    if listings.personalised(request.args):
+        error = authenticate()
+        if error is not None:
+            return error
+        student = request.current_user
+
+    try:
+        query, projection, sort, limit, search_tokens = listings.jobs_plan(request.args, student)
+    except ValueError:
+        return jsonify({'error': 'Invalid limit or cursor'}), 400
+
+    # Cached responses are read from the primary, see app.get_jobs
+    jobs = db.for_listing(async_db.jobs) if student is not None else async_db.jobs
+    cursor = jobs.find(query, projection).sort(sort)
+    if limit is not None:
+        cursor = cursor.limit(limit + 1)
+    return jsonify(listings.jobs_body(await cursor.to_list(None), limit, search_tokens))
+
+
+@native('get_job')
+@response_cache.cached('jobs')
+async def get_job(job_id):
+    job = await async_db.jobs.find_one({'_id': ObjectId(job_id), **NOT_DELETED}, listings.JOB_HIDDEN_FIELDS)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+
+@native('get_applications')
+@token_required
+async def get_applications():
+    user = request.current_user
+    applications = await async_db.applications.find({'user_id': user['_id']}).to_list(None)
+    job_ids = list({app_doc['job_id'] for app_doc in applications})
+    jobs = []
+    if job_ids:
+        jobs = await async_db.jobs.find({'_id': {'$in': job_ids}, **NOT_DELETED},
+                                        listings.APPLICATION_JOB_FIELDS).to_list(None)
+    return jsonify(listings.attach_jobs(applications, jobs))
+
+
+@native('get_coordinator_jobs')
+@token_required
+@role_required('coordinator')
+async def get_coordinator_jobs():
+    user = request.current_user
+    jobs = await async_db.jobs.find({'created_by': user['_id'], **NOT_DELETED},
+                                    listings.JOB_HIDDEN_FIELDS).to_list(None)
+    rows = []
+    if jobs:
+        cursor = await async_db.applications.aggregate(listings.status_counts_pipeline([job['_id'] for job in jobs]))
+        rows = await cursor.to_list(None)
+    return jsonify(listings.attach_status_counts(jobs, rows))
+
+
+@native('get_job_applications')
+@token_required
+@role_required('coordinator')
+async def get_job_applications(job_id):
+    job_oid = ObjectId(job_id)
+    if not await async_db.jobs.find_one({'_id': job_oid, **NOT_DELETED}, {'_id': 1}):
+        return jsonify({'error': 'Job not found', 'code': 'ERR_NOT_FOUND'}), 404
+    if not listings.applicants_paginated(request.args):
+        return jsonify(await async_db.applications.find({'job_id': job_oid}).to_list(None))
+
+    try:
+        pipeline, page, limit = listings.applicants_plan(job_oid, request.args, db.users.name)
+    except ValueError:
+        return jsonify({'error': 'Invalid page, limit or sort', 'code': 'ERR_VALIDATION'}), 400
+    cursor = await async_db.applications.aggregate(pipeline, allowDiskUse=True)
+    result = (await cursor.to_list(1))[0]
+    return jsonify(listings.applicants_body(result, page, limit))
+
+
+# --- DISPATCH ---
+
+def _native_view(scope, views):
+    """The async view for the request's Flask endpoint, or None to hand it to Flask."""
+    # HEAD and CORS preflight requests are left to Flask and flask_cors
+    if scope['method'] not in ('GET', 'POST'):
+        return None
+    try:
+        rule, _ = flask_app.url_map.bind_to_environ(build_environ(scope, io.BytesIO())).match(return_rule=True)
+    except HTTPException:
+        return None
+    return views.get(rule.endpoint)
+
+
+async def _dispatch(view, environ, send):
+    """Flask's full_dispatch_request with an awaited view; the response is sent inside the request context."""
+    with flask_app.request_context(environ):
+        try:
+            try:
+                rv = flask_app.preprocess_request()
+                if rv is None:
+                    if request.routing_exception is not None:
+                        request.raise_routing_exception()
+                    rv = view(**request.view_args)
+                    if inspect.isawaitable(rv):
+                        rv = await rv
+            except Exception as e:
+                rv = flask_app.handle_user_exception(e)
+            response = flask_app.finalize_request(rv)
+        except Exception as e:
+            response = flask_app.handle_exception(e)
+        await _send_response(send, response)
+
+
+async def _send_response(send, response):
+    headers = [(k.lower().encode('latin-1'), v.encode('latin-1')) for k, v in response.headers.items()]
+    await send({'type': 'http.response.start', 'status': response.status_code, 'headers': headers})
+    try:
+        if hasattr(response.response, '__aiter__'):
+            # Async generator bodies, e.g. the streamed Resume Coach chat
+            async for chunk in response.response:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode()
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+            await send({'type': 'http.response.body', 'body': b''})
+        else:
+            await send({'type': 'http.response.body', 'body': response.get_data()})
+    finally:
+        response.close()
+
+
+async def _read_body(receive):
+    parts = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            break
+        parts.append(message.get('body', b''))
+        if not message.get('more_body'):
+            break
+    return b''.join(parts)
+
+
+def create_app(native=True, wsgi_threads=WSGI_THREADS):
+    """
+    The ASGI application. native=False sends every route through the WSGI
+    adapter, i.e. the thread-per-request sync app, which the benchmark uses as
+    its baseline.
+    """
+    wsgi = WSGIMiddleware(flask_app, workers=wsgi_threads)
+    views = NATIVE_VIEWS if native else {}
+
+    async def application(scope, receive, send):
+        view = _native_view(scope, views) if scope['type'] == 'http' else None
+        if view is None:
+            return await wsgi(scope, receive, send)
+        body = await _read_body(receive)
+        await _dispatch(view, build_environ(scope, io.BytesIO(body)), send)
+
+    return application
+
+
+app = create_app()
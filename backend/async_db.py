@@ -0,0 +1,39 @@
+# async_db.py
+#
+# MongoDB access for the async routes in asgi.py, through pymongo's asyncio
+# client (AsyncMongoClient, which supersedes Motor). It shares db.py's URI,
+# database, pool settings and metrics listener, and resolves collections the
+# same way: async_db.jobs, async_db.applications, ...
+#
+# An AsyncMongoClient is bound to the event loop that first uses it, so one
+# is created lazily per loop rather than at import.
+
+import asyncio
+from pymongo import AsyncMongoClient
+import db
+import metrics
+
+_client = None
+_client_loop = None
+
+
+def get_client():
+    """The running event loop's AsyncMongoClient, created on first use."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = AsyncMongoClient(db.MONGO_URI, event_listeners=[metrics.MongoCommandMetrics()], **db.POOL_OPTIONS)
+        _client_loop = loop
+    return _client
+
+
+def get_database():
+    return get_client()[db.DB_NAME]
+
+
+def __getattr__(name):
+    if name == 'client':
+        return get_client()
+    if name in db.COLLECTIONS:
+        return get_database()[name]
+    raise AttributeError(f"module 'async_db' has no attribute {name!r}")
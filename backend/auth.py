@@ -1,34 +1,102 @@
 # auth.py
 
+import os
+import copy
 from functools import wraps
 from flask import request, jsonify
 import db
 from bson import ObjectId
-from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
+from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
+from cache import TTLCache
+
+# Per-process cache of user documents keyed by user id, so authenticated
+# requests usually skip the users.find_one. Routes that change a user must
+# call invalidate_user(); other workers see the change within the TTL.
+user_cache = TTLCache(
+    maxsize=int(os.getenv('USER_CACHE_SIZE', '2048')),
+    ttl=float(os.getenv('USER_CACHE_TTL', '30'))
+)
+
+# When set, role_required trusts the 'role' claim in the JWT instead of the user document,
+# and token_required does not load the user for role-gated views
+ROLE_FROM_TOKEN = os.getenv('AUTH_ROLE_FROM_TOKEN', 'false').lower() == 'true'
 
 # DELETE the old `before_request` function.
 
+def token_claims(user):
+    """Extra JWT claims for a user's access token."""
+    return {'role': user.get('role')}
+
+
+def invalidate_user(user_id):
+    user_cache.delete(str(user_id))
+
+
+def load_current_user():
+    """
+    Verifies the JWT on the current request and returns its user document,
+    or None if that user no longer exists. Raises if the token is missing or invalid.
+    """
+    verify_jwt_in_request()
+    user_id = get_jwt_identity()
+    user = user_cache.get(user_id)
+    if user is None:
+        user = db.users.find_one({'_id': ObjectId(user_id)}, db.USER_PUBLIC_FIELDS)
+        if user is None:
+            return None
+        user_cache.set(user_id, user)
+    # Routes mutate the user they are given, so never hand out the cached copy
+    return copy.deepcopy(user)
+
+
+def claims_user():
+    """
+    {'_id', 'role'} taken from the request's JWT when roles come from the token,
+    or None when the user document is needed. Raises if the token is missing or invalid.
+    """
+    if not ROLE_FROM_TOKEN:
+        return None
+    verify_jwt_in_request()
+    role = get_jwt().get('role')
+    if role is None:
+        # Tokens issued before the role claim existed
+        return None
+    return {'_id': ObjectId(get_jwt_identity()), 'role': role}
+
+
+def authenticate(claims_only=False):
+    """
+    Sets request.current_user from the request's JWT. Returns None on success,
+    otherwise the 401/404 error response. claims_only accepts the user from
+    claims_user() without reading the user document.
+    """
+    try:
+        # This function will raise an exception if the token is missing or invalid
+        user = claims_user() if claims_only else None
+        if user is None:
+            user = load_current_user()
+        
+        if not user:
+            return jsonify({'error': 'User not found', 'code': 'ERR_NOT_FOUND'}), 404
+        
+        # Attach the user object to the request context
+        request.current_user = user
+
+    except Exception as e:
+        return jsonify({'error': 'Token is invalid or expired', 'details': str(e)}), 401
+    return None
+
+
 def token_required(f):
     """
     Decorator to ensure a valid JWT is present and load the user.
+    Views marked claims_only (see role_required) may get only the user's _id and role.
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        try:
-            # This function will raise an exception if the token is missing or invalid
-            verify_jwt_in_request()
-            user_id = get_jwt_identity()
-            user = db.users.find_one({'_id': ObjectId(user_id)})
-            
-            if not user:
-                return jsonify({'error': 'User not found', 'code': 'ERR_NOT_FOUND'}), 404
-            
-            # Attach the user object to the request context
-            request.current_user = user
-
-        except Exception as e:
-            return jsonify({'error': 'Token is invalid or expired', 'details': str(e)}), 401
-            
+        error = authenticate(claims_only=getattr(f, 'claims_only', False))
+        if error is not None:
+            return error
         return f(*args, **kwargs)
     return decorated_function
 
@@ -40,10 +108,21 @@ def role_required(required_role):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
+            if ROLE_FROM_TOKEN:
+                # Tokens issued before the role claim existed fall back to the user document
+                role = get_jwt().get('role')
+                if role is not None:
+                    if role != required_role:
+                        return jsonify({'error': 'Unauthorized for this role', 'code': 'ERR_UNAUTHORIZED'}), 403
+                    return f(*args, **kwargs)
+
             # request.current_user is now populated by the @token_required decorator
             user = getattr(request, 'current_user', None)
             if not user or user.get('role') != required_role:
                 return jsonify({'error': 'Unauthorized for this role', 'code': 'ERR_UNAUTHORIZED'}), 403
             return f(*args, **kwargs)
+        # Role-gated views use no more of the user than its _id, so with ROLE_FROM_TOKEN
+        # token_required skips the user lookup for them
+        decorated_function.claims_only = True
         return decorated_function
     return decorator
\ No newline at end of file
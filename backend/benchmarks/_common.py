@@ -0,0 +1,80 @@
+# benchmarks/_common.py
+#
+# Shared helpers for the backend benchmarks. Every benchmark runs against a
+# throwaway database (BENCH_DB, default "placement_portal_bench") on the server
+# in MONGO_URI, so the real placement_portal data is never touched.
+
+import os, sys, time, statistics
+from pymongo import MongoClient, monitoring
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db
+import migrations
+
+BENCH_DB = os.getenv("BENCH_DB", "placement_portal_bench")
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Counts Mongo commands (i.e. round trips) issued by the bench client."""
+
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def use_bench_db():
+    """Point the db module at a fresh bench database. Returns (database, counter)."""
+    counter = CommandCounter()
+    client = MongoClient(db.MONGO_URI, event_listeners=[counter])
+    client.drop_database(BENCH_DB)
+    database = client[BENCH_DB]
+
+    db.DB_NAME = BENCH_DB  # async_db opens its own client on this name
+    db.db = database
+    for name in db.COLLECTIONS:
+        setattr(db, name, database[name])
+    migrations.run(database)
+    return database, counter
+
+
+def auth_header(app, user_id):
+    from flask_jwt_extended import create_access_token
+    with app.app_context():
+        token = create_access_token(identity=str(user_id))
+    return {"Authorization": f"Bearer {token}"}
+
+
+def measure(fn, counter, repeat=20):
+    """Runs fn `repeat` times; returns (round trips per call, p50 ms, p95 ms)."""
+    fn()  # warm up
+    timings = []
+    start_count = counter.count
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - t0) * 1000)
+    round_trips = (counter.count - start_count) / repeat
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    return round_trips, statistics.median(timings), p95
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] if values else 0.0
+
+
+def report(title, header, rows):
+    print(f"\n{title}")
+    print(" | ".join(f"{h:>14}" for h in header))
+    for row in rows:
+        print(" | ".join(f"{v:>14.2f}" if isinstance(v, float) else f"{v:>14}" for v in row))
@@ -0,0 +1,58 @@
+# benchmarks/bench_applications.py
+#
+# GET /applications: the old per-application jobs.find_one loop versus the
+# batched $in lookup, as the number of applications per student grows.
+#
+#   cd backend && python benchmarks/bench_applications.py
+
+from datetime import datetime, timezone, timedelta
+from bson import ObjectId
+
+from _common import db, use_bench_db, auth_header, measure, report
+from app import app
+
+SIZES = [1, 10, 60, 200]
+
+
+def legacy_get_applications(user_id):
+    """The pre-batching implementation: one jobs.find_one per application."""
+    applications = list(db.applications.find({'user_id': user_id}))
+    for app_doc in applications:
+        job = db.jobs.find_one({'_id': app_doc['job_id']}, {'title': 1, 'company': 1, 'deadline': 1})
+        app_doc['job'] = job
+    return applications
+
+
+def main():
+    _, counter = use_bench_db()
+    client = app.test_client()
+    now = datetime.now(timezone.utc)
+    rows = []
+
+    for n in SIZES:
+        db.users.delete_many({})
+        db.jobs.delete_many({})
+        db.applications.delete_many({})
+
+        user_id = db.users.insert_one({'email': 'bench@demo.in', 'name': 'Bench', 'role': 'student'}).inserted_id
+        job_ids = db.jobs.insert_many([{
+            'title': f'Job {i}', 'company': f'Company {i}', 'deadline': now + timedelta(days=i),
+            'created_by': ObjectId(), 'created_at': now,
+        } for i in range(n)]).inserted_ids
+        db.applications.insert_many([{
+            'user_id': user_id, 'job_id': job_id, 'status': 'Applied', 'created_at': now,
+        } for job_id in job_ids])
+
+        headers = auth_header(app, user_id)
+        legacy = measure(lambda: legacy_get_applications(user_id), counter)
+        # The route also pays one users.find_one in token_required.
+        batched = measure(lambda: client.get('/applications', headers=headers), counter)
+        rows.append((n, legacy[0], legacy[1], batched[0], batched[1], batched[2]))
+
+    report("GET /applications (round trips, ms)",
+           ["applications", "legacy rt", "legacy p50", "batched rt", "batched p50", "batched p95"],
+           rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# benchmarks/bench_async.py
+#
+# Async serving mode (asgi.py) against the sync deployment at the same
+# concurrency. The sync baseline is the same ASGI app with every route sent
+# through the WSGI adapter, i.e. Flask on a pool of ASGI_WSGI_THREADS threads,
+# one request per thread as under gunicorn's threaded workers. Both run
+# in-process behind httpx's ASGI transport, so the numbers compare the
+# serving model rather than the HTTP server.
+#
+#   cd backend && python benchmarks/bench_async.py
+#   cd backend && python benchmarks/bench_async.py --concurrency 16,64,256 --scenarios resume_chat
+#
+# Resume scenarios wait FAKE_LLM_LATENCY seconds (default 1.0) on the fake
+# LLM, which is where thread-per-request runs out of threads first.
+
+import os
+import time
+import random
+import asyncio
+import argparse
+
+import httpx
+
+from _common import use_bench_db, report, percentile
+import loadtest
+import seed
+
+SCENARIOS = ['applications', 'coord_jobs', 'job_applications', 'resume_chat']
+
+
+async def run(app, ctx, scenario, concurrency, duration):
+    """Runs one scenario with `concurrency` client tasks; returns (requests, errors, elapsed seconds, latencies in ms)."""
+    make_request = getattr(loadtest, f'scenario_{scenario}')
+    latencies, errors = [], 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench', timeout=None) as client:
+        async def request(rng):
+            method, path, headers, body = make_request(ctx, rng)
+            response = await client.request(method, path, headers=headers, content=body)
+            return response.status_code
+
+        rngs = [random.Random(f'{scenario}-{n}') for n in range(concurrency)]
+        await asyncio.gather(*(request(rng) for rng in rngs))  # warm up
+        start = time.perf_counter()
+        deadline = start + duration
+
+        async def client_task(rng):
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                t0 = time.perf_counter()
+                try:
+                    status = await request(rng)
+                except Exception:
+                    status = 599
+                latencies.append((time.perf_counter() - t0) * 1000)
+                errors += status >= 400
+
+        await asyncio.gather(*(client_task(rng) for rng in rngs))
+    return len(latencies), errors, time.perf_counter() - start, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the async ASGI mode with the sync app.')
+    parser.add_argument('--students', type=int, default=2000)
+    parser.add_argument('--jobs', type=int, default=200)
+    parser.add_argument('--applications', type=int, default=50000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--concurrency', default='16,64,256', help='comma-separated client counts')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds per run')
+    args = parser.parse_args()
+
+    scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    levels = [int(n) for n in args.concurrency.split(',')]
+
+    os.environ.setdefault('RESUME_AI_FAKE_LLM', 'true')
+    use_bench_db()
+    counts = seed.generate(args.students, args.jobs, args.applications, seed=args.seed)
+    print(f"Seeded {counts}")
+
+    import asgi
+    modes = [('sync', asgi.create_app(native=False)), ('async', asgi.create_app(native=True))]
+    ctx = loadtest.build_context(loadtest.LocalTarget(), random.Random(args.seed))
+
+    rows = []
+    for scenario in scenarios:
+        for concurrency in levels:
+            for mode, app in modes:
+                requests, errors, elapsed, latencies = asyncio.run(
+                    run(app, ctx, scenario, concurrency, args.duration))
+                rows.append((scenario, mode, concurrency, requests / elapsed,
+                             percentile(latencies, 0.5), percentile(latencies, 0.99), errors))
+
+    report(f"Sync vs async serving ({asgi.WSGI_THREADS} sync threads, {args.duration:g} s per run)",
+           ["scenario", "mode", "clients", "req/s", "p50 ms", "p99 ms", "errors"],
+           rows)
+
+
+if __name__ == '__main__':
+    main()
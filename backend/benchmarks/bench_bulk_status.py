@@ -0,0 +1,72 @@
+# benchmarks/bench_bulk_status.py
+#
+# Shortlisting every applicant of one job: one PUT /applications/<id>/status
+# per application (what CoordApplicants.jsx used to do) against a single
+# PUT /jobs/<job_id>/applications/status, by ids and by filter.
+#
+#   cd backend && python benchmarks/bench_bulk_status.py
+
+import time
+from datetime import datetime, timezone, timedelta
+from bson import ObjectId
+
+from _common import db, use_bench_db, auth_header, report
+from app import app
+
+SIZES = [100, 1000]
+
+
+def seed(n):
+    now = datetime.now(timezone.utc)
+    db.users.delete_many({})
+    db.jobs.delete_many({})
+    db.applications.delete_many({})
+    coord_id = db.users.insert_one({'email': 'coord@bench.in', 'name': 'Coord', 'role': 'coordinator'}).inserted_id
+    job_id = db.jobs.insert_one({'title': 'Bench job', 'company': 'Bench', 'deadline': now + timedelta(days=7),
+                                 'created_by': coord_id, 'created_at': now}).inserted_id
+    app_ids = db.applications.insert_many([{
+        'user_id': ObjectId(), 'job_id': job_id, 'status': 'Applied', 'created_at': now,
+    } for _ in range(n)]).inserted_ids
+    return coord_id, job_id, [str(app_id) for app_id in app_ids]
+
+
+def timed(fn, counter):
+    start_count = counter.count
+    t0 = time.perf_counter()
+    fn()
+    return counter.count - start_count, (time.perf_counter() - t0) * 1000
+
+
+def main():
+    _, counter = use_bench_db()
+    client = app.test_client()
+    rows = []
+
+    for n in SIZES:
+        coord_id, job_id, app_ids = seed(n)
+        headers = auth_header(app, coord_id)
+
+        def one_at_a_time():
+            for app_id in app_ids:
+                client.put(f'/applications/{app_id}/status', json={'status': 'Shortlisted'}, headers=headers)
+
+        def by_ids():
+            client.put(f'/jobs/{job_id}/applications/status',
+                       json={'status': 'Shortlisted', 'ids': app_ids}, headers=headers)
+
+        def by_filter():
+            client.put(f'/jobs/{job_id}/applications/status',
+                       json={'status': 'Shortlisted', 'filter': {'status': 'Applied'}}, headers=headers)
+
+        for name, fn in [('one at a time', one_at_a_time), ('bulk, ids', by_ids), ('bulk, filter', by_filter)]:
+            db.applications.update_many({'job_id': job_id}, {'$set': {'status': 'Applied'}})
+            round_trips, ms = timed(fn, counter)
+            assert db.applications.count_documents({'job_id': job_id, 'status': 'Shortlisted'}) == n
+            rows.append((n, name, round_trips, ms))
+
+    report("Shortlist all applicants of a job (requests include auth lookups)",
+           ["applications", "path", "round trips", "total ms"], rows)
+
+
+if __name__ == '__main__':
+    main()
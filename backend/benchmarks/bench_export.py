@@ -0,0 +1,77 @@
+# benchmarks/bench_export.py
+#
+# Peak Python memory and time to produce a job's applicant list: the existing
+# GET /jobs/<id>/applications (list(...) then one JSON body, name/email only)
+# against the streamed GET /jobs/<id>/applications/export, which also joins
+# each applicant's profile. Peak memory is measured with tracemalloc while the
+# response body is consumed chunk by chunk, as a WSGI server would.
+#
+#   cd backend && python benchmarks/bench_export.py
+
+import time
+import tracemalloc
+from datetime import datetime, timezone, timedelta
+
+from _common import db, use_bench_db, auth_header, report
+from app import app
+
+SIZES = [1000, 10_000, 50_000]
+BATCH = 5000
+
+
+def seed(n):
+    now = datetime.now(timezone.utc)
+    db.users.delete_many({})
+    db.jobs.delete_many({})
+    db.applications.delete_many({})
+    coord_id = db.users.insert_one({'email': 'coord@bench.in', 'name': 'Coord', 'role': 'coordinator'}).inserted_id
+    job_id = db.jobs.insert_one({'title': 'Bench job', 'deadline': now + timedelta(days=7),
+                                 'created_by': coord_id, 'created_at': now}).inserted_id
+    for start in range(0, n, BATCH):
+        count = min(BATCH, n - start)
+        user_ids = db.users.insert_many([{
+            'role': 'student', 'email': f's{start + i}@bench.in', 'name': {'first': 'Student', 'last': str(start + i)},
+            'branch': 'CSE', 'ug_cgpa': 7.5, 'skills': ['Python', 'React', 'MongoDB'],
+            'resume_url': 'https://example.com/resume.pdf',
+        } for i in range(count)]).inserted_ids
+        db.applications.insert_many([{
+            'user_id': user_id, 'job_id': job_id, 'status': 'Applied', 'created_at': now, 'notes': None,
+            'profile_snapshot': {'name': {'first': 'Student', 'last': '-'}, 'email': 'x@bench.in'},
+        } for user_id in user_ids])
+    return coord_id, job_id
+
+
+def consume(client, url, headers):
+    """Returns (bytes, ms, peak MiB) for reading the whole response body."""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    response = client.get(url, headers=headers, buffered=False)
+    size = sum(len(chunk) for chunk in response.response)
+    elapsed = (time.perf_counter() - t0) * 1000
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    response.close()
+    return size, elapsed, peak
+
+
+def main():
+    use_bench_db()
+    client = app.test_client()
+    rows = []
+    for n in SIZES:
+        coord_id, job_id = seed(n)
+        headers = auth_header(app, coord_id)
+        for name, url in [
+            ('list + JSON', f'/jobs/{job_id}/applications'),
+            ('export CSV', f'/jobs/{job_id}/applications/export'),
+            ('export NDJSON', f'/jobs/{job_id}/applications/export?format=ndjson'),
+        ]:
+            size, ms, peak = consume(client, url, headers)
+            rows.append((n, name, size // 1024, ms, peak))
+
+    report("Applicant listing vs streamed export",
+           ["applicants", "path", "KiB", "ms", "peak MiB"], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/bench_jobs_pagination.py
+#
+# GET /jobs: payload size and latency of the full listing against the first
+# and a deep keyset page with ?fields=summary, as the jobs collection grows.
+#
+#   cd backend && python benchmarks/bench_jobs_pagination.py
+
+from datetime import datetime, timezone, timedelta
+from bson import ObjectId
+
+from _common import db, use_bench_db, measure, report
+from app import app
+
+SIZES = [1_000, 10_000, 50_000]
+PAGE = 24
+DEEP_PAGES = 20
+BATCH = 5_000
+
+
+def insert_jobs(n):
+    now = datetime.now(timezone.utc)
+    coord_id = ObjectId()
+    for start in range(0, n, BATCH):
+        db.jobs.insert_many([{
+            'title': f'Job {i}', 'company': f'Company {i % 50}', 'type': 'Full-time', 'location': 'Bangalore',
+            'tech_stack': ['Python', 'React', 'MongoDB'],
+            'deadline': now + timedelta(minutes=10 + i),
+            'eligibility': {'min_cgpa': 7.0, 'branches': ['CSE', 'ISE', 'AIML'], 'backlogs_allowed': False},
+            'description': 'Job description paragraph. ' * 40,
+            'created_by': coord_id, 'created_at': now,
+        } for i in range(start, min(n, start + BATCH))])
+
+
+def main():
+    _, counter = use_bench_db()
+    client = app.test_client()
+    rows = []
+
+    for n in SIZES:
+        db.jobs.delete_many({})
+        insert_jobs(n)
+
+        # Walk to a deep page once to get its cursor
+        cursor = None
+        for _ in range(DEEP_PAGES):
+            body = client.get(f'/jobs?limit={PAGE}&fields=summary' + (f'&cursor={cursor}' if cursor else '')).get_json()
+            cursor = body['next_cursor']
+        deep_url = f'/jobs?limit={PAGE}&fields=summary&cursor={cursor}'
+        first_url = f'/jobs?limit={PAGE}&fields=summary'
+
+        full_bytes = len(client.get('/jobs').data)
+        page_bytes = len(client.get(first_url).data)
+        _, full_p50, _ = measure(lambda: client.get('/jobs'), counter, repeat=5)
+        _, first_p50, _ = measure(lambda: client.get(first_url), counter)
+        _, deep_p50, deep_p95 = measure(lambda: client.get(deep_url), counter)
+        rows.append((n, full_bytes // 1024, full_p50, page_bytes // 1024, first_p50, deep_p50, deep_p95))
+
+    report("GET /jobs (KiB, ms)",
+           ["jobs", "full KiB", "full p50", "page KiB", "page1 p50", f"page{DEEP_PAGES + 1} p50", "deep p95"],
+           rows)
+
+
+if __name__ == '__main__':
+    main()
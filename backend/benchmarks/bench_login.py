@@ -0,0 +1,81 @@
+# benchmarks/bench_login.py
+#
+# POST /login throughput under concurrent load, plus the latency of a cheap
+# endpoint (GET /jobs/<id>) measured while the login rush is running, which
+# shows whether password hashing starves unrelated requests.
+#
+# Run once per mode and compare:
+#
+#   cd backend && PASSWORD_POOL_WORKERS=0 python benchmarks/bench_login.py   # inline hashing
+#   cd backend && python benchmarks/bench_login.py                           # process pool
+
+import time
+import threading
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
+from bson import ObjectId
+
+from _common import db, use_bench_db, report, percentile
+from app import app
+import passwords
+
+CONCURRENCY = [1, 8, 32]
+LOGINS_PER_THREAD = 10
+
+
+def main():
+    use_bench_db()
+    db.users.insert_one({'email': 'bench@demo.in', 'name': 'Bench', 'role': 'student',
+                         'password': passwords.hash_password('bench123')})
+    now = datetime.now(timezone.utc)
+    job_id = db.jobs.insert_one({'title': 'Probe', 'company': 'Probe', 'deadline': now + timedelta(days=1),
+                                 'created_by': ObjectId(), 'created_at': now}).inserted_id
+    mode = 'inline' if passwords.POOL_WORKERS <= 0 else f'pool x{passwords.POOL_WORKERS}'
+    rows = []
+
+    for concurrency in CONCURRENCY:
+        latencies, statuses = [], []
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def login_worker():
+            client = app.test_client()
+            for _ in range(LOGINS_PER_THREAD):
+                t0 = time.perf_counter()
+                status = client.post('/login', json={'email': 'bench@demo.in', 'password': 'bench123'}).status_code
+                with lock:
+                    latencies.append((time.perf_counter() - t0) * 1000)
+                    statuses.append(status)
+
+        probe_latencies = []
+
+        def probe():
+            client = app.test_client()
+            while not done.is_set():
+                t0 = time.perf_counter()
+                client.get(f'/jobs/{job_id}')
+                probe_latencies.append((time.perf_counter() - t0) * 1000)
+                time.sleep(0.01)
+
+        probe_thread = threading.Thread(target=probe)
+        probe_thread.start()
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(concurrency):
+                executor.submit(login_worker)
+        elapsed = time.perf_counter() - t0
+        done.set()
+        probe_thread.join()
+
+        ok = statuses.count(200)
+        rows.append((concurrency, ok / elapsed, statistics.median(latencies), percentile(latencies, 0.99),
+                     statuses.count(503), percentile(probe_latencies, 0.99)))
+
+    report(f"POST /login ({mode}, bcrypt cost {passwords.LOG_ROUNDS})",
+           ["concurrency", "logins/s", "p50 ms", "p99 ms", "503s", "probe p99 ms"],
+           rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# benchmarks/bench_pdf.py
+#
+# Resume text extraction on generated PDFs of 2, 10, 40 and 120 pages: the
+# old read-every-page pdfplumber loop, against pdf_text.extract_text with
+# each backend, serially and across the process pool. No database is needed.
+#
+#   cd backend && python benchmarks/bench_pdf.py
+
+import os
+import sys
+import time
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import pdfplumber
+import pdf_text
+import prompt_compact
+
+PAGE_COUNTS = [2, 10, 40, 120]
+LINES_PER_PAGE = 45
+MAX_CHARS = prompt_compact.RESUME_SOURCE_CHARS  # as resume_ai uses
+REPEAT = 3
+
+
+def make_pdf(pages):
+    """A minimal text-only PDF, written by hand so the benchmark needs no PDF writer."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for p in range(pages):
+        lines = [f"BT /F1 10 Tf 50 {790 - i * 16} Td (Page {p} line {i}: Python, React, MongoDB, "
+                 f"Flask; built REST APIs and dashboards for placement analytics.) Tj ET"
+                 for i in range(LINES_PER_PAGE)]
+        stream = "\n".join(lines).encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects))
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids), pages)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (i, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def legacy(data):
+    text_chunks = []
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        for p in pdf.pages:
+            t = p.extract_text() or ""
+            if t.strip():
+                text_chunks.append(t)
+    return "\n\n".join(text_chunks)[:MAX_CHARS]
+
+
+def timed(fn):
+    fn()
+    timings = []
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(timings)
+
+
+def extract(data, backend, parallel):
+    pdf_text.PARALLEL_MIN_PAGES = PARALLEL_MIN_PAGES if parallel else float('inf')
+    return pdf_text.extract_text(data, MAX_CHARS, backend=backend)
+
+
+PARALLEL_MIN_PAGES = pdf_text.PARALLEL_MIN_PAGES
+
+
+def main():
+    variants = [
+        ('pdfplumber, all pages (old)', legacy),
+        ('pdfplumber, bounded', lambda d: extract(d, 'pdfplumber', False)),
+        ('pdfium, bounded', lambda d: extract(d, 'pdfium', False)),
+        (f'pdfplumber, bounded, {pdf_text.WORKERS} procs', lambda d: extract(d, 'pdfplumber', True)),
+        (f'pdfium, bounded, {pdf_text.WORKERS} procs', lambda d: extract(d, 'pdfium', True)),
+    ]
+    corpus = {n: make_pdf(n) for n in PAGE_COUNTS}
+
+    print(f"\nPDF text extraction, MAX_CHARS={MAX_CHARS}, PDF_MAX_PAGES={pdf_text.MAX_PAGES}, "
+          f"parallel from {PARALLEL_MIN_PAGES} pages (median of {REPEAT}, ms)")
+    print(f"{'pages':>36} | " + " | ".join(f"{n:>8}" for n in PAGE_COUNTS))
+    for name, fn in variants:
+        row = []
+        for n in PAGE_COUNTS:
+            row.append(timed(lambda: fn(corpus[n])))
+        print(f"{name:>36} | " + " | ".join(f"{ms:8.2f}" for ms in row))
+
+    sizes = {n: len(extract(corpus[n], 'pdfium', False)) for n in PAGE_COUNTS}
+    print("\nchars returned: " + ", ".join(f"{n}p={c}" for n, c in sizes.items()))
+
+
+if __name__ == '__main__':
+    main()
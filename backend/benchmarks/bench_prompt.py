@@ -0,0 +1,95 @@
+# benchmarks/bench_prompt.py
+#
+# Prompt sizes for /resume/analyze and /resume/chat before and after
+# prompt_compact, on generated resumes of 1, 2, 5 and 20 pages with a
+# repeated header/footer and messy whitespace. Tokens are estimated at
+# ~4 characters each, the same estimate the budgets use. No database is needed.
+#
+#   cd backend && python benchmarks/bench_prompt.py
+
+import os
+import sys
+import json
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import prompt_compact
+from prompt_compact import estimate_tokens
+
+PAGE_COUNTS = [1, 2, 5, 20]
+MAX_CHARS = 120_000
+SNIPPET_CHARS = 4000
+
+
+def make_analysis():
+    """Shaped like a real model reply, which is several times larger than fake_llm's canned one."""
+    resources = [{'title': f'Resource {i}', 'type': 'course', 'url': f'https://example.com/course/{i}'} for i in range(3)]
+    return {
+        'headline': 'Full-stack student developer with internship experience in Python and React',
+        'core_strengths': ['Python', 'React', 'MongoDB', 'REST API design', 'Team projects', 'Flask'],
+        'skill_gaps': {area: [f'{area} gap {i}' for i in range(5)]
+                       for area in ('foundations', 'frameworks', 'tools', 'data_ai', 'soft_skills')},
+        'priority_learning_path': [{'topic': f'Topic {i}', 'why_it_matters': 'Interviewers expect it. ' * 4,
+                                    'starter_resources': resources} for i in range(6)],
+        'project_ideas': [{'title': f'Project {i}', 'description': 'A small but complete build. ' * 4,
+                           'skills': ['Python', 'Docker', 'Redis']} for i in range(5)],
+        'role_fit': [{'role': f'Role {i}', 'fit_reason': 'Matches the listed stack. ' * 3, 'confidence': 80 - i * 10}
+                     for i in range(4)],
+        'next_30_days': [{'task': f'Task {i}', 'measure_of_success': 'Shipped and reviewed. ' * 2} for i in range(4)],
+    }
+
+
+def make_pages(n):
+    sections = ['EDUCATION', 'EXPERIENCE', 'PROJECTS', 'TECHNICAL SKILLS', 'ACHIEVEMENTS']
+    pages = []
+    for p in range(n):
+        lines = ['Raj Kumar   |   raj@example.com   |   +91 98765 43210', '']
+        for s, name in enumerate(sections):
+            lines += ['', name, '']
+            for i in range(6 if name != 'EXPERIENCE' else 12):
+                lines.append(f"  •   Built  {name.lower()} item {p}-{s}-{i}:  Python,\tReact,  MongoDB  and "
+                             f"Flask services  handling   {1000 * (i + 1)} requests/day   ")
+        lines += ['', f'Page {p + 1} of {n}', 'Confidential - Raj Kumar Resume']
+        pages.append('\n'.join(lines))
+    return pages
+
+
+def analyze_prompt(resume_text, job_description):
+    return json.dumps({'resume_text': resume_text, 'target_role': 'Backend Engineer',
+                       'job_description': job_description})
+
+
+def main():
+    job_description = ('We are hiring a backend engineer.   Requirements:\n\n\n  - Python\n  - MongoDB\n' * 40)
+
+    print(f"\n/resume/analyze prompt (estimated tokens, budget {prompt_compact.RESUME_TOKENS})")
+    print(f"{'pages':>6} | {'before':>8} | {'after':>8} | {'saved':>6} | {'compact ms':>10}")
+    for n in PAGE_COUNTS:
+        pages = make_pages(n)
+        before = analyze_prompt('\n\n'.join(pages)[:MAX_CHARS], job_description)
+        t0 = time.perf_counter()
+        text = prompt_compact.compact_resume(pages)
+        jd = prompt_compact.compact_text(job_description, prompt_compact.JOB_DESCRIPTION_TOKENS)
+        elapsed = (time.perf_counter() - t0) * 1000
+        after = json.dumps({'resume_text': text, 'target_role': 'Backend Engineer', 'job_description': jd},
+                           ensure_ascii=False, separators=(',', ':'))
+        b, a = estimate_tokens(before), estimate_tokens(after)
+        print(f"{n:>6} | {b:>8} | {a:>8} | {1 - a / b:>6.1%} | {elapsed:>10.2f}")
+
+    print("\n/resume/chat context per turn (estimated tokens)")
+    print(f"{'pages':>6} | {'before':>8} | {'after':>8} | {'saved':>6}")
+    analysis = make_analysis()
+    for n in PAGE_COUNTS:
+        pages = make_pages(n)
+        raw_snippet = '\n\n'.join(pages)[:SNIPPET_CHARS]
+        before = estimate_tokens(raw_snippet) + estimate_tokens(json.dumps(analysis))
+        snippet = prompt_compact.compact_resume(pages)[:SNIPPET_CHARS]
+        digest, snippet = prompt_compact.chat_context({'digest': prompt_compact.analysis_digest(analysis),
+                                                       'resume_snippet': snippet})
+        after = estimate_tokens(snippet) + estimate_tokens(digest)
+        print(f"{n:>6} | {before:>8} | {after:>8} | {1 - after / before:>6.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_search.py
+#
+# GET /jobs?q=: the old unanchored case-insensitive $regex against the
+# indexed search_terms prefix lookup, at 10k and 100k jobs.
+#
+#   cd backend && python benchmarks/bench_search.py
+
+import random
+from datetime import datetime, timezone, timedelta
+from bson import ObjectId
+
+from _common import db, use_bench_db, measure, report
+import search
+
+SIZES = [10_000, 100_000]
+QUERIES = ['python', 'goo', 'react', 'data eng', 'kubernetes']
+BATCH = 5_000
+
+TITLES = ['Software Engineer', 'Data Engineer', 'Frontend Developer', 'Backend Engineer',
+          'DevOps Engineer', 'Data Science Intern', 'QA Analyst', 'Site Reliability Engineer']
+COMPANIES = ['Google', 'Microsoft', 'Amazon', 'Flipkart', 'Zomato', 'Paytm', 'Infosys', 'TCS',
+             'Swiggy', 'Razorpay', 'Freshworks', 'Zoho']
+TECH = ['Python', 'React', 'MongoDB', 'Java', 'Spring Boot', 'Node.js', 'AWS', 'Docker',
+        'Kubernetes', 'Go', 'C++', 'SQL', 'Machine Learning', 'CSS']
+
+
+def legacy_query(q):
+    return {'$or': [
+        {'title': {'$regex': q, '$options': 'i'}},
+        {'company': {'$regex': q, '$options': 'i'}},
+        {'tech_stack': {'$in': [q]}}
+    ]}
+
+
+def insert_jobs(n, rng):
+    now = datetime.now(timezone.utc)
+    coord_id = ObjectId()
+    batch = []
+    for i in range(n):
+        job = {
+            'title': f"{rng.choice(TITLES)} {i % 7}",
+            'company': rng.choice(COMPANIES),
+            'tech_stack': rng.sample(TECH, 3),
+            'deadline': now + timedelta(hours=rng.randint(-240, 720)),
+            'description': 'x' * 400,
+            'created_by': coord_id,
+            'created_at': now,
+        }
+        job['search_terms'] = search.search_terms(job)
+        batch.append(job)
+        if len(batch) == BATCH:
+            db.jobs.insert_many(batch)
+            batch = []
+    if batch:
+        db.jobs.insert_many(batch)
+
+
+def main():
+    _, counter = use_bench_db()
+    db.jobs.create_index([("search_terms", 1)])
+    rng = random.Random(42)
+    rows = []
+
+    for n in SIZES:
+        db.jobs.delete_many({})
+        insert_jobs(n, rng)
+        now = datetime.now(timezone.utc)
+
+        for q in QUERIES:
+            def run_legacy():
+                return list(db.jobs.find({**legacy_query(q), 'deadline': {'$gte': now}}).sort('deadline', 1))
+
+            tokens = search.tokenize(q)
+
+            def run_indexed():
+                found = db.jobs.find({**search.build_query(tokens), 'deadline': {'$gte': now}},
+                                     search.HIDDEN_FIELDS).sort('deadline', 1)
+                return search.rank(list(found), tokens)
+
+            legacy_hits, indexed_hits = len(run_legacy()), len(run_indexed())
+            _, legacy_p50, _ = measure(run_legacy, counter, repeat=5)
+            _, indexed_p50, indexed_p95 = measure(run_indexed, counter, repeat=5)
+            rows.append((n, q, legacy_hits, legacy_p50, indexed_hits, indexed_p50, indexed_p95))
+
+    report("GET /jobs?q= (hits, ms)",
+           ["jobs", "query", "regex hits", "regex p50", "terms hits", "terms p50", "terms p95"],
+           rows)
+
+
+if __name__ == '__main__':
+    main()
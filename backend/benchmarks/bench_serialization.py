@@ -0,0 +1,90 @@
+# benchmarks/bench_serialization.py
+#
+# Serialising 10k job documents for a list response: the old per-document
+# str()/isoformat() loop with Flask's default provider, against
+# MongoJSONProvider with orjson and with its stdlib fallback. No database
+# is needed.
+#
+#   cd backend && python benchmarks/bench_serialization.py
+
+import os
+import sys
+import copy
+import time
+import statistics
+from datetime import datetime, timezone, timedelta
+from bson import ObjectId
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json_provider
+from json_provider import MongoJSONProvider
+
+N_DOCS = 10_000
+REPEAT = 10
+
+
+def make_jobs(n):
+    now = datetime.now(timezone.utc)
+    coord_id = ObjectId()
+    return [{
+        '_id': ObjectId(), 'title': f'Job {i}', 'company': f'Company {i % 50}', 'type': 'Full-time',
+        'location': 'Bangalore', 'ctc': 1200000, 'stipend': None,
+        'tech_stack': ['Python', 'React', 'MongoDB'], 'deadline': now + timedelta(hours=i),
+        'eligibility': {'min_cgpa': 7.5, 'branches': ['CSE', 'ISE'], 'backlogs_allowed': False},
+        'description': 'Job description paragraph. ' * 10, 'created_by': coord_id, 'created_at': now,
+    } for i in range(n)]
+
+
+def legacy(app, jobs):
+    jobs = copy.copy(jobs)
+    for i, job in enumerate(jobs):
+        job = dict(job)
+        job['_id'] = str(job['_id'])
+        job['created_by'] = str(job['created_by'])
+        job['deadline'] = job['deadline'].isoformat()
+        job['created_at'] = job['created_at'].isoformat()
+        jobs[i] = job
+    return app.json.response(jobs).get_data()
+
+
+def provider(app, jobs):
+    return app.json.response(jobs).get_data()
+
+
+def timed(fn):
+    fn()
+    timings = []
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    jobs = make_jobs(N_DOCS)
+
+    legacy_app = Flask('legacy')
+    legacy_app.json = DefaultJSONProvider(legacy_app)
+    new_app = Flask('provider')
+    new_app.json = MongoJSONProvider(new_app)
+
+    rows = []
+    with legacy_app.app_context():
+        rows.append(('per-route loop + default provider', timed(lambda: legacy(legacy_app, jobs))))
+    with new_app.app_context():
+        if json_provider.orjson is not None:
+            rows.append(('MongoJSONProvider (orjson)', timed(lambda: provider(new_app, jobs))))
+        json_provider.orjson = None
+        rows.append(('MongoJSONProvider (stdlib)', timed(lambda: provider(new_app, jobs))))
+
+    print(f"\nSerialising {N_DOCS} job documents (median of {REPEAT}, ms)")
+    for name, ms in rows:
+        print(f"{name:>36} | {ms:8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,266 @@
+# benchmarks/loadtest.py
+#
+# Throughput and p50/p95/p99 latency of the hot endpoints under concurrent
+# load. The bench database is filled by seed.generate (small sizes by
+# default; pass the full-scale ones for capacity planning), then every
+# scenario runs --concurrency client threads for --duration seconds.
+# Resume endpoints are answered by fake_llm.FakeGroq, so no Groq key is
+# needed and no tokens are spent.
+#
+#   cd backend && python benchmarks/loadtest.py
+#   cd backend && python benchmarks/loadtest.py --students 20000 --jobs 2000 --applications 500000
+#   cd backend && python benchmarks/loadtest.py --scenarios jobs,login --concurrency 32
+#
+# Requests go through Flask's test client in this process by default. With
+# --url they go over HTTP to a running server instead (e.g. gunicorn with
+# several workers). That server's database must already hold synthetic data
+# (python seed.py with the sizes above) and it should run with
+# RESUME_AI_FAKE_LLM=true; the harness reads ids from the same MONGO_URI.
+
+import io
+import json
+import time
+import random
+import argparse
+import threading
+import http.client
+from urllib.parse import urlsplit
+
+from _common import db, use_bench_db, report, percentile
+from bench_pdf import make_pdf
+import seed
+import matching
+
+SCENARIOS = ['jobs', 'applications', 'coord_jobs', 'job_applications', 'recommended_jobs', 'top_candidates',
+             'login', 'resume_chat', 'resume_analyze']
+STUDENT_POOL = 20      # students logged in once up front and shared by the client threads
+COORDINATOR_POOL = 5
+
+CHAT_BODY = {
+    'message': 'What should I learn next for backend roles?',
+    'digest': 'Headline: Full-stack student developer\nStrengths: Python, React, MongoDB\nGaps: Docker, system design',
+    'resume_snippet': 'Built REST APIs in Flask backed by MongoDB; React dashboards for placement analytics.',
+}
+
+
+class LocalTarget:
+    """Calls the app in-process through a Flask test client per thread."""
+
+    def __init__(self):
+        from app import app
+        self.app = app
+        self._local = threading.local()
+
+    def request(self, method, path, headers, body=None):
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(path, method=method, headers=headers, data=body)
+        return response.status_code, response.get_data()
+
+
+class HttpTarget:
+    """Calls a running server over one keep-alive connection per thread."""
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self._local = threading.local()
+
+    def request(self, method, path, headers, body=None):
+        for attempt in (0, 1):
+            conn = getattr(self._local, 'conn', None)
+            if conn is None:
+                conn = self._local.conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                return response.status, response.read()
+            except (http.client.HTTPException, ConnectionError):
+                # The server closed an idle keep-alive connection; reconnect once
+                conn.close()
+                self._local.conn = None
+                if attempt:
+                    raise
+
+
+def _json(body, headers=None):
+    return {**(headers or {}), 'Content-Type': 'application/json'}, json.dumps(body).encode()
+
+
+def _multipart(fields, files):
+    boundary = f'loadtest{random.getrandbits(64):016x}'
+    out = io.BytesIO()
+    for name, value in fields.items():
+        out.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    for name, (filename, data) in files.items():
+        out.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                  f'Content-Type: application/pdf\r\n\r\n'.encode())
+        out.write(data + b'\r\n')
+    out.write(f'--{boundary}--\r\n'.encode())
+    return {'Content-Type': f'multipart/form-data; boundary={boundary}'}, out.getvalue()
+
+
+def login(target, email, password):
+    headers, body = _json({'email': email, 'password': password})
+    status, data = target.request('POST', '/login', headers, body)
+    if status != 200:
+        raise RuntimeError(f'login as {email} failed with {status}; was the database seeded?')
+    return {'Authorization': 'Bearer ' + json.loads(data)['access_token']}
+
+
+def build_context(target, rng):
+    """Logs in a pool of generated students and coordinators and picks the jobs the scenarios use."""
+    domain = f'@{seed.SYNTHETIC_DOMAIN}'
+    students = [doc['email'] for doc in db.users.find(
+        {'role': 'student', 'email': {'$regex': domain + '$'}}, {'email': 1}).limit(STUDENT_POOL * 10)]
+    coordinators = {doc['_id']: doc['email'] for doc in db.users.find(
+        {'role': 'coordinator', 'email': {'$regex': domain + '$'}}, {'email': 1}).limit(COORDINATOR_POOL)}
+    if not students or not coordinators:
+        raise RuntimeError('no synthetic users found; run seed.py with --students/--jobs/--applications first')
+
+    student_emails = rng.sample(students, min(STUDENT_POOL, len(students)))
+    coordinator_headers, coordinator_jobs = [], []
+    for coord_id, email in coordinators.items():
+        headers = login(target, email, seed.COORD_PASSWORD)
+        coordinator_headers.append(headers)
+        for job in db.jobs.find({'created_by': coord_id}, {'_id': 1}):
+            coordinator_jobs.append((headers, str(job['_id'])))
+    return {
+        'student_emails': student_emails,
+        'students': [login(target, email, seed.STUDENT_PASSWORD) for email in student_emails],
+        'coordinators': coordinator_headers,
+        'coordinator_jobs': coordinator_jobs,
+        'pdf': make_pdf(2),
+    }
+
+
+# Each scenario returns (method, path, headers, body) for one request
+def scenario_jobs(ctx, rng):
+    return 'GET', '/jobs?limit=20&fields=summary', {}, None
+
+
+def scenario_applications(ctx, rng):
+    return 'GET', '/applications', rng.choice(ctx['students']), None
+
+
+def scenario_coord_jobs(ctx, rng):
+    return 'GET', '/coord/jobs', rng.choice(ctx['coordinators']), None
+
+
+def scenario_job_applications(ctx, rng):
+    headers, job_id = rng.choice(ctx['coordinator_jobs'])
+    return 'GET', f'/jobs/{job_id}/applications?page=1&limit=50', headers, None
+
+
+def scenario_recommended_jobs(ctx, rng):
+    return 'GET', '/me/recommended-jobs', rng.choice(ctx['students']), None
+
+
+def scenario_top_candidates(ctx, rng):
+    headers, job_id = rng.choice(ctx['coordinator_jobs'])
+    return 'GET', f'/jobs/{job_id}/top-candidates?limit=50', headers, None
+
+
+def scenario_login(ctx, rng):
+    headers, body = _json({'email': rng.choice(ctx['student_emails']), 'password': seed.STUDENT_PASSWORD})
+    return 'POST', '/login', headers, body
+
+
+def scenario_resume_chat(ctx, rng):
+    headers, body = _json(CHAT_BODY)
+    return 'POST', '/api/resume/chat', headers, body
+
+
+def scenario_resume_analyze(ctx, rng):
+    # A distinct trailer per request changes the content hash, so every call misses the resume cache
+    pdf = ctx['pdf'] + b'%% loadtest %d\n' % rng.getrandbits(64)
+    headers, body = _multipart({'target_role': 'Backend Engineer'}, {'file': ('resume.pdf', pdf)})
+    return 'POST', '/api/resume/analyze', headers, body
+
+
+def run(target, ctx, scenario, concurrency, duration):
+    """Runs one scenario; returns (requests, errors, elapsed seconds, latencies in ms)."""
+    make_request = globals()[f'scenario_{scenario}']
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    window = {}
+
+    def start_clock():
+        window['start'] = time.perf_counter()
+        window['deadline'] = window['start'] + duration
+
+    # The clock starts once every client has warmed up its connection and the caches
+    ready = threading.Barrier(concurrency, action=start_clock)
+
+    def client_thread(n):
+        rng = random.Random(f'{scenario}-{n}')
+        target.request(*make_request(ctx, rng))
+        ready.wait()
+        mine, failed = [], 0
+        while time.perf_counter() < window['deadline']:
+            method, path, headers, body = make_request(ctx, rng)
+            t0 = time.perf_counter()
+            try:
+                status, _ = target.request(method, path, headers, body)
+            except Exception:
+                status = 599
+            mine.append((time.perf_counter() - t0) * 1000)
+            failed += status >= 400
+        with lock:
+            latencies.extend(mine)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=client_thread, args=(n,)) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(latencies), errors[0], time.perf_counter() - window['start'], latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the hot API endpoints.')
+    parser.add_argument('--students', type=int, default=2000)
+    parser.add_argument('--jobs', type=int, default=200)
+    parser.add_argument('--applications', type=int, default=50000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds per scenario')
+    parser.add_argument('--url', help='hit a running server instead of the in-process app')
+    args = parser.parse_args()
+
+    scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    if args.url:
+        target = HttpTarget(args.url)
+    else:
+        use_bench_db()
+        t0 = time.perf_counter()
+        counts = seed.generate(args.students, args.jobs, args.applications, seed=args.seed)
+        counts['matches'] = matching.rebuild()
+        print(f"Seeded {counts} in {time.perf_counter() - t0:.1f} s")
+        import resume_ai
+        from fake_llm import FakeGroq
+        resume_ai.set_client(FakeGroq())
+        target = LocalTarget()
+
+    ctx = build_context(target, random.Random(args.seed))
+    rows = []
+    for scenario in scenarios:
+        requests, errors, elapsed, latencies = run(target, ctx, scenario, args.concurrency, args.duration)
+        rows.append((scenario, requests, requests / elapsed, percentile(latencies, 0.5),
+                     percentile(latencies, 0.95), percentile(latencies, 0.99), errors))
+
+    where = args.url or 'in-process'
+    report(f"Load test ({where}, {args.concurrency} clients, {args.duration:g} s per scenario)",
+           ["scenario", "requests", "req/s", "p50 ms", "p95 ms", "p99 ms", "errors"],
+           rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+# bulk.py
+#
+# Batched bulk writes for backfills and recomputes that walk a whole
+# collection, so neither the operations nor a single bulk_write grows with
+# the collection.
+
+BATCH_SIZE = 1000
+
+
+def flush_in_batches(collection, ops, batch_size=BATCH_SIZE):
+    """
+    Sends the write operations from the iterable ops to the collection in
+    unordered bulk_writes of at most batch_size. Returns (operations written,
+    documents modified).
+    """
+    batch = []
+    written = modified = 0
+    for op in ops:
+        batch.append(op)
+        if len(batch) >= batch_size:
+            modified += collection.bulk_write(batch, ordered=False).modified_count
+            written += len(batch)
+            batch = []
+    if batch:
+        modified += collection.bulk_write(batch, ordered=False).modified_count
+        written += len(batch)
+    return written, modified
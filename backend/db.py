@@ -1,18 +1,100 @@
+# db.py
+#
+# MongoDB access. The client is created lazily on first use, and again in any
+# process forked after that (pymongo clients are not fork-safe), so importing
+# this module opens no connections and gunicorn can preload the app.
+# db.client, db.db and the collections below resolve through __getattr__.
+#
+# Indexes are not created here; migrations.py applies them once per database.
+
 import os
+import threading
 from pymongo import MongoClient
+from pymongo.read_preferences import Primary, PrimaryPreferred, Secondary, SecondaryPreferred, Nearest
 from dotenv import load_dotenv
+import metrics
 
 load_dotenv()
 
 MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017/placement_portal')
+DB_NAME = 'placement_portal'
+
+COLLECTIONS = (
+    'users', 'jobs', 'applications', 'resume_cache', 'resume_jobs',
+    'resume_sessions', 'job_purges', 'migrations', 'job_matches'
+)
+
+# Connection pool per worker process. Requests that cannot get a connection
+# within the wait queue timeout fail fast instead of piling up.
+POOL_OPTIONS = {
+    'maxPoolSize': int(os.getenv('MONGO_MAX_POOL_SIZE', '50')),
+    'minPoolSize': int(os.getenv('MONGO_MIN_POOL_SIZE', '0')),
+    'maxIdleTimeMS': int(os.getenv('MONGO_MAX_IDLE_MS', '300000')),
+    'waitQueueTimeoutMS': int(os.getenv('MONGO_WAIT_QUEUE_TIMEOUT_MS', '5000')),
+    'connectTimeoutMS': int(os.getenv('MONGO_CONNECT_TIMEOUT_MS', '5000')),
+    'serverSelectionTimeoutMS': int(os.getenv('MONGO_SERVER_SELECTION_TIMEOUT_MS', '5000')),
+    # 0 means no socket timeout, which long exports and aggregations need
+    'socketTimeoutMS': int(os.getenv('MONGO_SOCKET_TIMEOUT_MS', '0')) or None,
+}
+
+# Read preference for list endpoints that can tolerate replication lag
+_READ_MODES = {
+    'primary': Primary, 'primaryPreferred': PrimaryPreferred, 'secondary': Secondary,
+    'secondaryPreferred': SecondaryPreferred, 'nearest': Nearest,
+}
+LIST_READ_PREFERENCE = os.getenv('MONGO_LIST_READ_PREFERENCE', 'primary')
+LIST_MAX_STALENESS = int(os.getenv('MONGO_LIST_MAX_STALENESS', '-1'))
+if LIST_READ_PREFERENCE not in _READ_MODES:
+    raise ValueError(f'MONGO_LIST_READ_PREFERENCE must be one of {", ".join(_READ_MODES)}')
+
+# Projection for user documents that leave the database layer: never load the password hash
+USER_PUBLIC_FIELDS = {"password": 0}
+
+_client = None
+_client_pid = None
+_collections = {}
+_lock = threading.Lock()
+
+
+def get_client():
+    """This process's MongoClient, created on first use."""
+    global _client, _client_pid, _collections
+    if _client is not None and _client_pid == os.getpid():
+        return _client
+    with _lock:
+        if _client is None or _client_pid != os.getpid():
+            # A client inherited across fork is abandoned, not closed: its sockets belong to the parent
+            # Every command is counted and timed for GET /metrics
+            _client = MongoClient(MONGO_URI, event_listeners=[metrics.MongoCommandMetrics()], **POOL_OPTIONS)
+            _client_pid = os.getpid()
+            _collections = {}
+        return _client
+
+
+def get_database():
+    return get_client()[DB_NAME]
+
+
+def collection(name):
+    client = get_client()
+    coll = _collections.get(name)
+    if coll is None:
+        coll = _collections[name] = client[DB_NAME][name]
+    return coll
+
 
-client = MongoClient(MONGO_URI)
-db = client.placement_portal
+def for_listing(coll):
+    """coll with the list-endpoint read preference (MONGO_LIST_READ_PREFERENCE); unchanged when that is primary."""
+    if LIST_READ_PREFERENCE == 'primary':
+        return coll
+    return coll.with_options(read_preference=_READ_MODES[LIST_READ_PREFERENCE](max_staleness=LIST_MAX_STALENESS))
 
-users = db.users
-jobs = db.jobs
-applications = db.applications
 
-users.create_index([("email", 1)], unique=True)
-applications.create_index([("user_id", 1), ("job_id", 1)], unique=True)
-jobs.create_index([("deadline", 1)])
\ No newline at end of file
+def __getattr__(name):
+    if name == 'client':
+        return get_client()
+    if name == 'db':
+        return get_database()
+    if name in COLLECTIONS:
+        return collection(name)
+    raise AttributeError(f"module 'db' has no attribute {name!r}")
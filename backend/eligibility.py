@@ -0,0 +1,131 @@
+# eligibility.py
+#
+# Matching between a student's profile and a job's `eligibility` rules
+# (min_cgpa, min_percentage, branches, backlogs_allowed), done inside Mongo.
+#
+# Every job stores a precomputed `eligibility_index` with the optional rules
+# filled in by neutral defaults: no minimum becomes 0, no branch list becomes
+# ANY_BRANCH, unspecified backlogs become allowed. That turns "does this
+# student qualify" into a plain conjunction of equality and range predicates
+# which the compound index in migrations.py can serve, instead of an $or per rule.
+#
+# The student side compares profile numbers with range queries, which never
+# match numbers stored as strings, as the profile form used to save them.
+# backfill_students() converts those; migrations.py runs it.
+
+from pymongo import UpdateOne
+import db
+import bulk
+
+INDEX_FIELD = 'eligibility_index'
+ANY_BRANCH = '*'
+
+# Profile fields stored as numbers even when the form posts them as strings
+NUMERIC_PROFILE_FIELDS = ['ug_percentage', 'ug_cgpa', 'tenth_percentage', 'twelfth_percentage', 'diploma_percentage']
+
+# Never send the precomputed index back to clients
+HIDDEN_FIELDS = {INDEX_FIELD: 0}
+
+# Profile fields a coordinator sees in the eligible-students list
+STUDENT_FIELDS = {
+    'name': 1, 'email': 1, 'branch': 1, 'ug_cgpa': 1, 'ug_percentage': 1,
+    'standing_backlogs': 1, 'skills': 1, 'resume_url': 1
+}
+
+
+def _number(value):
+    """Coerces numbers that may have been stored as form strings. Blank or bad values count as unset."""
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def build_index(eligibility):
+    """The normalised eligibility_index for a job's eligibility rules."""
+    eligibility = eligibility or {}
+    branches = [b for b in (eligibility.get('branches') or []) if b]
+    return {
+        'min_cgpa': _number(eligibility.get('min_cgpa')) or 0,
+        'min_percentage': _number(eligibility.get('min_percentage')) or 0,
+        'branches': branches or [ANY_BRANCH],
+        'backlogs_allowed': eligibility.get('backlogs_allowed') is not False,
+    }
+
+
+def jobs_query(student):
+    """Filter on jobs matching the student's profile. Missing profile values only satisfy jobs without that rule."""
+    query = {
+        f'{INDEX_FIELD}.branches': {'$in': [student.get('branch'), ANY_BRANCH] if student.get('branch') else [ANY_BRANCH]},
+        f'{INDEX_FIELD}.min_cgpa': {'$lte': _number(student.get('ug_cgpa')) or 0},
+        f'{INDEX_FIELD}.min_percentage': {'$lte': _number(student.get('ug_percentage')) or 0},
+    }
+    if student.get('standing_backlogs'):
+        query[f'{INDEX_FIELD}.backlogs_allowed'] = True
+    return query
+
+
+def qualifies(student, index):
+    """The same test as jobs_query, for one student against one job's eligibility_index."""
+    branches = index['branches']
+    return (
+        (ANY_BRANCH in branches or student.get('branch') in branches)
+        and (_number(student.get('ug_cgpa')) or 0) >= index['min_cgpa']
+        and (_number(student.get('ug_percentage')) or 0) >= index['min_percentage']
+        and (index['backlogs_allowed'] or not student.get('standing_backlogs'))
+    )
+
+
+def students_query(job):
+    """Filter on users for the students who satisfy a job's eligibility rules."""
+    rules = build_index(job.get('eligibility'))
+    query = {'role': 'student'}
+    if ANY_BRANCH not in rules['branches']:
+        query['branch'] = {'$in': rules['branches']}
+    if rules['min_cgpa']:
+        query['ug_cgpa'] = {'$gte': rules['min_cgpa']}
+    if rules['min_percentage']:
+        query['ug_percentage'] = {'$gte': rules['min_percentage']}
+    if not rules['backlogs_allowed']:
+        query['standing_backlogs'] = {'$ne': True}
+    return query
+
+
+def backfill(batch_size=1000):
+    """Builds eligibility_index for jobs created before it existed. Safe to re-run."""
+    ops = (UpdateOne({'_id': job['_id']}, {'$set': {INDEX_FIELD: build_index(job.get('eligibility'))}})
+           for job in db.jobs.find({INDEX_FIELD: {'$exists': False}}, {'eligibility': 1}))
+    _, updated = bulk.flush_in_batches(db.jobs, ops, batch_size)
+    return updated
+
+
+def backfill_students(users=None, batch_size=1000):
+    """
+    Converts numeric profile fields stored as strings to numbers; blank strings become None.
+    Strings that are not numbers are left alone. Safe to re-run. Returns the number of users updated.
+    """
+    users = users if users is not None else db.users
+    query = {'$or': [{field: {'$type': 'string'}} for field in NUMERIC_PROFILE_FIELDS]}
+    projection = {field: 1 for field in NUMERIC_PROFILE_FIELDS}
+
+    def ops():
+        for user in users.find(query, projection):
+            converted = {}
+            for field in NUMERIC_PROFILE_FIELDS:
+                value = user.get(field)
+                if isinstance(value, str) and (_number(value) is not None or not value.strip()):
+                    converted[field] = _number(value)
+            if converted:
+                yield UpdateOne({'_id': user['_id']}, {'$set': converted})
+
+    _, updated = bulk.flush_in_batches(users, ops(), batch_size)
+    return updated
+
+
+if __name__ == '__main__':
+    count = backfill()
+    print(f"Backfilled eligibility index on {count} jobs")
+    count = backfill_students()
+    print(f"Converted numeric profile fields on {count} students")
@@ -0,0 +1,114 @@
+# exports.py
+#
+# Applicant exports for coordinators. Applications are joined to their users'
+# profile fields by one aggregation ($lookup on users) and rows are encoded as
+# the cursor yields them, so memory stays flat however many students applied.
+
+import io
+import csv
+from datetime import date, datetime
+import db
+from json_provider import encode
+
+BATCH_SIZE = 500  # cursor batch size, and rows per streamed chunk
+
+# (column, path in the aggregation output)
+COLUMNS = [
+    ('application_id', '_id'),
+    ('status', 'status'),
+    ('applied_at', 'created_at'),
+    ('notes', 'notes'),
+    ('first_name', 'user.name.first'),
+    ('last_name', 'user.name.last'),
+    ('email', 'user.email'),
+    ('phone', 'user.phone'),
+    ('degree', 'user.degree'),
+    ('branch', 'user.branch'),
+    ('ug_cgpa', 'user.ug_cgpa'),
+    ('ug_percentage', 'user.ug_percentage'),
+    ('standing_backlogs', 'user.standing_backlogs'),
+    ('skills', 'user.skills'),
+    ('resume_url', 'user.resume_url'),
+]
+
+FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+# Spreadsheet apps evaluate cells starting with these characters as formulas
+_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def pipeline(job_id):
+    return [
+        {'$match': {'job_id': job_id}},
+        # Walks the (job_id, created_at, _id) index instead of sorting every application in memory
+        {'$sort': {'created_at': 1, '_id': 1}},
+        {'$lookup': {'from': db.users.name, 'localField': 'user_id', 'foreignField': '_id', 'as': 'user'}},
+        {'$unwind': {'path': '$user', 'preserveNullAndEmptyArrays': True}},
+        {'$project': {path: 1 for _, path in COLUMNS}},
+    ]
+
+
+def applicants(job_id):
+    """Cursor over the joined application rows for a job."""
+    return db.for_listing(db.applications).aggregate(pipeline(job_id), batchSize=BATCH_SIZE, allowDiskUse=True)
+
+
+def _lookup(doc, path):
+    for key in path.split('.'):
+        if not isinstance(doc, dict):
+            return None
+        doc = doc.get(key)
+    return doc
+
+
+def row(doc):
+    """Flattens one aggregation result into {column: value}."""
+    return {column: _lookup(doc, path) for column, path in COLUMNS}
+
+
+def _csv_cell(value):
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        value = '; '.join(str(v) for v in value)
+    elif isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    elif not isinstance(value, str):
+        value = str(value)
+    if value.startswith(_FORMULA_PREFIXES):
+        value = "'" + value
+    return value
+
+
+def iter_csv(cursor):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column for column, _ in COLUMNS])
+    with cursor:
+        for n, doc in enumerate(cursor, 1):
+            writer.writerow([_csv_cell(value) for value in row(doc).values()])
+            if n % BATCH_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_ndjson(cursor):
+    with cursor:
+        chunk = []
+        for doc in cursor:
+            chunk.append(encode(row(doc)))
+            if len(chunk) == BATCH_SIZE:
+                yield b'\n'.join(chunk) + b'\n'
+                chunk = []
+        if chunk:
+            yield b'\n'.join(chunk) + b'\n'
+
+
+def stream(job_id, fmt):
+    cursor = applicants(job_id)
+    return iter_ndjson(cursor) if fmt == 'ndjson' else iter_csv(cursor)
@@ -0,0 +1,113 @@
+# fake_llm.py
+#
+# Offline stand-in for the Groq client, for local development, load tests and
+# benchmarks. It answers chat.completions.create() with canned content after
+# a configurable delay and reports token usage like the real API.
+#
+# Enable it with RESUME_AI_FAKE_LLM=true; FAKE_LLM_LATENCY sets the delay in
+# seconds (default 1.0). FakeAsyncGroq stands in for groq.AsyncGroq the same way.
+
+import os
+import json
+import time
+import asyncio
+from types import SimpleNamespace
+
+FAKE_ANALYSIS = {
+    "headline": "Full-stack student developer with internship experience",
+    "core_strengths": ["Python", "React", "MongoDB"],
+    "skill_gaps": {
+        "foundations": ["Data structures"],
+        "frameworks": ["Django"],
+        "tools": ["Docker"],
+        "data_ai": ["Pandas"],
+        "soft_skills": ["Technical writing"]
+    },
+    "priority_learning_path": [],
+    "project_ideas": [],
+    "role_fit": [{"role": "Backend Engineer", "fit_reason": "Strong API work", "confidence": 70}],
+    "next_30_days": []
+}
+
+FAKE_REPLY = "### Headline\n- Solid foundation; focus on system design next.\n"
+
+
+def _approx_tokens(text):
+    return max(1, len(text) // 4)
+
+
+def _reply(messages, response_format):
+    """(content, usage) for a request, with token counts estimated like the real API reports them."""
+    content = json.dumps(FAKE_ANALYSIS) if response_format else FAKE_REPLY
+    prompt_tokens = sum(_approx_tokens(m.get("content", "")) for m in messages)
+    completion_tokens = _approx_tokens(content)
+    usage = SimpleNamespace(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens
+    )
+    return content, usage
+
+
+def _chunks(content, usage):
+    words = content.split(" ")
+    for i, word in enumerate(words):
+        text = word if i == len(words) - 1 else word + " "
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+    # Like Groq, usage arrives on a final chunk under x_groq
+    yield SimpleNamespace(choices=[], x_groq=SimpleNamespace(usage=usage))
+
+
+def _completion(content, usage):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=usage)
+
+
+class _Completions:
+    def __init__(self, latency):
+        self.latency = latency
+
+    def _stream(self, content, usage):
+        # First token after a fraction of the latency, the rest spread over the remainder
+        chunks = list(_chunks(content, usage))
+        time.sleep(self.latency / 4)
+        for i, chunk in enumerate(chunks):
+            if i:
+                time.sleep(self.latency * 3 / 4 / len(chunks))
+            yield chunk
+
+    def create(self, model=None, messages=(), response_format=None, stream=False, **kwargs):
+        content, usage = _reply(messages, response_format)
+        if stream:
+            return self._stream(content, usage)
+        time.sleep(self.latency)
+        return _completion(content, usage)
+
+
+class _AsyncCompletions(_Completions):
+    async def _stream(self, content, usage):
+        chunks = list(_chunks(content, usage))
+        await asyncio.sleep(self.latency / 4)
+        for i, chunk in enumerate(chunks):
+            if i:
+                await asyncio.sleep(self.latency * 3 / 4 / len(chunks))
+            yield chunk
+
+    async def create(self, model=None, messages=(), response_format=None, stream=False, **kwargs):
+        content, usage = _reply(messages, response_format)
+        if stream:
+            return self._stream(content, usage)
+        await asyncio.sleep(self.latency)
+        return _completion(content, usage)
+
+
+class FakeGroq:
+    _completions = _Completions
+
+    def __init__(self, latency=None):
+        if latency is None:
+            latency = float(os.getenv("FAKE_LLM_LATENCY", "1.0"))
+        self.chat = SimpleNamespace(completions=self._completions(latency))
+
+
+class FakeAsyncGroq(FakeGroq):
+    _completions = _AsyncCompletions
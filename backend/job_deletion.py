@@ -0,0 +1,120 @@
+# job_deletion.py
+#
+# Job deletion in two phases. delete() marks the job with deleted_at, which
+# every job query excludes (NOT_DELETED), so the posting disappears at once.
+# A background thread then removes the job's applications in batches of
+# JOB_PURGE_BATCH, recording progress in the job_purges collection, and
+# finally removes the job document itself.
+#
+# On a replica set or sharded cluster each step runs in a transaction, so a
+# batch and its progress update land together. On a standalone server the
+# steps run one after another; they are idempotent, so a purge interrupted
+# by a crash is simply rerun with `python job_deletion.py`.
+
+import os
+from datetime import datetime, timezone
+import db
+import workers
+
+BATCH_SIZE = int(os.getenv('JOB_PURGE_BATCH', '1000'))
+
+# Filter for jobs that have not been deleted (deleted_at missing or null)
+NOT_DELETED = {'deleted_at': None}
+
+# One purge at a time per web worker
+_executor = workers.per_process_executor('thread', 1, 'job-purge')
+_transactions = None
+
+
+def supports_transactions():
+    """True when the server is a replica set member or mongos, where multi-document transactions work."""
+    global _transactions
+    if _transactions is None:
+        try:
+            hello = db.client.admin.command('hello')
+            _transactions = 'setName' in hello or hello.get('msg') == 'isdbgrid'
+        except Exception:
+            _transactions = False
+    return _transactions
+
+
+def _atomically(fn):
+    """Runs fn(session) inside a transaction when available, otherwise fn(None)."""
+    if not supports_transactions():
+        return fn(None)
+    with db.client.start_session() as session:
+        return session.with_transaction(fn)
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def delete(job_id):
+    """Hides the job immediately and queues the purge of its applications."""
+    now = _now()
+    total = db.applications.count_documents({'job_id': job_id})
+
+    def mark(session):
+        db.jobs.update_one({'_id': job_id}, {'$set': {'deleted_at': now}}, session=session)
+        db.job_purges.replace_one({'_id': job_id}, {
+            'status': 'queued', 'total': total, 'deleted': 0,
+            'created_at': now, 'updated_at': now,
+        }, upsert=True, session=session)
+
+    _atomically(mark)
+    _executor.submit(purge, job_id)
+
+
+def purge(job_id):
+    """Deletes a soft-deleted job's applications batch by batch, then the job itself."""
+    try:
+        db.job_purges.update_one({'_id': job_id}, {'$set': {'status': 'running', 'updated_at': _now()}})
+        while True:
+            ids = [doc['_id'] for doc in db.applications.find({'job_id': job_id}, {'_id': 1}).limit(BATCH_SIZE)]
+            if not ids:
+                break
+
+            def delete_batch(session):
+                result = db.applications.delete_many({'_id': {'$in': ids}}, session=session)
+                db.job_purges.update_one({'_id': job_id}, {
+                    '$inc': {'deleted': result.deleted_count},
+                    '$set': {'updated_at': _now()},
+                }, session=session)
+
+            _atomically(delete_batch)
+
+        def finish(session):
+            # Sweeps up anything inserted while the last batch ran, then drops the job
+            result = db.applications.delete_many({'job_id': job_id}, session=session)
+            db.jobs.delete_one({'_id': job_id, 'deleted_at': {'$ne': None}}, session=session)
+            now = _now()
+            db.job_purges.update_one({'_id': job_id}, {
+                '$inc': {'deleted': result.deleted_count},
+                '$set': {'status': 'done', 'updated_at': now, 'finished_at': now},
+            }, session=session)
+
+        _atomically(finish)
+    except Exception as e:
+        db.job_purges.update_one({'_id': job_id}, {'$set': {'status': 'failed', 'error': str(e), 'updated_at': _now()}})
+
+
+def progress(job_id):
+    return db.job_purges.find_one({'_id': job_id})
+
+
+def resume():
+    """Reruns the purge for every job left soft-deleted, e.g. after a crash mid-purge."""
+    stranded = [job['_id'] for job in db.jobs.find({'deleted_at': {'$ne': None}}, {'_id': 1})]
+    for job_id in stranded:
+        total = db.applications.count_documents({'job_id': job_id})
+        db.job_purges.update_one({'_id': job_id}, {
+            '$set': {'status': 'queued', 'total': total, 'deleted': 0, 'updated_at': _now()},
+            '$setOnInsert': {'created_at': _now()},
+        }, upsert=True)
+        purge(job_id)
+    return len(stranded)
+
+
+if __name__ == '__main__':
+    print(f"Purged {resume()} deleted jobs.")
@@ -0,0 +1,88 @@
+# json_provider.py
+#
+# Flask JSON provider that encodes Mongo documents directly: ObjectId becomes
+# its hex string and datetimes become ISO 8601, so routes can hand documents
+# from pymongo straight to jsonify() without converting fields by hand.
+#
+# orjson is used when installed; otherwise the stdlib encoder is the fallback.
+# Large top-level lists are streamed in chunks instead of being built into
+# one big string first: orjson encodes STREAM_CHUNK items at a time, the
+# stdlib encoder makes one pass over the list and its output is sent in
+# STREAM_BYTES pieces.
+
+import json
+from datetime import date, datetime
+from bson import ObjectId
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional, the stdlib encoder is used instead
+    orjson = None
+
+STREAM_THRESHOLD = 1000  # lists at least this long are streamed
+STREAM_CHUNK = 500       # items encoded per streamed chunk (orjson)
+STREAM_BYTES = 64 * 1024  # approximate size of a streamed chunk (stdlib)
+
+
+def _default(o):
+    if isinstance(o, ObjectId):
+        return str(o)
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+# Documents from pymongo cannot be circular, so the encoder skips that check
+_encoder = json.JSONEncoder(default=_default, ensure_ascii=False, separators=(',', ':'), check_circular=False)
+
+
+def encode(obj):
+    """Serialises obj to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return _encoder.encode(obj).encode('utf-8')
+
+
+class MongoJSONProvider(JSONProvider):
+    mimetype = 'application/json'
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            kwargs.setdefault('default', _default)
+            return json.dumps(obj, **kwargs)
+        return encode(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def _iter_list(self, items):
+        if orjson is None:
+            yield from self._iter_stdlib(items)
+            return
+        yield b'['
+        for start in range(0, len(items), STREAM_CHUNK):
+            chunk = b','.join(encode(item) for item in items[start:start + STREAM_CHUNK])
+            yield chunk if start == 0 else b',' + chunk
+        yield b']'
+
+    def _iter_stdlib(self, items):
+        # _one_shot selects the C encoder, as JSONEncoder.encode does; without
+        # it iterencode falls back to the much slower pure-Python encoder
+        parts, size = [], 0
+        for part in _encoder.iterencode(items, _one_shot=True):
+            parts.append(part)
+            size += len(part)
+            if size >= STREAM_BYTES:
+                yield ''.join(parts).encode('utf-8')
+                parts, size = [], 0
+        if parts:
+            yield ''.join(parts).encode('utf-8')
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if isinstance(obj, list) and len(obj) >= STREAM_THRESHOLD:
+            return self._app.response_class(self._iter_list(obj), mimetype=self.mimetype)
+        return self._app.response_class(encode(obj), mimetype=self.mimetype)
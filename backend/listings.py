@@ -0,0 +1,173 @@
+# listings.py
+#
+# Query plans and response shaping for the read-heavy list endpoints. These
+# functions only build queries and reshape results; running the queries is
+# left to the caller, so the Flask routes in app.py (pymongo) and the async
+# routes in asgi.py (pymongo's asyncio client) share the same logic.
+
+from datetime import datetime, timezone
+import search
+import eligibility
+import pagination
+from job_deletion import NOT_DELETED
+
+APPLICATION_STATUSES = ['Applied', 'Shortlisted', 'Rejected', 'Offer']
+
+# Applicant listing: profile fields joined from users, and the accepted ?sort= orders
+APPLICANT_PROFILE_FIELDS = [
+    'name', 'email', 'phone', 'degree', 'branch', 'ug_cgpa', 'ug_percentage',
+    'standing_backlogs', 'skills', 'resume_url'
+]
+APPLICANT_SORTS = {
+    'created_at': [('created_at', 1), ('_id', 1)],
+    '-created_at': [('created_at', -1), ('_id', -1)],
+    'cgpa': [('profile.ug_cgpa', 1), ('_id', 1)],
+    '-cgpa': [('profile.ug_cgpa', -1), ('_id', 1)],
+}
+APPLICANT_PAGE_ARGS = {'page', 'limit', 'status', 'sort'}
+
+# Keyset order for paginated job listings, and heavy fields left out of ?fields=summary
+JOB_PAGE_SORT = ['deadline', '_id']
+JOB_SUMMARY_EXCLUDED_FIELDS = {'description': 0, 'eligibility': 0}
+
+# Derived fields stored on job documents that clients never see
+JOB_HIDDEN_FIELDS = {**search.HIDDEN_FIELDS, **eligibility.HIDDEN_FIELDS}
+
+# Job fields shown next to a student's applications
+APPLICATION_JOB_FIELDS = {'title': 1, 'company': 1, 'deadline': 1}
+
+
+def personalised(args):
+    """?eligible=true asks GET /jobs for the logged-in student's eligible jobs; those listings are not cached."""
+    return args.get('eligible', 'false').lower() == 'true'
+
+
+def jobs_plan(args, student=None):
+    """
+    Plans GET /jobs from its query string: (query, projection, sort, limit, search_tokens).
+    limit is None for the unpaginated listing; paginated callers fetch limit + 1 rows.
+    With a student, only jobs they qualify for match. Raises ValueError for a bad limit or cursor.
+    """
+    query = dict(NOT_DELETED)
+
+    # Prefix search over the indexed search_terms array (title, company, tech_stack)
+    search_tokens = search.tokenize(args.get('q', ''))
+    if search_tokens:
+        query.update(search.build_query(search_tokens))
+
+    if args.get('before_deadline', 'true').lower() == 'true':
+        query['deadline'] = {'$gte': datetime.now(timezone.utc)}
+
+    # Matched against the precomputed eligibility index
+    if student is not None:
+        query.update(eligibility.jobs_query(student))
+
+    projection = dict(JOB_HIDDEN_FIELDS)
+    if args.get('fields') == 'summary':
+        projection.update(JOB_SUMMARY_EXCLUDED_FIELDS)
+
+    # Passing ?limit= or ?cursor= switches to keyset pagination on (deadline, _id).
+    # Pages keep deadline order, so search results are only relevance-ranked unpaginated.
+    if 'limit' not in args and 'cursor' not in args:
+        return query, projection, [('deadline', 1)], None, search_tokens
+
+    limit = pagination.page_size(args.get('limit'))
+    cursor = args.get('cursor')
+    if cursor:
+        after = pagination.decode_cursor(cursor, JOB_PAGE_SORT)
+        query = {'$and': [query, pagination.after_filter(JOB_PAGE_SORT, after)]}
+    return query, projection, [(field, 1) for field in JOB_PAGE_SORT], limit, search_tokens
+
+
+def jobs_body(jobs, limit, search_tokens):
+    """Response body for GET /jobs from the rows fetched with jobs_plan's query."""
+    if limit is None:
+        return search.rank(jobs, search_tokens) if search_tokens else jobs
+    # The extra row only tells us that another page exists
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        next_cursor = pagination.encode_cursor(jobs[-1], JOB_PAGE_SORT)
+    return {'jobs': jobs, 'next_cursor': next_cursor}
+
+
+def attach_jobs(applications, jobs):
+    """Sets app['job'] on each application, dropping those whose job is gone or being deleted."""
+    jobs_by_id = {job['_id']: job for job in jobs}
+    applications = [app_doc for app_doc in applications if app_doc['job_id'] in jobs_by_id]
+    for app_doc in applications:
+        app_doc['job'] = jobs_by_id[app_doc['job_id']]
+    return applications
+
+
+def status_counts_pipeline(job_ids):
+    """Counts applications per job and status in one grouped aggregation."""
+    return [
+        {'$match': {'job_id': {'$in': job_ids}}},
+        {'$group': {'_id': {'job_id': '$job_id', 'status': '$status'}, 'count': {'$sum': 1}}}
+    ]
+
+
+def attach_status_counts(jobs, rows):
+    """Adds application_count and the per-status breakdown from status_counts_pipeline's rows."""
+    status_counts_by_job = {}
+    for row in rows:
+        status_counts = status_counts_by_job.setdefault(row['_id']['job_id'], {})
+        status_counts[row['_id']['status']] = row['count']
+
+    for job in jobs:
+        status_counts = status_counts_by_job.get(job['_id'], {})
+        job['application_count'] = sum(status_counts.values())
+        job['status_counts'] = {status: status_counts.get(status, 0) for status in APPLICATION_STATUSES}
+    return jobs
+
+
+def applicants_paginated(args):
+    """Any of ?page=, ?limit=, ?status= or ?sort= switches to the paginated applicant listing."""
+    return bool(APPLICANT_PAGE_ARGS & set(args))
+
+
+def applicants_plan(job_oid, args, users_collection):
+    """
+    Plans a page of GET /jobs/<job_id>/applications: (pipeline, page, limit).
+    Raises ValueError for a bad page, limit or sort.
+    """
+    sort = args.get('sort', 'created_at')
+    limit = pagination.page_size(args.get('limit'))
+    page = int(args.get('page', 1))
+    if page < 1 or sort not in APPLICANT_SORTS:
+        raise ValueError(sort)
+
+    match = {'job_id': job_oid}
+    if args.get('status'):
+        match['status'] = {'$in': args['status'].split(',')}
+
+    join_profile = [
+        {'$lookup': {'from': users_collection, 'localField': 'user_id', 'foreignField': '_id', 'as': 'user'}},
+        {'$unwind': {'path': '$user', 'preserveNullAndEmptyArrays': True}},
+        {'$addFields': {'profile': {field: f'$user.{field}' for field in APPLICANT_PROFILE_FIELDS}}},
+        {'$project': {'user': 0}},
+    ]
+    page_stages = [{'$skip': (page - 1) * limit}, {'$limit': limit}]
+
+    # Offset pages rather than a cursor, so the table can show a total and jump between pages.
+    # created_at orders come from the (job_id, status, created_at) / (job_id, created_at, _id) indexes
+    # and only the page is joined; profile orders have to join every match before sorting.
+    # $facet returns the page and the total count from the same pass.
+    if sort.lstrip('-') == 'created_at':
+        pipeline = [{'$match': match}, {'$sort': dict(APPLICANT_SORTS[sort])},
+                    {'$facet': {'total': [{'$count': 'n'}], 'applications': page_stages + join_profile}}]
+    else:
+        pipeline = [{'$match': match}, *join_profile, {'$sort': dict(APPLICANT_SORTS[sort])},
+                    {'$facet': {'total': [{'$count': 'n'}], 'applications': page_stages}}]
+    return pipeline, page, limit
+
+
+def applicants_body(result, page, limit):
+    """Response body for a page of applicants from the $facet result of applicants_plan's pipeline."""
+    return {
+        'applications': result['applications'],
+        'total': result['total'][0]['n'] if result['total'] else 0,
+        'page': page,
+        'limit': limit
+    }
@@ -0,0 +1,88 @@
+# logs.py
+#
+# Structured logging for the backend. Loggers from get_logger() take a message
+# plus keyword fields and emit one JSON object per line on stderr, e.g.
+#
+#   logger.info('applications fetched', user_id=uid, count=12)
+#
+# Records below LOG_LEVEL (default INFO) are discarded before any formatting.
+# Hot paths pass sample=<rate> to keep only that fraction of their DEBUG/INFO
+# records; warnings and errors are never sampled. Request threads only put
+# records on a queue, and a background listener does the formatting and the
+# write, so logging never blocks a request on stderr.
+
+import os
+import sys
+import atexit
+import queue
+import random
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+from json_provider import encode
+
+LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', '0.01'))
+
+ROOT = 'placement_portal'
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', {}))
+        return encode(entry).decode('utf-8')
+
+
+def configure():
+    """Attaches the queue-backed JSON handler to the backend's root logger. Safe to call more than once."""
+    global _listener
+    if _listener is not None:
+        return
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JsonFormatter())
+    records = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger(ROOT)
+    root.setLevel(LEVEL)
+    root.addHandler(logging.handlers.QueueHandler(records))
+    root.propagate = False
+
+
+class StructuredLogger:
+    def __init__(self, logger):
+        self._logger = logger
+
+    def _log(self, level, msg, sample, fields):
+        if not self._logger.isEnabledFor(level):
+            return
+        if sample is not None and level < logging.WARNING and random.random() >= sample:
+            return
+        exc_info = fields.pop('exc_info', None)
+        self._logger.log(level, msg, extra={'fields': fields}, exc_info=exc_info)
+
+    def debug(self, msg, sample=None, **fields):
+        self._log(logging.DEBUG, msg, sample, fields)
+
+    def info(self, msg, sample=None, **fields):
+        self._log(logging.INFO, msg, sample, fields)
+
+    def warning(self, msg, **fields):
+        self._log(logging.WARNING, msg, None, fields)
+
+    def error(self, msg, **fields):
+        self._log(logging.ERROR, msg, None, fields)
+
+
+def get_logger(name):
+    configure()
+    return StructuredLogger(logging.getLogger(f'{ROOT}.{name}'))
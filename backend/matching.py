@@ -0,0 +1,209 @@
+# matching.py
+#
+# Precomputed student-job match scores behind GET /me/recommended-jobs and
+# GET /jobs/<job_id>/top-candidates. A pair is stored in `job_matches` when
+# the student meets the job's eligibility rules and covers at least
+# MATCH_MIN_SCORE of its tech_stack with their skills and experience
+# technologies. Each match carries the job and student fields both lists
+# show, so either list is one read on a (student_id, score) or
+# (job_id, score) index.
+#
+# Scores are recomputed per student when a profile or experience changes and
+# per job when a job is created, edited or deleted, on a background thread
+# (MATCH_WORKERS, default 1; 0 recomputes on the request thread). Recomputed
+# matches are upserted with a fresh computed_at, and the owner's older
+# matches, i.e. pairs that no longer qualify, are then deleted.
+#
+# `python matching.py` rebuilds every score, e.g. after a bulk import. It
+# inverts the job skills into a skill -> jobs index, so the work grows with
+# the number of overlapping pairs rather than students x jobs.
+
+import os
+from collections import defaultdict
+from datetime import datetime, timezone
+from pymongo import ReplaceOne
+import db
+import bulk
+import search
+import eligibility
+import logs
+import workers
+from job_deletion import NOT_DELETED
+
+MIN_SCORE = float(os.getenv('MATCH_MIN_SCORE', '0.5'))
+WORKERS = int(os.getenv('MATCH_WORKERS', '1'))
+BATCH_SIZE = 1000
+
+# score = 100 * (SKILL_WEIGHT * share of the job's stack covered + CGPA_WEIGHT * CGPA / 10)
+SKILL_WEIGHT = 0.8
+CGPA_WEIGHT = 0.2
+
+# Fields that change a student's matches, and the ones copied onto each match
+PROFILE_FIELDS = {'name', 'branch', 'ug_cgpa', 'ug_percentage', 'standing_backlogs', 'skills'}
+STUDENT_SUMMARY_FIELDS = ['name', 'email', 'branch', 'ug_cgpa']
+STUDENT_FIELDS = {
+    'role': 1, 'name': 1, 'email': 1, 'branch': 1, 'ug_cgpa': 1, 'ug_percentage': 1,
+    'standing_backlogs': 1, 'skills': 1, 'experience.technologies': 1
+}
+
+# The same for jobs
+JOB_SUMMARY_FIELDS = ['title', 'company', 'type', 'location', 'deadline']
+JOB_FIELDS = {'tech_stack', 'eligibility', *JOB_SUMMARY_FIELDS}
+JOB_PROJECTION = {'tech_stack': 1, 'eligibility': 1, eligibility.INDEX_FIELD: 1,
+                  **{field: 1 for field in JOB_SUMMARY_FIELDS}}
+
+_executor = workers.per_process_executor('thread', WORKERS, 'match-scores')
+
+logger = logs.get_logger('matching')
+
+
+def _normalise(skill):
+    """'React.js ' and 'react.js' are the same skill; multi-word skills stay one term."""
+    return ' '.join(search.tokenize(skill)) if isinstance(skill, str) else ''
+
+
+def student_skills(student):
+    skills = list(student.get('skills') or [])
+    for experience in student.get('experience') or []:
+        skills.extend(experience.get('technologies') or [])
+    return {s for s in map(_normalise, skills) if s}
+
+
+def job_skills(job):
+    return {s for s in map(_normalise, job.get('tech_stack') or []) if s}
+
+
+def _cgpa(student):
+    try:
+        return min(float(student.get('ug_cgpa') or 0), 10)
+    except (TypeError, ValueError):
+        return 0
+
+
+def score(coverage, student):
+    cgpa = _cgpa(student)
+    return round(100 * (SKILL_WEIGHT * coverage + CGPA_WEIGHT * cgpa / 10), 2)
+
+
+def _match(student, skills, job, wanted, computed_at):
+    """The match document for a pair, or None when it does not qualify."""
+    matched = skills & wanted
+    coverage = len(matched) / len(wanted) if wanted else 0
+    if coverage < MIN_SCORE or not coverage:
+        return None
+    index = job.get(eligibility.INDEX_FIELD) or eligibility.build_index(job.get('eligibility'))
+    if not eligibility.qualifies(student, index):
+        return None
+    return {
+        'student_id': student['_id'],
+        'job_id': job['_id'],
+        'score': score(coverage, student),
+        'matched_skills': sorted(matched),
+        'job': {field: job.get(field) for field in JOB_SUMMARY_FIELDS},
+        'student': {field: student.get(field) for field in STUDENT_SUMMARY_FIELDS},
+        'computed_at': computed_at,
+    }
+
+
+def _save(matches):
+    ops = (ReplaceOne({'student_id': m['student_id'], 'job_id': m['job_id']}, m, upsert=True) for m in matches)
+    saved, _ = bulk.flush_in_batches(db.job_matches, ops, BATCH_SIZE)
+    return saved
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def recompute_student(student_id):
+    """Rescores one student against every open job. Returns the number of matches stored."""
+    computed_at = _now()
+    student = db.users.find_one({'_id': student_id}, STUDENT_FIELDS)
+    saved = 0
+    if student and student.get('role') == 'student':
+        skills = student_skills(student)
+        if skills:
+            jobs = db.jobs.find({**NOT_DELETED, 'tech_stack': {'$ne': []}}, JOB_PROJECTION)
+            saved = _save(m for m in (_match(student, skills, job, job_skills(job), computed_at) for job in jobs) if m)
+    db.job_matches.delete_many({'student_id': student_id, 'computed_at': {'$lt': computed_at}})
+    return saved
+
+
+def recompute_job(job_id):
+    """Rescores every eligible student for one job; a deleted job loses its matches. Returns the number stored."""
+    computed_at = _now()
+    job = db.jobs.find_one({'_id': job_id, **NOT_DELETED}, JOB_PROJECTION)
+    saved = 0
+    wanted = job_skills(job) if job else None
+    if wanted:
+        students = db.users.find(eligibility.students_query(job), STUDENT_FIELDS)
+        saved = _save(m for m in (_match(s, student_skills(s), job, wanted, computed_at) for s in students) if m)
+    db.job_matches.delete_many({'job_id': job_id, 'computed_at': {'$lt': computed_at}})
+    return saved
+
+
+def rebuild():
+    """Recomputes every match from scratch. Returns the number stored."""
+    computed_at = _now()
+    jobs = list(db.jobs.find({**NOT_DELETED, 'tech_stack': {'$ne': []}}, JOB_PROJECTION))
+    wanted = [job_skills(job) for job in jobs]
+    jobs_by_skill = defaultdict(list)
+    for i, skills in enumerate(wanted):
+        for skill in skills:
+            jobs_by_skill[skill].append(i)
+
+    def matches():
+        for student in db.users.find({'role': 'student'}, STUDENT_FIELDS):
+            skills = student_skills(student)
+            # Only jobs sharing a skill with the student can score
+            candidates = set()
+            for skill in skills:
+                candidates.update(jobs_by_skill.get(skill, ()))
+            for i in candidates:
+                match = _match(student, skills, jobs[i], wanted[i], computed_at)
+                if match:
+                    yield match
+
+    saved = _save(matches())
+    db.job_matches.delete_many({'computed_at': {'$lt': computed_at}})
+    return saved
+
+
+def _run(fn, owner_id):
+    try:
+        fn(owner_id)
+    except Exception as e:
+        # A failed recompute leaves the previous scores; the next change or a rebuild fixes them
+        logger.error('match recompute failed', task=fn.__name__, id=str(owner_id), error=str(e))
+
+
+def _schedule(fn, owner_id):
+    if WORKERS <= 0:
+        _run(fn, owner_id)
+    else:
+        _executor.submit(_run, fn, owner_id)
+
+
+def schedule_student(student_id):
+    _schedule(recompute_student, student_id)
+
+
+def schedule_job(job_id):
+    _schedule(recompute_job, job_id)
+
+
+def recommended_jobs(student_id, limit):
+    """The student's best-scoring matches among jobs still open for applications."""
+    return list(db.job_matches.find(
+        {'student_id': student_id, 'job.deadline': {'$gte': _now()}},
+        {'student': 0, 'computed_at': 0}
+    ).sort('score', -1).limit(limit))
+
+
+def top_candidates(job_id, limit):
+    """The job's best-scoring eligible students."""
+    return list(db.job_matches.find({'job_id': job_id}, {'job': 0, 'computed_at': 0}).sort('score', -1).limit(limit))
+
+
+if __name__ == '__main__':
+    print(f"Stored {rebuild()} job matches")
@@ -0,0 +1,176 @@
+# metrics.py
+#
+# In-process metrics in the Prometheus text format, served at GET /metrics:
+#
+#   http_requests_total / http_request_duration_seconds     per route (Flask middleware)
+#   mongo_commands_total / mongo_command_duration_seconds   per command (pymongo CommandListener)
+#   llm_requests_total / llm_request_duration_seconds /
+#   llm_tokens_total                                        per resume_ai operation
+#
+# Like the caches, metrics are per process: with several web workers each
+# scrape sees the worker that answered it.
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+from flask import g, request
+from pymongo import monitoring
+import logs
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+LLM_BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 16, 32, 64)
+
+SLOW_REQUEST_SECONDS = float(os.getenv('SLOW_REQUEST_SECONDS', '1.0'))
+
+logger = logs.get_logger('http')
+_registry = []
+
+
+def _label_text(names, values):
+    if not names:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for v in values)
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(names, escaped)) + '}'
+
+
+class Counter:
+    kind = 'counter'
+
+    def __init__(self, name, help_text, labels=()):
+        self.name, self.help, self.labels = name, help_text, tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels[name] for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield f'{self.name}{_label_text(self.labels, key)} {value}'
+
+
+class Histogram:
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name, self.help, self.labels = name, help_text, tuple(labels)
+        self.buckets = tuple(buckets)
+        self._values = {}  # label values -> [per-bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def observe(self, value, **labels):
+        key = tuple(labels[name] for name in self.labels)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            else:
+                series[len(self.buckets)] += 1
+            series[-1] += value
+
+    def samples(self):
+        with self._lock:
+            values = {key: list(series) for key, series in self._values.items()}
+        bounds = [str(b) for b in self.buckets] + ['+Inf']
+        for key, series in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                yield f'{self.name}_bucket{_label_text(self.labels + ("le",), key + (bound,))} {cumulative}'
+            yield f'{self.name}_sum{_label_text(self.labels, key)} {series[-1]:.6f}'
+            yield f'{self.name}_count{_label_text(self.labels, key)} {cumulative}'
+
+
+HTTP_REQUESTS = Counter('http_requests_total', 'HTTP requests by route and status.', ['method', 'route', 'status'])
+HTTP_DURATION = Histogram('http_request_duration_seconds', 'Time to produce a response, by route.', ['method', 'route'])
+MONGO_COMMANDS = Counter('mongo_commands_total', 'MongoDB commands by name and outcome.', ['command', 'outcome'])
+MONGO_DURATION = Histogram('mongo_command_duration_seconds', 'MongoDB command round-trip time.', ['command'])
+LLM_REQUESTS = Counter('llm_requests_total', 'LLM calls by operation and outcome.', ['operation', 'outcome'])
+LLM_DURATION = Histogram('llm_request_duration_seconds', 'LLM call time, to the last token when streaming.',
+                         ['operation'], buckets=LLM_BUCKETS)
+LLM_TOKENS = Counter('llm_tokens_total', 'Tokens reported by the LLM API.', ['operation', 'kind'])
+
+
+def render():
+    lines = []
+    for metric in _registry:
+        lines.append(f'# HELP {metric.name} {metric.help}')
+        lines.append(f'# TYPE {metric.name} {metric.kind}')
+        lines.extend(metric.samples())
+    return '\n'.join(lines) + '\n'
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Counts and times every command sent by the client it is registered on."""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        MONGO_COMMANDS.inc(command=event.command_name, outcome='ok')
+        MONGO_DURATION.observe(event.duration_micros / 1e6, command=event.command_name)
+
+    def failed(self, event):
+        MONGO_COMMANDS.inc(command=event.command_name, outcome='error')
+        MONGO_DURATION.observe(event.duration_micros / 1e6, command=event.command_name)
+
+
+@contextmanager
+def llm_call(operation):
+    """
+    Times an LLM call and counts its outcome. Set call['usage'] to the API's
+    usage object inside the block to record token counts.
+    """
+    call = {'usage': None}
+    start = time.perf_counter()
+    outcome = 'error'
+    try:
+        yield call
+        outcome = 'ok'
+    finally:
+        LLM_DURATION.observe(time.perf_counter() - start, operation=operation)
+        LLM_REQUESTS.inc(operation=operation, outcome=outcome)
+        usage = call['usage']
+        if usage is not None:
+            LLM_TOKENS.inc(getattr(usage, 'prompt_tokens', 0) or 0, operation=operation, kind='prompt')
+            LLM_TOKENS.inc(getattr(usage, 'completion_tokens', 0) or 0, operation=operation, kind='completion')
+
+
+def record_request(method, route, status, elapsed):
+    """Counts and times one HTTP response; slow ones are always logged, the rest sampled."""
+    HTTP_REQUESTS.inc(method=method, route=route, status=status)
+    HTTP_DURATION.observe(elapsed, method=method, route=route)
+
+    fields = {'method': method, 'route': route, 'status': status, 'duration_ms': round(elapsed * 1000, 2)}
+    if elapsed >= SLOW_REQUEST_SECONDS:
+        logger.warning('slow request', **fields)
+    else:
+        logger.info('request', sample=logs.SAMPLE_RATE, **fields)
+
+
+def init_app(app):
+    """Records latency and status for every request, labelled by route pattern rather than raw path."""
+
+    @app.before_request
+    def _start_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def _record_request(response):
+        started = g.pop('request_started', None)
+        if started is None:
+            return response
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        record_request(request.method, route, response.status_code, time.perf_counter() - started)
+        return response
@@ -0,0 +1,124 @@
+# migrations.py
+#
+# Versioned schema steps (index builds, index drops) that used to run on every
+# import of db.py. Each step runs once per database and is recorded in the
+# `migrations` collection; steps are idempotent, so two processes racing
+# through the same step is harmless. Run it when deploying:
+#
+#   python migrations.py
+#
+# seed.py and the development server (python app.py) run it as well.
+#
+# TTL lengths come from the environment, so every run also creates or
+# retunes (collMod) the TTL indexes to match RESUME_CACHE_TTL and
+# RESUME_SESSION_TTL, without dropping and rebuilding them.
+
+from datetime import datetime, timezone
+import db
+import eligibility
+import resume_cache
+import resume_sessions
+
+PURGE_RECORD_TTL = 24 * 3600  # finished job purges are kept for a day
+RESUME_JOB_TTL = 24 * 3600    # background analyses are kept for a day so clients can poll for them
+
+
+def _core_indexes(database):
+    database.users.create_index([("email", 1)], unique=True)
+    database.users.create_index([("role", 1), ("branch", 1), ("ug_cgpa", 1)])
+    database.applications.create_index([("user_id", 1), ("job_id", 1)], unique=True)
+    database.applications.create_index([("job_id", 1), ("status", 1), ("created_at", 1)])
+    database.applications.create_index([("job_id", 1), ("created_at", 1)])
+    database.jobs.create_index([("deadline", 1)])
+    database.jobs.create_index([("deadline", 1), ("_id", 1)])
+    database.jobs.create_index([("search_terms", 1)])
+    database.jobs.create_index([
+        ("eligibility_index.branches", 1), ("deadline", 1),
+        ("eligibility_index.min_cgpa", 1), ("eligibility_index.min_percentage", 1)
+    ])
+
+
+def _drop_job_status_index(database):
+    # (job_id, status, created_at) serves every query the old two-field index did
+    if 'job_id_1_status_1' in database.applications.index_information():
+        database.applications.drop_index('job_id_1_status_1')
+
+
+def _job_match_indexes(database):
+    # One match per pair, and the two ranked lists (see matching.py)
+    database.job_matches.create_index([("student_id", 1), ("job_id", 1)], unique=True)
+    database.job_matches.create_index([("student_id", 1), ("score", -1)])
+    database.job_matches.create_index([("job_id", 1), ("score", -1)])
+
+
+def _numeric_profile_fields(database):
+    # Eligibility range queries on users never match numbers stored as strings
+    eligibility.backfill_students(database.users)
+
+
+def _applications_created_id_index(database):
+    # Adding _id lets (created_at, _id) orders (applicant pages, exports) walk the index without a sort
+    database.applications.create_index([("job_id", 1), ("created_at", 1), ("_id", 1)])
+    if 'job_id_1_created_at_1' in database.applications.index_information():
+        database.applications.drop_index('job_id_1_created_at_1')
+
+
+# (version, description, step); append new steps, never renumber
+MIGRATIONS = [
+    (1, 'core indexes', _core_indexes),
+    (2, 'drop applications (job_id, status), superseded by (job_id, status, created_at)', _drop_job_status_index),
+    (3, 'job_matches indexes', _job_match_indexes),
+    (4, 'convert numeric profile fields stored as strings', _numeric_profile_fields),
+    (5, 'applications (job_id, created_at, _id), superseding (job_id, created_at)', _applications_created_id_index),
+]
+
+
+def _ttl_indexes():
+    # (collection, field, seconds)
+    return [
+        ('resume_cache', 'created_at', resume_cache.TTL),
+        ('resume_jobs', 'created_at', RESUME_JOB_TTL),
+        ('resume_sessions', 'updated_at', resume_sessions.TTL),
+        ('job_purges', 'finished_at', PURGE_RECORD_TTL),
+    ]
+
+
+def sync_ttl_indexes(database):
+    """Creates missing TTL indexes and updates expireAfterSeconds on existing ones. Returns the indexes changed."""
+    changed = []
+    for name, field, seconds in _ttl_indexes():
+        index_name = f'{field}_1'
+        current = database[name].index_information().get(index_name)
+        if current is None:
+            database[name].create_index([(field, 1)], expireAfterSeconds=seconds)
+        elif current.get('expireAfterSeconds') != seconds:
+            database.command('collMod', name, index={'keyPattern': {field: 1}, 'expireAfterSeconds': seconds})
+        else:
+            continue
+        changed.append(f'{name}.{index_name}')
+    return changed
+
+
+def pending(database=None):
+    database = database if database is not None else db.get_database()
+    applied = {doc['_id'] for doc in database.migrations.find({}, {'_id': 1})}
+    return [m for m in MIGRATIONS if m[0] not in applied]
+
+
+def run(database=None):
+    """Applies pending migrations in version order and syncs TTL indexes. Returns the versions applied."""
+    database = database if database is not None else db.get_database()
+    applied = []
+    for version, description, step in pending(database):
+        step(database)
+        database.migrations.update_one({'_id': version}, {'$set': {
+            'description': description, 'applied_at': datetime.now(timezone.utc)
+        }}, upsert=True)
+        applied.append(version)
+    sync_ttl_indexes(database)
+    return applied
+
+
+if __name__ == '__main__':
+    versions = run()
+    print(f"Applied migrations {versions}" if versions else "Database is up to date")
@@ -0,0 +1,72 @@
+# pagination.py
+#
+# Keyset (cursor) pagination helpers. A cursor is the sort key of the last row
+# on a page, base64-encoded so clients treat it as opaque. The next page is
+# everything strictly after that key, so each page is an index range scan no
+# matter how deep the client has scrolled.
+
+import base64
+import json
+from datetime import datetime
+from bson import ObjectId
+from bson.errors import InvalidId
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _encode_value(value):
+    if isinstance(value, ObjectId):
+        return {'$oid': str(value)}
+    if isinstance(value, datetime):
+        return {'$date': value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if '$oid' in value:
+            return ObjectId(value['$oid'])
+        if '$date' in value:
+            return datetime.fromisoformat(value['$date'])
+    return value
+
+
+def encode_cursor(doc, fields):
+    """Builds the cursor pointing just past `doc` for a sort on `fields`."""
+    values = [_encode_value(doc[field]) for field in fields]
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor, fields):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise InvalidCursor(cursor)
+        return [_decode_value(value) for value in values]
+    except (ValueError, TypeError, InvalidId) as e:
+        raise InvalidCursor(cursor) from e
+
+
+def after_filter(fields, values):
+    """Mongo filter for rows sorting strictly after `values` (all fields ascending)."""
+    clauses = []
+    for i, field in enumerate(fields):
+        clause = {fields[j]: values[j] for j in range(i)}
+        clause[field] = {'$gt': values[i]}
+        clauses.append(clause)
+    return {'$or': clauses}
+
+
+def page_size(raw, default=DEFAULT_PAGE_SIZE):
+    """Parses a ?limit= value, clamped to MAX_PAGE_SIZE. Raises ValueError if it is not a positive int."""
+    if raw is None or raw == '':
+        return default
+    size = int(raw)
+    if size < 1:
+        raise ValueError(raw)
+    return min(size, MAX_PAGE_SIZE)
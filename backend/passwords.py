@@ -0,0 +1,64 @@
+# passwords.py
+#
+# bcrypt hashing and verification, run in a bounded process pool so a login
+# rush burns worker processes' CPU instead of starving the request threads
+# (and, through the GIL, every other endpoint in the same worker).
+#
+# At most PASSWORD_MAX_PENDING operations may be queued or running per web
+# worker. A request that cannot get a slot within PASSWORD_QUEUE_WAIT seconds
+# raises PasswordPoolBusy, which app.py turns into a 503 with Retry-After.
+#
+# PASSWORD_POOL_WORKERS=0 hashes inline on the request thread instead.
+
+import os
+import threading
+import bcrypt
+import workers
+
+LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', '12'))
+POOL_WORKERS = int(os.getenv('PASSWORD_POOL_WORKERS', str(os.cpu_count() or 2)))
+MAX_PENDING = int(os.getenv('PASSWORD_MAX_PENDING', str(max(POOL_WORKERS, 1) * 4)))
+QUEUE_WAIT = float(os.getenv('PASSWORD_QUEUE_WAIT', '2'))
+RETRY_AFTER = int(os.getenv('PASSWORD_RETRY_AFTER', '1'))
+
+_pool = workers.per_process_executor('process', POOL_WORKERS)
+_slots = threading.BoundedSemaphore(MAX_PENDING)
+
+
+class PasswordPoolBusy(Exception):
+    """Raised when the password pool's queue is full."""
+
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def _check(pw_hash, password):
+    return bcrypt.checkpw(password.encode('utf-8'), pw_hash.encode('utf-8'))
+
+
+def _run(fn, *args):
+    if POOL_WORKERS <= 0:
+        return fn(*args)
+    if not _slots.acquire(timeout=QUEUE_WAIT):
+        raise PasswordPoolBusy()
+    try:
+        return _pool.submit(fn, *args).result()
+    finally:
+        _slots.release()
+
+
+def hash_password(password):
+    return _run(_hash, password, LOG_ROUNDS)
+
+
+def check_password(pw_hash, password):
+    return _run(_check, pw_hash, password)
+
+
+def needs_rehash(pw_hash):
+    """True when a stored hash was made with a different work factor than BCRYPT_LOG_ROUNDS."""
+    try:
+        return int(pw_hash.split('$')[2]) != LOG_ROUNDS
+    except (IndexError, ValueError):
+        return True
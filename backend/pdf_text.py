@@ -0,0 +1,117 @@
+# pdf_text.py
+#
+# Text extraction for uploaded resumes. Extraction is bounded: at most
+# PDF_MAX_PAGES pages are read, and reading stops as soon as the caller's
+# character budget is met, so a 40-page portfolio costs no more than the
+# pages whose text is actually used.
+#
+# PDF_TEXT_BACKEND picks the extractor: "pdfium" (pypdfium2, which ships with
+# pdfplumber and is much faster), "pdfplumber", or "auto" (pdfium, falling
+# back to pdfplumber if it is unavailable or fails on a file).
+#
+# Documents with at least PDF_PARALLEL_MIN_PAGES pages are split into page
+# ranges and extracted across a process pool of PDF_WORKERS processes.
+
+import os
+import pdfplumber
+import workers
+
+BACKEND = os.getenv('PDF_TEXT_BACKEND', 'auto')
+MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', '30'))
+PARALLEL_MIN_PAGES = int(os.getenv('PDF_PARALLEL_MIN_PAGES', '12'))
+WORKERS = int(os.getenv('PDF_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+_pool = workers.per_process_executor('process', WORKERS)
+
+
+def _pdfium_pages(data, start, stop, max_chars):
+    import pypdfium2 as pdfium
+    texts, total = [], 0
+    pdf = pdfium.PdfDocument(data)
+    try:
+        for i in range(start, min(stop, len(pdf))):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            t = textpage.get_text_range().replace('\r\n', '\n')
+            textpage.close()
+            page.close()
+            if t.strip():
+                texts.append(t)
+                total += len(t)
+                if total >= max_chars:
+                    break
+    finally:
+        pdf.close()
+    return texts
+
+
+def _pdfplumber_pages(data, start, stop, max_chars):
+    import io
+    texts, total = [], 0
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        for p in pdf.pages[start:stop]:
+            t = p.extract_text() or ""
+            if t.strip():
+                texts.append(t)
+                total += len(t)
+                if total >= max_chars:
+                    break
+    return texts
+
+
+EXTRACTORS = {'pdfium': _pdfium_pages, 'pdfplumber': _pdfplumber_pages}
+
+
+def _extract_range(backend, data, start, stop, max_chars):
+    """Non-empty page texts for pages [start, stop), stopping once max_chars is reached."""
+    if backend == 'pdfplumber':
+        return _pdfplumber_pages(data, start, stop, max_chars)
+    try:
+        return EXTRACTORS[backend if backend in EXTRACTORS else 'pdfium'](data, start, stop, max_chars)
+    except Exception:
+        if backend != 'auto':
+            raise
+        return _pdfplumber_pages(data, start, stop, max_chars)
+
+
+def _page_count(data):
+    try:
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(data)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    except Exception:
+        import io
+        with pdfplumber.open(io.BytesIO(data)) as pdf:
+            return len(pdf.pages)
+
+
+def extract_pages(data, max_chars, max_pages=None, backend=None):
+    """Text of each non-empty page among the first max_pages, stopping once max_chars is reached."""
+    backend = backend or BACKEND
+    max_pages = MAX_PAGES if max_pages is None else max_pages
+    n_pages = min(_page_count(data), max_pages)
+
+    if WORKERS > 1 and n_pages >= PARALLEL_MIN_PAGES:
+        step = -(-n_pages // WORKERS)
+        ranges = [(start, min(start + step, n_pages)) for start in range(0, n_pages, step)]
+        futures = [_pool.submit(_extract_range, backend, data, start, stop, max_chars) for start, stop in ranges]
+        texts = []
+        total = 0
+        for future in futures:
+            if total >= max_chars:
+                future.cancel()
+                continue
+            for t in future.result():
+                texts.append(t)
+                total += len(t)
+    else:
+        texts = _extract_range(backend, data, 0, n_pages, max_chars)
+    return texts
+
+
+def extract_text(data, max_chars, max_pages=None, backend=None):
+    """Extracts up to max_chars of text from the first max_pages pages of PDF bytes."""
+    return "\n\n".join(extract_pages(data, max_chars, max_pages, backend))[:max_chars]
@@ -0,0 +1,241 @@
+# prompt_compact.py
+#
+# Shrinks what the resume endpoints send to the LLM. Resume text is cleaned
+# (whitespace, bullet glyphs, page numbers, headers/footers repeated on every
+# page) and then fitted to RESUME_PROMPT_TOKENS by giving each section a fair
+# share of the budget, so one long section cannot crowd out the rest. Chat
+# turns carry a short digest of the analysis instead of its full JSON.
+#
+# Token counts are estimates (about 4 characters per token), which is close
+# enough for budgeting and for the before/after counters reported by stats().
+
+import os
+import re
+import json
+import threading
+from collections import Counter
+
+RESUME_TOKENS = int(os.getenv('RESUME_PROMPT_TOKENS', '6000'))
+JOB_DESCRIPTION_TOKENS = int(os.getenv('JD_PROMPT_TOKENS', '1500'))
+CHAT_SNIPPET_TOKENS = int(os.getenv('CHAT_SNIPPET_TOKENS', '500'))
+CHAT_HISTORY_TOKENS = int(os.getenv('CHAT_HISTORY_TOKENS', '1500'))
+DIGEST_ITEMS = 5  # list entries kept per analysis field in the chat digest
+
+CHARS_PER_TOKEN = 4
+TRUNCATION_MARK = '[...]'
+
+# Resume text worth extracting from a PDF: what RESUME_TOKENS keeps, plus half
+# again for the headers, footers and whitespace that compact_resume strips
+RESUME_SOURCE_CHARS = RESUME_TOKENS * CHARS_PER_TOKEN * 3 // 2
+
+SECTION_NAMES = (
+    'summary', 'objective', 'profile', 'about me', 'education', 'academic details', 'experience',
+    'work experience', 'professional experience', 'internships?', 'projects', 'academic projects',
+    'skills', 'technical skills', 'certifications?', 'courses', 'achievements', 'awards',
+    'publications', 'activities', 'extra[- ]?curricular activities', 'positions? of responsibility',
+    'leadership', 'languages', 'interests', 'hobbies', 'references', 'contact',
+)
+_HEADING = re.compile(r'^(?:%s)\s*:?$' % '|'.join(SECTION_NAMES), re.IGNORECASE)
+_CAPS_HEADING = re.compile(r'^[A-Z][A-Z &/-]{2,40}:?$')
+_PAGE_NUMBER = re.compile(r'^(?:page\s*)?\d{1,3}(?:\s*(?:of|/)\s*\d{1,3})?$', re.IGNORECASE)
+_BULLETS = re.compile(r'^[•●▪■◦‣⁃∙*–—-]\s*')
+_SPACES = re.compile(r'[ \t\u00a0\u2000-\u200b\u3000]+')
+_DIGITS = re.compile(r'\d+')
+EDGE_LINES = 3  # lines at the top and bottom of a page checked for repeated headers/footers
+
+_lock = threading.Lock()
+_counters = {
+    'resumes': 0, 'resume_tokens_before': 0, 'resume_tokens_after': 0,
+    'chats': 0, 'chat_tokens_before': 0, 'chat_tokens_after': 0,
+}
+
+
+def estimate_tokens(text):
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _record(kind, before, after):
+    with _lock:
+        _counters[kind + 's'] += 1
+        _counters[kind + '_tokens_before'] += before
+        _counters[kind + '_tokens_after'] += after
+
+
+def _clean_lines(text):
+    lines = []
+    for line in text.splitlines():
+        line = _BULLETS.sub('- ', _SPACES.sub(' ', line).strip())
+        if line and not _PAGE_NUMBER.match(line):
+            lines.append(line)
+    return lines
+
+
+def _strip_repeated_edges(pages):
+    """Drops header/footer lines that recur at the edges of most pages, keeping the first page's copy."""
+    if len(pages) < 2:
+        return pages
+
+    def edges(lines):
+        return set(lines[:EDGE_LINES] + lines[-EDGE_LINES:])
+
+    seen = Counter()
+    for lines in pages:
+        seen.update({_DIGITS.sub('#', line) for line in edges(lines)})
+    repeated = {line for line, n in seen.items() if n >= 2 and n * 2 > len(pages)}
+    if not repeated:
+        return pages
+
+    result = [pages[0]]
+    for lines in pages[1:]:
+        edge = edges(lines)
+        result.append([line for line in lines if line not in edge or _DIGITS.sub('#', line) not in repeated])
+    return result
+
+
+def _is_heading(line):
+    return len(line) <= 40 and (_HEADING.match(line) is not None or _CAPS_HEADING.match(line) is not None)
+
+
+def _sections(lines):
+    """Splits lines into sections at headings; text before the first heading is its own section."""
+    sections = [[]]
+    for line in lines:
+        if _is_heading(line) and sections[-1]:
+            sections.append([])
+        sections[-1].append(line)
+    return sections
+
+
+def _truncate_lines(lines, budget):
+    """Keeps whole lines from the start of a section until the token budget runs out."""
+    kept, used = [], 0
+    for line in lines:
+        cost = estimate_tokens(line + '\n')
+        if used + cost > budget:
+            if not kept and budget > 0:
+                kept.append(line[:budget * CHARS_PER_TOKEN])
+            kept.append(TRUNCATION_MARK)
+            break
+        kept.append(line)
+        used += cost
+    return kept
+
+
+def _fit_sections(sections, budget):
+    """
+    Fair-share budgeting: sections smaller than an equal share are kept whole,
+    and what they leave unused is split between the larger ones.
+    """
+    costs = [sum(estimate_tokens(line + '\n') for line in section) for section in sections]
+    if sum(costs) <= budget:
+        return sections
+
+    allowance = [0] * len(sections)
+    remaining, pending = budget, sorted(range(len(sections)), key=costs.__getitem__)
+    while pending:
+        share = remaining // len(pending)
+        i = pending.pop(0)
+        allowance[i] = min(costs[i], share)
+        remaining -= allowance[i]
+    return [section if allowance[i] >= costs[i] else _truncate_lines(section, allowance[i])
+            for i, section in enumerate(sections)]
+
+
+def compact_resume(pages, budget=None):
+    """Cleans per-page resume text and fits it to the token budget. Returns the compacted text."""
+    budget = RESUME_TOKENS if budget is None else budget
+    before = sum(estimate_tokens(page) for page in pages)
+
+    lines = [line for page in _strip_repeated_edges([_clean_lines(page) for page in pages]) for line in page]
+    sections = _fit_sections(_sections(lines), budget)
+    text = '\n\n'.join('\n'.join(section) for section in sections if section)
+
+    _record('resume', before, estimate_tokens(text))
+    return text
+
+
+def compact_text(text, budget):
+    """Whitespace-normalised text cut to the token budget at a line boundary."""
+    return '\n'.join(_truncate_lines(_clean_lines(text), budget))
+
+
+def _names(items, key=None):
+    if not isinstance(items, list):
+        return []
+    values = [item.get(key) if key and isinstance(item, dict) else item for item in items[:DIGEST_ITEMS]]
+    return [str(v) for v in values if v]
+
+
+def analysis_digest(analysis):
+    """A few lines summarising an analysis for chat prompts: names and scores, no resources or prose."""
+    if not isinstance(analysis, dict):
+        return compact_text(str(analysis or ''), CHAT_SNIPPET_TOKENS)
+    if 'raw' in analysis and len(analysis) <= 2:
+        return compact_text(str(analysis['raw']), CHAT_SNIPPET_TOKENS)
+
+    lines = []
+    if analysis.get('headline'):
+        lines.append(f"Headline: {analysis['headline']}")
+    if _names(analysis.get('core_strengths')):
+        lines.append('Strengths: ' + '; '.join(_names(analysis.get('core_strengths'))))
+    gaps = analysis.get('skill_gaps')
+    if isinstance(gaps, dict):
+        parts = [f"{area}: {', '.join(_names(items))}" for area, items in gaps.items() if _names(items)]
+        if parts:
+            lines.append('Gaps: ' + ' | '.join(parts))
+    for label, field, key in (
+        ('Learning path', 'priority_learning_path', 'topic'),
+        ('Project ideas', 'project_ideas', 'title'),
+        ('Next 30 days', 'next_30_days', 'task'),
+    ):
+        names = _names(analysis.get(field), key)
+        if names:
+            lines.append(f"{label}: {'; '.join(names)}")
+    fits = analysis.get('role_fit')
+    if isinstance(fits, list):
+        parts = [f"{fit.get('role')} ({fit.get('confidence')})" for fit in fits[:DIGEST_ITEMS]
+                 if isinstance(fit, dict) and fit.get('role')]
+        if parts:
+            lines.append('Role fit: ' + '; '.join(parts))
+    return '\n'.join(lines)
+
+
+def chat_context(body):
+    """
+    (digest, resume_snippet) for a chat request. Clients send the 'digest'
+    returned by /resume/analyze; a full 'analysis' is still accepted and digested here.
+    """
+    analysis = body.get('analysis')
+    digest = body.get('digest')
+    snippet = body.get('resume_snippet') or ''
+    if not digest:
+        digest = analysis_digest(analysis or {})
+    digest = compact_text(digest, CHAT_SNIPPET_TOKENS)
+    compact_snippet = compact_text(snippet, CHAT_SNIPPET_TOKENS)
+
+    if analysis:
+        # Only measurable when the client still round-trips the full analysis
+        before = estimate_tokens(snippet) + estimate_tokens(json.dumps(analysis))
+        _record('chat', before, estimate_tokens(compact_snippet) + estimate_tokens(digest))
+    return digest, compact_snippet
+
+
+def fit_history(history, budget=None):
+    """The most recent chat messages whose combined size fits the token budget, oldest first."""
+    budget = CHAT_HISTORY_TOKENS if budget is None else budget
+    kept = []
+    for turn in reversed(history):
+        budget -= estimate_tokens(turn['content'])
+        if budget < 0:
+            break
+        kept.append(turn)
+    return kept[::-1]
+
+
+def stats():
+    with _lock:
+        counters = dict(_counters)
+    for kind in ('resume', 'chat'):
+        before = counters[kind + '_tokens_before']
+        counters[kind + '_reduction'] = round(1 - counters[kind + '_tokens_after'] / before, 4) if before else 0.0
+    return counters
@@ -0,0 +1,160 @@
+# response_cache.py
+#
+# Read-through cache for public GET responses, with ETag/If-None-Match support.
+#
+# Cache keys carry a per-namespace generation number. A write bumps the
+# generation with invalidate(namespace), which orphans every cached response
+# in that namespace at once; orphans then age out through TTL/LRU eviction.
+#
+# The default backend lives in this process. Set RESPONSE_CACHE_URL to a
+# redis:// URL (requires the `redis` package) to share both the cached
+# responses and the generation counters between workers, so a write on one
+# worker is seen immediately by the others.
+
+import os
+import hashlib
+import inspect
+import threading
+from functools import wraps
+from flask import request, make_response, current_app
+from cache import TTLCache
+
+
+class MemoryBackend:
+    def __init__(self, maxsize, ttl):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def set(self, key, etag, body):
+        self._entries.set(key, (etag, body))
+
+    def generation(self, namespace):
+        return self._generations.get(namespace, 0)
+
+    def bump(self, namespace):
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+
+class RedisBackend:
+    def __init__(self, url, ttl, prefix='placement_portal:responses:'):
+        import redis  # optional dependency, only needed for a shared cache
+        self._redis = redis.Redis.from_url(url)
+        self._ttl = int(ttl)
+        self._prefix = prefix
+
+    def get(self, key):
+        raw = self._redis.get(self._prefix + key)
+        if raw is None:
+            return None
+        etag, _, body = raw.partition(b'\n')
+        return etag.decode('ascii'), body
+
+    def set(self, key, etag, body):
+        self._redis.set(self._prefix + key, etag.encode('ascii') + b'\n' + body, ex=self._ttl)
+
+    def generation(self, namespace):
+        return int(self._redis.get(self._prefix + 'gen:' + namespace) or 0)
+
+    def bump(self, namespace):
+        self._redis.incr(self._prefix + 'gen:' + namespace)
+
+
+class ResponseCache:
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def cached(self, namespace, skip=None):
+        """Caches a view's 200 responses per full request path, and answers If-None-Match with 304.
+
+        `skip` is an optional callable; when it returns True the request bypasses the cache.
+        Works on the async views in asgi.py as well.
+        """
+        def decorator(f):
+            if inspect.iscoroutinefunction(f):
+                @wraps(f)
+                async def decorated_coroutine(*args, **kwargs):
+                    if skip is not None and skip():
+                        return await f(*args, **kwargs)
+                    key = self.key(namespace, request.full_path)
+                    entry = self.lookup(key)
+                    return self._respond(key, entry, await f(*args, **kwargs) if entry is None else None)
+                return decorated_coroutine
+
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                if skip is not None and skip():
+                    return f(*args, **kwargs)
+                key = self.key(namespace, request.full_path)
+                entry = self.lookup(key)
+                return self._respond(key, entry, f(*args, **kwargs) if entry is None else None)
+            return decorated_function
+        return decorator
+
+    def _respond(self, key, entry, rv):
+        """The cached entry (a hit), or the view's return value rv, stored when it is a 200 (a miss)."""
+        if entry is None:
+            response = make_response(rv)
+            if response.status_code != 200:
+                return response
+            etag = self.store(key, response.get_data())
+            response.headers['X-Cache'] = 'MISS'
+        else:
+            etag, body = entry
+            response = current_app.response_class(body, mimetype='application/json')
+            response.headers['X-Cache'] = 'HIT'
+
+        # Clients may keep the body but must revalidate it; unchanged data costs a 304
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
+
+    def key(self, namespace, full_path):
+        """Cache key for a request path (with its query string) in the namespace's current generation."""
+        return f"{namespace}:{self.backend.generation(namespace)}:{full_path}"
+
+    def lookup(self, key):
+        """(etag, body) for a cached response, or None."""
+        entry = self.backend.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def store(self, key, body):
+        """Caches a 200 response body and returns its ETag."""
+        etag = hashlib.sha1(body).hexdigest()
+        self.backend.set(key, etag, body)
+        return etag
+
+    def invalidate(self, namespace):
+        self.backend.bump(namespace)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'backend': type(self.backend).__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def create_response_cache():
+    ttl = float(os.getenv('RESPONSE_CACHE_TTL', '30'))
+    url = os.getenv('RESPONSE_CACHE_URL')
+    if url:
+        backend = RedisBackend(url, ttl)
+    else:
+        backend = MemoryBackend(maxsize=int(os.getenv('RESPONSE_CACHE_SIZE', '512')), ttl=ttl)
+    return ResponseCache(backend)
+
+
+response_cache = create_response_cache()
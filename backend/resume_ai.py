@@ -1,16 +1,57 @@
 # backend/resume_ai.py
 
-import os, io, json
-from groq import Groq
-from flask import Blueprint, request, jsonify
+import os, io, json, asyncio
+from groq import Groq, AsyncGroq
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from werkzeug.utils import secure_filename
-import pdfplumber
+import metrics
+import pdf_text
+import prompt_compact
+import resume_cache
+import resume_jobs
+import resume_sessions
 
 resume_ai_bp = Blueprint("resume_ai", __name__)
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+
+_client = None
+_async_client = None
+
+def _fake_llm():
+    return os.getenv("RESUME_AI_FAKE_LLM", "false").lower() == "true"
+
+def get_client():
+    """Groq client, created on first use so the app can start without GROQ_API_KEY."""
+    global _client
+    if _client is None:
+        if _fake_llm():
+            from fake_llm import FakeGroq
+            _client = FakeGroq()
+        else:
+            _client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+    return _client
+
+def set_client(client):
+    """Swaps the LLM client, e.g. for fake_llm.FakeGroq in tests and benchmarks."""
+    global _client
+    _client = client
+
+def get_async_client():
+    """AsyncGroq client for the async routes in asgi.py."""
+    global _async_client
+    if _async_client is None:
+        if _fake_llm():
+            from fake_llm import FakeAsyncGroq
+            _async_client = FakeAsyncGroq()
+        else:
+            _async_client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
+    return _async_client
+
+def set_async_client(client):
+    global _async_client
+    _async_client = client
 
 MODEL = "llama-3.3-70b-versatile"  # fast + high quality on Groq
-MAX_CHARS = 120_000  # keep input sane
+MAX_CHARS = prompt_compact.RESUME_SOURCE_CHARS  # nothing past this reaches the prompt
 
 SYSTEM_INSTRUCTIONS = """You are a career mentor for software/tech roles.
 Given a candidate's resume text (which may be messy), analyze and return ONLY valid JSON:
@@ -36,58 +77,253 @@ If job_description is provided, tailor gaps to it.
 """
 
 def _pdf_to_text(file_stream) -> str:
-    text_chunks = []
-    with pdfplumber.open(file_stream) as pdf:
-        for p in pdf.pages:
-            t = p.extract_text() or ""
-            if t.strip():
-                text_chunks.append(t)
-    text = "\n\n".join(text_chunks)
-    return text[:MAX_CHARS]
-
-# NOTE: Do NOT prefix with /api here. app.py mounts url_prefix="/api"
-@resume_ai_bp.route("/resume/analyze", methods=["POST"])
-def analyze_resume():
-    if "file" not in request.files:
-        return jsonify({"error": "No file provided"}), 400
-
-    f = request.files["file"]
-    filename = secure_filename(f.filename or "resume.pdf")
-    if not filename.lower().endswith(".pdf"):
-        return jsonify({"error": "Please upload a PDF"}), 400
+    # Page-capped and stops as soon as MAX_CHARS is reached; see pdf_text.py
+    pages = pdf_text.extract_pages(file_stream.read(), MAX_CHARS)
+    # Cleaned and fitted to the prompt token budget; see prompt_compact.py
+    return prompt_compact.compact_resume(pages)
 
-    target_role = request.form.get("target_role", "").strip()
-    job_desc = request.form.get("job_description", "").strip()
+UNREADABLE_PDF = {"error": "Could not read text. If this is a scanned PDF, run OCR first."}
 
-    resume_text = _pdf_to_text(io.BytesIO(f.read()))
-    if not resume_text:
-        return jsonify({"error": "Could not read text. If this is a scanned PDF, run OCR first."}), 400
+def _resume_text(pdf_bytes, pdf_hash):
+    """Compacted resume text, from the cache or by parsing the PDF. Empty if the PDF has no text layer."""
+    resume_text = resume_cache.get_text(pdf_hash)
+    if resume_text is None:
+        resume_text = _pdf_to_text(io.BytesIO(pdf_bytes))
+        if resume_text:
+            resume_cache.set_text(pdf_hash, resume_text)
+    return resume_text
 
+def _analysis_request(resume_text, target_role, job_desc):
+    """Keyword arguments for the analysis chat completion."""
     user_payload = {
         "resume_text": resume_text,
         "target_role": target_role,
-        "job_description": job_desc
+        "job_description": prompt_compact.compact_text(job_desc, prompt_compact.JOB_DESCRIPTION_TOKENS)
     }
-
-    completion = client.chat.completions.create(
-        model=MODEL,
-        messages=[
+    return {
+        "model": MODEL,
+        "messages": [
             {"role": "system", "content": SYSTEM_INSTRUCTIONS},
-            {"role": "user", "content": json.dumps(user_payload)}
+            {"role": "user", "content": json.dumps(user_payload, ensure_ascii=False, separators=(",", ":"))}
         ],
-        response_format={"type": "json_object"}  # force clean JSON
-    )
+        "response_format": {"type": "json_object"}  # force clean JSON
+    }
+
+def _analyze_uncached(pdf_bytes, pdf_hash, target_role, job_desc):
+    """Parses the PDF (unless its text is cached) and asks the LLM. Returns (body, status_code)."""
+    resume_text = _resume_text(pdf_bytes, pdf_hash)
+    if not resume_text:
+        return UNREADABLE_PDF, 400
+
+    with metrics.llm_call("analyze") as call:
+        completion = get_client().chat.completions.create(**_analysis_request(resume_text, target_role, job_desc))
+        call["usage"] = getattr(completion, "usage", None)
+
+    return _analysis_result(completion, resume_text, pdf_hash, target_role, job_desc)
 
+def _analysis_result(completion, resume_text, pdf_hash, target_role, job_desc):
+    """Parses the LLM's analysis, caches it and opens a chat session. Returns (body, status_code)."""
     data = completion.choices[0].message.content
+    resume_snippet = resume_text[:4000]  # small context for quick follow-ups
     try:
         parsed = json.loads(data)
     except Exception:
         parsed = {"headline": "Resume analysis", "raw": data}
+    else:
+        # Only cache well-formed analyses; a garbled reply deserves a retry
+        usage = getattr(completion, "usage", None)
+        tokens = getattr(usage, "total_tokens", 0) or 0
+        resume_cache.set_analysis(pdf_hash, target_role, job_desc, parsed, resume_snippet, tokens)
 
-    return jsonify({
+    digest = prompt_compact.analysis_digest(parsed)
+    return {
         "analysis": parsed,
-        "resume_snippet": resume_text[:4000],  # small context for quick follow-ups
-    })
+        "resume_snippet": resume_snippet,
+        "digest": digest,
+        "session_id": resume_sessions.create(resume_snippet, parsed, digest),
+        "cached": False,
+    }, 200
+
+def _analysis_upload():
+    """
+    Validates the uploaded PDF and answers a repeat from the cache. Returns (response, None)
+    when that settles the request, otherwise (None, (pdf_bytes, pdf_hash, target_role, job_desc)).
+    """
+    if "file" not in request.files:
+        return (jsonify({"error": "No file provided"}), 400), None
+
+    f = request.files["file"]
+    filename = secure_filename(f.filename or "resume.pdf")
+    if not filename.lower().endswith(".pdf"):
+        return (jsonify({"error": "Please upload a PDF"}), 400), None
+
+    target_role = request.form.get("target_role", "").strip()
+    job_desc = request.form.get("job_description", "").strip()
+
+    # Identical PDF + role + JD: answer from the cache without parsing or calling the LLM
+    pdf_bytes = f.read()
+    pdf_hash = resume_cache.content_hash(pdf_bytes)
+    cached = resume_cache.get_analysis(pdf_hash, target_role, job_desc)
+    if cached:
+        digest = prompt_compact.analysis_digest(cached["analysis"])
+        session_id = resume_sessions.create(cached["resume_snippet"], cached["analysis"], digest)
+        return jsonify({**cached, "digest": digest, "session_id": session_id, "cached": True}), None
+    return None, (pdf_bytes, pdf_hash, target_role, job_desc)
+
+def _wants_background_analysis():
+    return request.values.get("async", "false").lower() == "true"
+
+def _queue_analysis(upload):
+    """Queues the analysis and lets the client poll GET /resume/analyze/<job_id>."""
+    try:
+        job_id = resume_jobs.submit(_analyze_uncached, *upload)
+    except resume_jobs.QueueFull:
+        response = jsonify({"error": "Too many analyses in progress, please retry shortly", "code": "ERR_BUSY"})
+        response.headers["Retry-After"] = "5"
+        return response, 503
+    return jsonify({"job_id": job_id, "status": "queued"}), 202
+
+# NOTE: Do NOT prefix with /api here. app.py mounts url_prefix="/api"
+@resume_ai_bp.route("/resume/analyze", methods=["POST"])
+def analyze_resume():
+    response, upload = _analysis_upload()
+    if response is not None:
+        return response
+    if _wants_background_analysis():
+        return _queue_analysis(upload)
+
+    body, status_code = _analyze_uncached(*upload)
+    return jsonify(body), status_code
+
+async def analyze_resume_async():
+    """analyze_resume for asgi.py: upload handling, PDF parsing and caching run in threads; the LLM call is awaited."""
+    response, upload = await asyncio.to_thread(_analysis_upload)
+    if response is not None:
+        return response
+    if _wants_background_analysis():
+        return await asyncio.to_thread(_queue_analysis, upload)
+
+    pdf_bytes, pdf_hash, target_role, job_desc = upload
+    resume_text = await asyncio.to_thread(_resume_text, pdf_bytes, pdf_hash)
+    if not resume_text:
+        return jsonify(UNREADABLE_PDF), 400
+
+    with metrics.llm_call("analyze") as call:
+        completion = await get_async_client().chat.completions.create(
+            **_analysis_request(resume_text, target_role, job_desc))
+        call["usage"] = getattr(completion, "usage", None)
+
+    body, status_code = await asyncio.to_thread(
+        _analysis_result, completion, resume_text, pdf_hash, target_role, job_desc)
+    return jsonify(body), status_code
+
+# NOTE: Do NOT prefix with /api here. app.py mounts url_prefix="/api"
+@resume_ai_bp.route("/resume/analyze/<job_id>", methods=["GET"])
+def get_analysis_job(job_id):
+    job = resume_jobs.get(job_id)
+    if not job:
+        return jsonify({"error": "Analysis job not found"}), 404
+
+    body = {"job_id": job["_id"], "status": job["status"]}
+    if job["status"] == "done":
+        body["result"] = job["result"]
+    elif job["status"] == "failed":
+        body["error"] = job.get("error")
+    return jsonify(body)
+
+CHAT_SYSTEM_PROMPT = (
+    "You are a concise career mentor. "
+    "Reply **only** in clean Markdown with:\n"
+    "### Headline\n"
+    "- 1 sentence\n\n"
+    "### Top Focus Areas (1–3)\n"
+    "- Bullet points; bold the skill name; 1 actionable step each\n\n"
+    "### Starter Resources\n"
+    "- Use Markdown links; 2–4 items max\n\n"
+    "### 30-Day Plan\n"
+    "1. Week 1 …\n2. Week 2 …\n3. Week 3 …\n4. Week 4 …\n\n"
+    "Prefer India-friendly/free options. Keep total under 180 lines."
+)
+
+def _chat_messages(body, session=None):
+    """Prompt for one chat turn; with a session, context and earlier turns come from the server."""
+    message = body.get("message", "")
+    digest, resume_snippet = prompt_compact.chat_context(session or body)
+    history = prompt_compact.fit_history(session["history"]) if session else []
+
+    prompt = (
+        "Resume snippet:\n"
+        f"{resume_snippet}\n\n"
+        "Current analysis (summary):\n"
+        f"{digest}\n\n"
+        "User question:\n"
+        f"{message}"
+    )
+    return [
+        {"role": "system", "content": CHAT_SYSTEM_PROMPT},
+        *history,
+        {"role": "user", "content": prompt}
+    ]
+
+def _sse(data, event=None):
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+def _chunk_parts(chunk):
+    """(text delta, usage) of one streamed chunk; Groq reports usage on the final chunk under x_groq."""
+    delta = chunk.choices[0].delta.content if chunk.choices else None
+    usage = getattr(getattr(chunk, "x_groq", None), "usage", None) or getattr(chunk, "usage", None)
+    return delta, usage
+
+def _stream_chat(messages, on_done=None):
+    """Server-Sent Events: one `data: {"delta": ...}` per token chunk, then `event: done` (or `event: error`)."""
+    try:
+        with metrics.llm_call("chat_stream") as call:
+            stream = get_client().chat.completions.create(model=MODEL, messages=messages, stream=True)
+            parts = []
+            for chunk in stream:
+                delta, usage = _chunk_parts(chunk)
+                if delta:
+                    parts.append(delta)
+                    yield _sse({"delta": delta})
+                if usage is not None:
+                    call["usage"] = usage
+        if on_done:
+            on_done("".join(parts))
+        yield _sse({}, event="done")
+    except Exception as e:
+        yield _sse({"error": "chat_failed", "detail": str(e)}, event="error")
+
+async def _stream_chat_async(messages, on_done=None):
+    """_stream_chat over AsyncGroq; on_done is awaited."""
+    try:
+        with metrics.llm_call("chat_stream") as call:
+            stream = await get_async_client().chat.completions.create(model=MODEL, messages=messages, stream=True)
+            parts = []
+            async for chunk in stream:
+                delta, usage = _chunk_parts(chunk)
+                if delta:
+                    parts.append(delta)
+                    yield _sse({"delta": delta})
+                if usage is not None:
+                    call["usage"] = usage
+        if on_done:
+            await on_done("".join(parts))
+        yield _sse({}, event="done")
+    except Exception as e:
+        yield _sse({"error": "chat_failed", "detail": str(e)}, event="error")
+
+SESSION_EXPIRED = {"error": "Chat session expired. Analyze your resume again.", "code": "ERR_NOT_FOUND"}
+
+def _wants_stream():
+    # Streaming mode forwards tokens as they arrive instead of waiting for the full reply
+    return (
+        request.args.get("stream", "false").lower() == "true"
+        or "text/event-stream" in request.headers.get("Accept", "")
+    )
+
+def _event_stream(events):
+    return Response(events, mimetype="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 # NOTE: Do NOT prefix with /api here. app.py mounts url_prefix="/api"
 @resume_ai_bp.route("/resume/chat", methods=["POST"])
@@ -95,40 +331,55 @@ def chat_about_resume():
     try:
         body = request.get_json(force=True)
         message = body.get("message", "")
-        analysis = body.get("analysis", {})
-        resume_snippet = body.get("resume_snippet", "")
-
-        prompt = (
-            "Resume snippet:\n"
-            f"{resume_snippet}\n\n"
-            "Current analysis (JSON):\n"
-            f"{json.dumps(analysis)}\n\n"
-            "User question:\n"
-            f"{message}"
-        )
-
-        completion = client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a concise career mentor. "
-                        "Reply **only** in clean Markdown with:\n"
-                        "### Headline\n"
-                        "- 1 sentence\n\n"
-                        "### Top Focus Areas (1–3)\n"
-                        "- Bullet points; bold the skill name; 1 actionable step each\n\n"
-                        "### Starter Resources\n"
-                        "- Use Markdown links; 2–4 items max\n\n"
-                        "### 30-Day Plan\n"
-                        "1. Week 1 …\n2. Week 2 …\n3. Week 3 …\n4. Week 4 …\n\n"
-                        "Prefer India-friendly/free options. Keep total under 180 lines."
-                    )
-                },
-                {"role": "user", "content": prompt}
-            ]
-        )
-        return jsonify({"reply": completion.choices[0].message.content})
+
+        # With a session id the client sends only the new message
+        session = None
+        if body.get("session_id"):
+            session = resume_sessions.get(body["session_id"])
+            if not session:
+                return jsonify(SESSION_EXPIRED), 404
+        messages = _chat_messages(body, session)
+        record_turn = (lambda reply: resume_sessions.append_turn(session["_id"], message, reply)) if session else None
+
+        if _wants_stream():
+            return _event_stream(stream_with_context(_stream_chat(messages, on_done=record_turn)))
+
+        with metrics.llm_call("chat") as call:
+            completion = get_client().chat.completions.create(
+                model=MODEL,
+                messages=messages
+            )
+            call["usage"] = getattr(completion, "usage", None)
+        reply = completion.choices[0].message.content
+        if record_turn:
+            record_turn(reply)
+        return jsonify({"reply": reply})
+    except Exception as e:
+        return jsonify({"error": "chat_failed", "detail": str(e)}), 500
+
+async def chat_about_resume_async():
+    """chat_about_resume for asgi.py: the session and the LLM are awaited."""
+    try:
+        body = request.get_json(force=True)
+        message = body.get("message", "")
+
+        session = None
+        if body.get("session_id"):
+            session = await resume_sessions.get_async(body["session_id"])
+            if not session:
+                return jsonify(SESSION_EXPIRED), 404
+        messages = _chat_messages(body, session)
+        record_turn = (lambda reply: resume_sessions.append_turn_async(session["_id"], message, reply)) if session else None
+
+        if _wants_stream():
+            return _event_stream(_stream_chat_async(messages, on_done=record_turn))
+
+        with metrics.llm_call("chat") as call:
+            completion = await get_async_client().chat.completions.create(model=MODEL, messages=messages)
+            call["usage"] = getattr(completion, "usage", None)
+        reply = completion.choices[0].message.content
+        if record_turn:
+            await record_turn(reply)
+        return jsonify({"reply": reply})
     except Exception as e:
         return jsonify({"error": "chat_failed", "detail": str(e)}), 500
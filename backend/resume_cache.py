@@ -0,0 +1,105 @@
+# resume_cache.py
+#
+# Content-addressed cache for /resume/analyze, stored in Mongo so every worker
+# shares it. Two kinds of entries live in the resume_cache collection:
+#
+#   text:<sha256 of the PDF>                     extracted, compacted resume text
+#   analysis:<sha256 of PDF hash + role + JD>    parsed LLM analysis
+#
+# so re-uploading the same PDF skips parsing, and re-running the same
+# analysis skips the LLM call too. Entries expire through the TTL index on
+# created_at (RESUME_CACHE_TTL, see migrations.py); the collection is also trimmed to MAX_ENTRIES,
+# oldest first.
+
+import os
+import hashlib
+import threading
+from datetime import datetime, timezone
+from pymongo.errors import DuplicateKeyError
+import db
+
+TTL = int(os.getenv('RESUME_CACHE_TTL', str(7 * 24 * 3600)))
+MAX_ENTRIES = int(os.getenv('RESUME_CACHE_MAX_ENTRIES', '5000'))
+TRIM_EVERY = 50  # check the collection size once per this many inserts
+
+_lock = threading.Lock()
+_counters = {
+    'text_hits': 0, 'text_misses': 0,
+    'analysis_hits': 0, 'analysis_misses': 0,
+    'tokens_saved': 0,
+}
+_inserts = 0
+
+
+def _count(name, amount=1):
+    with _lock:
+        _counters[name] += amount
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _analysis_key(pdf_hash, target_role, job_description):
+    digest = hashlib.sha256('\x00'.join([pdf_hash, target_role, job_description]).encode('utf-8')).hexdigest()
+    return f'analysis:{digest}'
+
+
+def _put(doc):
+    global _inserts
+    doc['created_at'] = datetime.now(timezone.utc)
+    try:
+        db.resume_cache.insert_one(doc)
+    except DuplicateKeyError:
+        return  # another request cached the same content first
+    with _lock:
+        _inserts += 1
+        should_trim = _inserts % TRIM_EVERY == 0
+    if should_trim:
+        _trim()
+
+
+def _trim():
+    excess = db.resume_cache.estimated_document_count() - MAX_ENTRIES
+    if excess <= 0:
+        return
+    oldest = [doc['_id'] for doc in db.resume_cache.find({}, {'_id': 1}).sort('created_at', 1).limit(excess)]
+    db.resume_cache.delete_many({'_id': {'$in': oldest}})
+
+
+def get_text(pdf_hash):
+    doc = db.resume_cache.find_one({'_id': f'text:{pdf_hash}'})
+    _count('text_hits' if doc else 'text_misses')
+    return doc['text'] if doc else None
+
+
+def set_text(pdf_hash, text):
+    _put({'_id': f'text:{pdf_hash}', 'text': text})
+
+
+def get_analysis(pdf_hash, target_role, job_description):
+    """Returns the cached {'analysis', 'resume_snippet'} for this request, or None."""
+    doc = db.resume_cache.find_one({'_id': _analysis_key(pdf_hash, target_role, job_description)})
+    if not doc:
+        _count('analysis_misses')
+        return None
+    _count('analysis_hits')
+    _count('tokens_saved', doc.get('tokens') or 0)
+    return {'analysis': doc['analysis'], 'resume_snippet': doc['resume_snippet']}
+
+
+def set_analysis(pdf_hash, target_role, job_description, analysis, resume_snippet, tokens):
+    _put({
+        '_id': _analysis_key(pdf_hash, target_role, job_description),
+        'analysis': analysis,
+        'resume_snippet': resume_snippet,
+        'tokens': tokens,
+    })
+
+
+def stats():
+    with _lock:
+        counters = dict(_counters)
+    lookups = counters['analysis_hits'] + counters['analysis_misses']
+    counters['analysis_hit_rate'] = round(counters['analysis_hits'] / lookups, 4) if lookups else 0.0
+    return counters
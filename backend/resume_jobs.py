@@ -0,0 +1,75 @@
+# resume_jobs.py
+#
+# Background queue for resume analysis. Jobs run on a per-process thread pool
+# whose size caps concurrent LLM calls (RESUME_LLM_CONCURRENCY); at most
+# RESUME_MAX_QUEUED jobs may be waiting or running per process, beyond which
+# submit() raises QueueFull. Job state lives in the resume_jobs collection, so
+# any worker can answer a status poll; finished jobs expire via a TTL index.
+
+import os
+import uuid
+import threading
+from datetime import datetime, timezone
+import db
+import workers
+
+LLM_CONCURRENCY = int(os.getenv('RESUME_LLM_CONCURRENCY', '4'))
+MAX_QUEUED = int(os.getenv('RESUME_MAX_QUEUED', '32'))
+
+_executor = workers.per_process_executor('thread', LLM_CONCURRENCY, 'resume-job')
+_lock = threading.Lock()
+_pending = 0
+
+
+class QueueFull(Exception):
+    """Raised when too many analyses are already queued in this process."""
+
+
+def _update(job_id, **fields):
+    fields['updated_at'] = datetime.now(timezone.utc)
+    db.resume_jobs.update_one({'_id': job_id}, {'$set': fields})
+
+
+def _run(job_id, fn, args):
+    global _pending
+    try:
+        _update(job_id, status='running')
+        body, status_code = fn(*args)
+        if status_code == 200:
+            _update(job_id, status='done', result=body)
+        else:
+            _update(job_id, status='failed', error=body.get('error'))
+    except Exception as e:
+        _update(job_id, status='failed', error=str(e))
+    finally:
+        with _lock:
+            _pending -= 1
+
+
+def submit(fn, *args):
+    """Queues fn(*args), which must return (body, status_code). Returns the job id."""
+    global _pending
+    with _lock:
+        if _pending >= MAX_QUEUED:
+            raise QueueFull()
+        _pending += 1
+
+    job_id = uuid.uuid4().hex
+    now = datetime.now(timezone.utc)
+    try:
+        db.resume_jobs.insert_one({'_id': job_id, 'status': 'queued', 'created_at': now, 'updated_at': now})
+        _executor.submit(_run, job_id, fn, args)
+    except Exception:
+        with _lock:
+            _pending -= 1
+        raise
+    return job_id
+
+
+def get(job_id):
+    return db.resume_jobs.find_one({'_id': job_id})
+
+
+def stats():
+    with _lock:
+        return {'pending': _pending, 'max_queued': MAX_QUEUED, 'llm_concurrency': LLM_CONCURRENCY}
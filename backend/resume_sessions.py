@@ -0,0 +1,67 @@
+# resume_sessions.py
+#
+# Server-held context for Resume Coach chats. /resume/analyze opens a session
+# holding the resume snippet, the analysis and its digest; /resume/chat then
+# only needs the session id and the new message, and each turn is appended to
+# a history capped at RESUME_SESSION_HISTORY messages. Sessions live in the
+# resume_sessions collection so any worker can serve the next turn, and expire
+# RESUME_SESSION_TTL seconds after their last use (TTL index on updated_at).
+
+import os
+import uuid
+from datetime import datetime, timezone, timedelta
+import db
+import async_db
+
+TTL = int(os.getenv('RESUME_SESSION_TTL', str(2 * 3600)))
+MAX_HISTORY = int(os.getenv('RESUME_SESSION_HISTORY', '10'))
+
+
+def create(resume_snippet, analysis, digest):
+    """Stores a new session and returns its id."""
+    session_id = uuid.uuid4().hex
+    now = datetime.now(timezone.utc)
+    db.resume_sessions.insert_one({
+        '_id': session_id,
+        'resume_snippet': resume_snippet,
+        'analysis': analysis,
+        'digest': digest,
+        'history': [],
+        'created_at': now,
+        'updated_at': now,
+    })
+    return session_id
+
+
+def _live(session_id):
+    # The TTL monitor only runs once a minute, so check the age here as well
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=TTL)
+    return {'_id': session_id, 'updated_at': {'$gte': cutoff}}
+
+
+def _turn(message, reply):
+    return {
+        '$push': {'history': {'$each': [
+            {'role': 'user', 'content': message},
+            {'role': 'assistant', 'content': reply},
+        ], '$slice': -MAX_HISTORY}},
+        '$set': {'updated_at': datetime.now(timezone.utc)},
+    }
+
+
+def get(session_id):
+    """The session, or None if it never existed or has expired."""
+    return db.resume_sessions.find_one(_live(session_id), {'analysis': 0})
+
+
+def append_turn(session_id, message, reply):
+    """Records one question/answer pair, keeping the newest MAX_HISTORY messages."""
+    db.resume_sessions.update_one({'_id': session_id}, _turn(message, reply))
+
+
+async def get_async(session_id):
+    return await async_db.resume_sessions.find_one(_live(session_id), {'analysis': 0})
+
+
+async def append_turn_async(session_id, message, reply):
+    await async_db.resume_sessions.update_one({'_id': session_id}, _turn(message, reply))
@@ -0,0 +1,89 @@
+# search.py
+#
+# Job search for GET /jobs?q=. Every job carries a denormalised, lower-cased
+# `search_terms` array built from its title, company and tech_stack. The array
+# has a multikey index, so a prefix lookup (an anchored regex on lower-case
+# terms) is an index range scan rather than the collection scan that an
+# unanchored case-insensitive $regex forces. Matches are ranked in Python.
+
+import re
+from pymongo import UpdateOne
+import db
+import bulk
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+# Fields that feed search_terms, and how much a hit in each counts when ranking
+FIELD_WEIGHTS = {'title': 3.0, 'company': 3.0, 'tech_stack': 2.0}
+PREFIX_FACTOR = 0.5  # a prefix hit scores half of an exact token hit
+
+# Never send the term array back to clients
+HIDDEN_FIELDS = {'search_terms': 0}
+
+
+def tokenize(text):
+    """Lower-cases text and splits it into terms, keeping tech names like c++, c# and node.js whole."""
+    tokens = []
+    for token in TOKEN_RE.findall((text or '').lower()):
+        token = token.rstrip('.')
+        if token:
+            tokens.append(token)
+    return tokens
+
+
+def _field_terms(job):
+    tech_stack = job.get('tech_stack') or []
+    return {
+        'title': set(tokenize(job.get('title'))),
+        'company': set(tokenize(job.get('company'))),
+        'tech_stack': set(tokenize(' '.join(tech_stack))),
+    }
+
+
+def search_terms(job):
+    """The sorted term array stored on a job document."""
+    terms = set()
+    for field_terms in _field_terms(job).values():
+        terms |= field_terms
+    return sorted(terms)
+
+
+def build_query(tokens):
+    """Every query token must prefix-match at least one of the job's terms."""
+    clauses = [{'search_terms': {'$regex': '^' + re.escape(token)}} for token in tokens]
+    if len(clauses) == 1:
+        return clauses[0]
+    return {'$and': clauses}
+
+
+def score(job, tokens):
+    fields = _field_terms(job)
+    total = 0.0
+    for token in tokens:
+        best = 0.0
+        for field, terms in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            if token in terms:
+                best = max(best, weight)
+            elif any(term.startswith(token) for term in terms):
+                best = max(best, weight * PREFIX_FACTOR)
+        total += best
+    return total
+
+
+def rank(jobs, tokens):
+    """Orders matched jobs by relevance. The sort is stable, so ties keep their deadline order."""
+    return sorted(jobs, key=lambda job: score(job, tokens), reverse=True)
+
+
+def backfill(batch_size=1000):
+    """Builds search_terms for jobs created before search existed. Safe to re-run."""
+    cursor = db.jobs.find({'search_terms': {'$exists': False}}, {'title': 1, 'company': 1, 'tech_stack': 1})
+    ops = (UpdateOne({'_id': job['_id']}, {'$set': {'search_terms': search_terms(job)}}) for job in cursor)
+    _, updated = bulk.flush_in_batches(db.jobs, ops, batch_size)
+    return updated
+
+
+if __name__ == '__main__':
+    count = backfill()
+    print(f"Backfilled search terms on {count} jobs")
@@ -1,23 +1,61 @@
 # seed.py
+#
+# Demo and synthetic data. `python seed.py` resets the database to two demo
+# accounts and six jobs. Passing sizes adds generated data on top, for
+# capacity planning and benchmarks/loadtest.py:
+#
+#   python seed.py --students 20000 --jobs 2000 --applications 500000
+#
+# Generation is deterministic for a given --seed. Job popularity and student
+# activity are Zipf-like, so a few postings draw most of the applications as
+# on a real placement drive. Documents are written with insert_many in
+# batches of --batch-size. Every generated student logs in with student123
+# and every generated coordinator with coord123.
 
+import random
+import argparse
 from datetime import datetime, timezone, timedelta
 import db
+import search
+import eligibility
+import passwords
+import migrations
+import matching
 from bson import ObjectId
-from flask import Flask # Add this import
-from flask_bcrypt import Bcrypt # Add this import
 
-# You need an app context to use flask_bcrypt
-app = Flask(__name__)
-bcrypt = Bcrypt(app)
+STUDENT_PASSWORD = 'student123'
+COORD_PASSWORD = 'coord123'
+SYNTHETIC_DOMAIN = 'synthetic.demo'
+
+FIRST_NAMES = ['Aarav', 'Ananya', 'Arjun', 'Diya', 'Ishaan', 'Kavya', 'Meera', 'Nikhil', 'Priya', 'Rahul',
+               'Rohan', 'Sneha', 'Tanvi', 'Varun', 'Vikram', 'Zara', 'Aditi', 'Karthik', 'Neha', 'Siddharth']
+LAST_NAMES = ['Sharma', 'Iyer', 'Reddy', 'Patel', 'Gupta', 'Nair', 'Rao', 'Singh', 'Menon', 'Joshi',
+              'Kulkarni', 'Das', 'Shetty', 'Bose', 'Verma']
+# (branch, share of students)
+BRANCHES = [('CSE', 30), ('ISE', 15), ('AIML', 12), ('CSE DS', 8), ('CSE CY', 5), ('ECE', 12),
+            ('EIE', 6), ('EEE', 5), ('ME', 5), ('CV', 2)]
+SKILLS = ['Python', 'Java', 'C++', 'JavaScript', 'React', 'Node.js', 'MongoDB', 'MySQL', 'Flask', 'Django',
+          'Spring Boot', 'AWS', 'Docker', 'Kubernetes', 'Machine Learning', 'Pandas', 'Go', 'TypeScript',
+          'CSS', 'Linux', 'Git', 'Azure', 'TensorFlow', 'Embedded C']
+COMPANIES = ['Google', 'Microsoft', 'Amazon', 'Flipkart', 'Zomato', 'Paytm', 'Infosys', 'TCS', 'Wipro',
+             'Swiggy', 'Razorpay', 'PhonePe', 'Atlassian', 'Adobe', 'Oracle', 'Cisco', 'Intuit', 'Zoho',
+             'Freshworks', 'Bosch', 'Siemens', 'Texas Instruments', 'Goldman Sachs', 'Walmart Labs']
+TITLES = ['Software Engineer', 'Backend Engineer', 'Frontend Developer', 'Full Stack Developer',
+          'Data Scientist', 'Data Analyst', 'DevOps Engineer', 'ML Engineer', 'SDE', 'QA Engineer',
+          'Embedded Engineer', 'Cloud Engineer', 'Security Analyst']
+LOCATIONS = ['Bangalore', 'Hyderabad', 'Pune', 'Chennai', 'Mumbai', 'Delhi', 'Noida', 'Gurgaon', 'Remote']
+# (status, share of applications)
+STATUSES = [('Applied', 70), ('Shortlisted', 18), ('Rejected', 12)]
 
 def seed_database():
     db.users.delete_many({})
     db.jobs.delete_many({})
     db.applications.delete_many({})
+    db.job_matches.delete_many({})
     
     # Hash passwords for the demo users
-    student_password = bcrypt.generate_password_hash('student123').decode('utf-8')
-    coord_password = bcrypt.generate_password_hash('coord123').decode('utf-8')
+    student_password = passwords.hash_password(STUDENT_PASSWORD)
+    coord_password = passwords.hash_password(COORD_PASSWORD)
     
     student_user = {
         'role': 'student',
@@ -186,6 +224,8 @@ def seed_database():
     
     job_ids = []
     for job_data in jobs_data:
+        job_data['search_terms'] = search.search_terms(job_data)
+        job_data[eligibility.INDEX_FIELD] = eligibility.build_index(job_data['eligibility'])
         job_id = db.jobs.insert_one(job_data).inserted_id
         job_ids.append(job_id)
     
@@ -194,5 +234,186 @@ def seed_database():
     print(f"- {len(jobs_data)} jobs")
     print("Demo setup complete!")
 
+
+def _zipf_weights(n, exponent, rng):
+    """Zipf-like weights in random order, so the popular items are not simply the first ones created."""
+    weights = [1 / (rank + 1) ** exponent for rank in range(n)]
+    rng.shuffle(weights)
+    return weights
+
+
+def _insert_batches(collection, docs, batch_size):
+    """insert_many in batches of batch_size; returns the inserted ids in order."""
+    ids, batch = [], []
+    for doc in docs:
+        batch.append(doc)
+        if len(batch) == batch_size:
+            ids.extend(collection.insert_many(batch, ordered=False).inserted_ids)
+            batch = []
+    if batch:
+        ids.extend(collection.insert_many(batch, ordered=False).inserted_ids)
+    return ids
+
+
+def _synthetic_coordinators(count, password_hash, now):
+    for i in range(count):
+        yield {
+            'role': 'coordinator',
+            'name': {'first': 'Coordinator', 'last': str(i)},
+            'email': f'coord{i}@{SYNTHETIC_DOMAIN}',
+            'password': password_hash,
+            'phone': f'90000{i:05d}',
+            'updated_at': now
+        }
+
+
+def _synthetic_students(count, password_hash, rng, now):
+    branches, branch_weights = zip(*BRANCHES)
+    for i in range(count):
+        cgpa = round(min(10.0, max(5.0, rng.gauss(7.6, 0.9))), 2)
+        has_internship = rng.random() < 0.35
+        yield {
+            'role': 'student',
+            'name': {'first': rng.choice(FIRST_NAMES), 'last': rng.choice(LAST_NAMES)},
+            'email': f'student{i}@{SYNTHETIC_DOMAIN}',
+            'password': password_hash,
+            'phone': f'8{rng.randrange(10 ** 9):09d}',
+            'degree': 'BE',
+            'branch': rng.choices(branches, branch_weights)[0],
+            'college': 'RVCE',
+            'ug_cgpa': cgpa,
+            'ug_percentage': round(min(99.0, cgpa * 9.5 + rng.uniform(-3, 3)), 1),
+            'ug_yop': rng.choice([2025, 2026, 2027]),
+            'tenth_percentage': round(rng.uniform(70, 98), 1),
+            'twelfth_percentage': round(rng.uniform(65, 97), 1),
+            'has_internship': has_internship,
+            'standing_backlogs': rng.random() < 0.1,
+            'skills': rng.sample(SKILLS, rng.randint(3, 7)),
+            'experience': [{
+                'type': 'Internship',
+                'company': rng.choice(COMPANIES),
+                'title': 'Intern',
+                'start_date': '2024-06-01',
+                'end_date': '2024-08-31',
+                'is_current': False,
+                'technologies': rng.sample(SKILLS, 2)
+            }] if has_internship else [],
+            'updated_at': now
+        }
+
+
+def _synthetic_jobs(count, coordinator_ids, rng, now):
+    branches = [branch for branch, _ in BRANCHES]
+    for _ in range(count):
+        # Most postings are open; a fifth have already closed
+        deadline = now + timedelta(days=rng.uniform(-30, 60))
+        created_at = min(now, deadline - timedelta(days=rng.uniform(7, 45)))
+        internship = rng.random() < 0.4
+        rules = {'backlogs_allowed': rng.random() < 0.3}
+        if rng.random() < 0.7:
+            rules['min_cgpa'] = rng.choice([6.0, 6.5, 7.0, 7.5, 8.0])
+        if rng.random() < 0.3:
+            rules['min_percentage'] = rng.choice([60, 65, 70, 75])
+        if rng.random() < 0.6:
+            rules['branches'] = rng.sample(branches, rng.randint(2, 5))
+        job = {
+            'title': rng.choice(TITLES) + (' Intern' if internship else ''),
+            'company': rng.choice(COMPANIES),
+            'type': 'Internship' if internship else 'Full-time',
+            'location': rng.choice(LOCATIONS),
+            'tech_stack': rng.sample(SKILLS, 3),
+            'deadline': deadline,
+            'eligibility': rules,
+            'description': 'Synthetic posting generated by seed.py for load testing.',
+            'created_by': rng.choice(coordinator_ids),
+            'created_at': created_at
+        }
+        if internship:
+            job['stipend'] = rng.randrange(10000, 80001, 5000)
+        else:
+            job['ctc'] = rng.randrange(400000, 3000001, 100000)
+        job['search_terms'] = search.search_terms(job)
+        job[eligibility.INDEX_FIELD] = eligibility.build_index(rules)
+        yield job
+
+
+def _synthetic_applications(count, student_ids, jobs, rng, now):
+    """Unique (student, job) pairs, drawn with skewed job popularity and student activity."""
+    statuses, status_weights = zip(*STATUSES)
+    student_cum = list(_cumulative(_zipf_weights(len(student_ids), 0.6, rng)))
+    job_cum = list(_cumulative(_zipf_weights(len(jobs), 1.0, rng)))
+    seen = set()
+    draws = 0
+    while len(seen) < count and draws < count * 20:
+        draws += 1
+        s = rng.choices(range(len(student_ids)), cum_weights=student_cum)[0]
+        j = rng.choices(range(len(jobs)), cum_weights=job_cum)[0]
+        if (s, j) in seen:
+            continue
+        seen.add((s, j))
+        job_id, created_at, deadline = jobs[j]
+        window = (min(now, deadline) - created_at).total_seconds()
+        yield {
+            'user_id': student_ids[s],
+            'job_id': job_id,
+            'status': rng.choices(statuses, status_weights)[0],
+            'created_at': created_at + timedelta(seconds=rng.uniform(0, max(window, 0)))
+        }
+
+
+def _cumulative(weights):
+    total = 0
+    for weight in weights:
+        total += weight
+        yield total
+
+
+def generate(students=0, jobs=0, applications=0, coordinators=None, seed=42, batch_size=5000):
+    """
+    Inserts synthetic coordinators, students, jobs and applications. Returns
+    the number of documents of each kind actually inserted.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    if coordinators is None:
+        coordinators = max(1, jobs // 50) if jobs else 0
+    # Every pair can apply at most once
+    applications = min(applications, students * jobs)
+
+    # One hash per role: bcrypt per user would dominate seeding time
+    coordinator_ids = _insert_batches(
+        db.users, _synthetic_coordinators(coordinators, passwords.hash_password(COORD_PASSWORD), now), batch_size)
+    student_ids = _insert_batches(
+        db.users, _synthetic_students(students, passwords.hash_password(STUDENT_PASSWORD), rng, now), batch_size)
+
+    # insert_many fills in each document's _id
+    job_docs = list(_synthetic_jobs(jobs, coordinator_ids, rng, now)) if coordinator_ids else []
+    job_ids = _insert_batches(db.jobs, job_docs, batch_size)
+    job_rows = [(doc['_id'], doc['created_at'], doc['deadline']) for doc in job_docs]
+
+    application_ids = []
+    if student_ids and job_rows:
+        application_ids = _insert_batches(
+            db.applications, _synthetic_applications(applications, student_ids, job_rows, rng, now), batch_size)
+
+    return {'coordinators': len(coordinator_ids), 'students': len(student_ids),
+            'jobs': len(job_ids), 'applications': len(application_ids)}
+
 if __name__ == '__main__':
-    seed_database()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Reset the database to demo data, optionally adding synthetic data.')
+    parser.add_argument('--students', type=int, default=0)
+    parser.add_argument('--jobs', type=int, default=0)
+    parser.add_argument('--applications', type=int, default=0)
+    parser.add_argument('--coordinators', type=int, default=None, help='default: one per 50 jobs')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    migrations.run()
+    seed_database()
+    if args.students or args.jobs or args.applications:
+        counts = generate(args.students, args.jobs, args.applications, args.coordinators, args.seed, args.batch_size)
+        print(f"Generated {counts['students']} students, {counts['coordinators']} coordinators "
+              f"(student<n>@{SYNTHETIC_DOMAIN} / {STUDENT_PASSWORD}, coord<n>@{SYNTHETIC_DOMAIN} / {COORD_PASSWORD}), "
+              f"{counts['jobs']} jobs and {counts['applications']} applications")
+    print(f"Stored {matching.rebuild()} job matches")
@@ -0,0 +1,46 @@
+# workers.py
+#
+# Background executors shared by the backend. Pools and their threads do not
+# survive fork, so each web worker builds its own on first use rather than
+# inheriting a dead one from the gunicorn master. Process pools start their
+# children with forkserver, so they begin clean instead of inheriting the web
+# worker's threads.
+
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+
+class PerProcessExecutor:
+    """A thread or process pool built lazily, once per process."""
+
+    def __init__(self, kind, max_workers, name=None):
+        if kind not in ('thread', 'process'):
+            raise ValueError(f"kind must be 'thread' or 'process', not {kind!r}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.name = name
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                if self.kind == 'thread':
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                        thread_name_prefix=self.name or '')
+                else:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                         mp_context=multiprocessing.get_context('forkserver'))
+                self._pid = os.getpid()
+            return self._executor
+
+    def submit(self, fn, *args, **kwargs):
+        return self.get().submit(fn, *args, **kwargs)
+
+
+def per_process_executor(kind, max_workers, name=None):
+    """A PerProcessExecutor; kind is 'thread' or 'process', name prefixes thread names."""
+    return PerProcessExecutor(kind, max_workers, name)
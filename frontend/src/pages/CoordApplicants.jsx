@@ -8,20 +8,30 @@ import toast from 'react-hot-toast';
 import Spinner from '../components/Spinner'; 
 import StatusChip from '../components/StatusChip';
 
+const PAGE_SIZE = 50;
+
 function CoordApplicants() {
     const { id } = useParams();
     const [applications, setApplications] = useState([]);
     const [job, setJob] = useState(null);
     const [loading, setLoading] = useState(true);
+    const [selected, setSelected] = useState(new Set());
+    const [page, setPage] = useState(1);
+    const [total, setTotal] = useState(0);
+    const [statusFilter, setStatusFilter] = useState('');
+    const [sort, setSort] = useState('created_at');
 
     const fetchApplicants = async () => {
         try {
-            // Fetch both applications and job details concurrently
+            // Fetch one page of applications and the job details concurrently
+            const params = { page, limit: PAGE_SIZE, sort };
+            if (statusFilter) params.status = statusFilter;
             const [appsResponse, jobResponse] = await Promise.all([
-                api.get(`/jobs/${id}/applications`),
+                api.get(`/jobs/${id}/applications`, { params }),
                 api.get(`/jobs/${id}`)
             ]);
-            setApplications(appsResponse.data);
+            setApplications(appsResponse.data.applications);
+            setTotal(appsResponse.data.total);
             setJob(jobResponse.data);
         } catch (error) {
             toast.error("Failed to load applicant data.");
@@ -33,7 +43,15 @@ function CoordApplicants() {
 
     useEffect(() => {
         fetchApplicants();
-    }, [id]);
+    }, [id, page, statusFilter, sort]);
+
+    const changeFilter = (setter) => (e) => {
+        setter(e.target.value);
+        setPage(1);
+        setSelected(new Set());
+    };
+
+    const pageCount = Math.max(1, Math.ceil(total / PAGE_SIZE));
 
     const handleStatusChange = async (appId, newStatus) => {
         const promise = api.put(`/applications/${appId}/status`, { status: newStatus });
@@ -53,6 +71,58 @@ function CoordApplicants() {
         }
     };
 
+    const toggleSelected = (appId) => {
+        setSelected((current) => {
+            const next = new Set(current);
+            next.has(appId) ? next.delete(appId) : next.add(appId);
+            return next;
+        });
+    };
+
+    const toggleAll = () => {
+        setSelected((current) =>
+            current.size === applications.length ? new Set() : new Set(applications.map((app) => app._id))
+        );
+    };
+
+    // One request for the whole selection instead of one per applicant
+    const handleBulkStatusChange = async (newStatus) => {
+        const promise = api.put(`/jobs/${id}/applications/status`, { status: newStatus, ids: [...selected] });
+
+        toast.promise(promise, {
+            loading: `Updating ${selected.size} applications...`,
+            success: (res) => `${res.data.modified} applications marked ${newStatus}`,
+            error: 'Failed to update status.'
+        });
+
+        try {
+            await promise;
+            setSelected(new Set());
+            fetchApplicants();
+        } catch (error) {
+            console.error(error);
+        }
+    };
+
+    // The export is streamed by the API; download it as a file with the auth header attached
+    const handleExport = async (format) => {
+        try {
+            const res = await api.get(`/jobs/${id}/applications/export`, {
+                params: { format },
+                responseType: 'blob'
+            });
+            const url = URL.createObjectURL(res.data);
+            const link = document.createElement('a');
+            link.href = url;
+            link.download = `applicants-${id}.${format}`;
+            link.click();
+            URL.revokeObjectURL(url);
+        } catch (error) {
+            toast.error('Export failed.');
+            console.error(error);
+        }
+    };
+
     if (loading) {
         return <div className="flex justify-center items-center h-64"><Spinner /></div>;
     }
@@ -61,13 +131,78 @@ function CoordApplicants() {
     return (
         <div className="bg-white p-6 sm:p-8 rounded-lg border border-slate-200 shadow-sm">
             <h1 className="text-2xl font-bold text-slate-800">Applicants for {job?.title}</h1>
-            <p className="text-slate-600 mb-6">{job?.company}</p>
+            <div className="flex items-center justify-between mb-6">
+                <p className="text-slate-600">{job?.company}</p>
+                {total > 0 && (
+                    <div className="flex gap-2">
+                        <button
+                            onClick={() => handleExport('csv')}
+                            className="px-3 py-1 text-xs font-medium rounded-md border border-slate-300 bg-white hover:bg-slate-100"
+                        >
+                            Export CSV
+                        </button>
+                        <button
+                            onClick={() => handleExport('ndjson')}
+                            className="px-3 py-1 text-xs font-medium rounded-md border border-slate-300 bg-white hover:bg-slate-100"
+                        >
+                            Export NDJSON
+                        </button>
+                    </div>
+                )}
+            </div>
+
+            <div className="flex items-center gap-3 mb-4">
+                <select
+                    className="form-select text-sm rounded-md border-slate-300"
+                    value={statusFilter}
+                    onChange={changeFilter(setStatusFilter)}
+                >
+                    <option value="">All statuses</option>
+                    <option>Applied</option>
+                    <option>Shortlisted</option>
+                    <option>Rejected</option>
+                    <option>Offer</option>
+                </select>
+                <select
+                    className="form-select text-sm rounded-md border-slate-300"
+                    value={sort}
+                    onChange={changeFilter(setSort)}
+                >
+                    <option value="created_at">Oldest first</option>
+                    <option value="-created_at">Newest first</option>
+                    <option value="-cgpa">Highest CGPA</option>
+                    <option value="cgpa">Lowest CGPA</option>
+                </select>
+                <span className="text-sm text-slate-500">{total} applicants</span>
+            </div>
+
+            {selected.size > 0 && (
+                <div className="flex items-center gap-3 mb-4 p-3 bg-slate-50 border border-slate-200 rounded-md">
+                    <span className="text-sm text-slate-700">{selected.size} selected</span>
+                    {['Shortlisted', 'Rejected', 'Offer'].map((status) => (
+                        <button
+                            key={status}
+                            onClick={() => handleBulkStatusChange(status)}
+                            className="px-3 py-1 text-xs font-medium rounded-md border border-slate-300 bg-white hover:bg-slate-100"
+                        >
+                            Mark {status}
+                        </button>
+                    ))}
+                </div>
+            )}
 
             {applications.length > 0 ? (
                 <div className="overflow-x-auto">
                     <table className="min-w-full divide-y divide-slate-200">
                         <thead className="bg-slate-50">
                             <tr>
+                                <th className="px-4 py-3">
+                                    <input
+                                        type="checkbox"
+                                        checked={selected.size > 0 && selected.size === applications.length}
+                                        onChange={toggleAll}
+                                    />
+                                </th>
                                 <th className="px-6 py-3 text-left text-xs font-medium text-slate-500 uppercase tracking-wider">Name</th>
                                 <th className="px-6 py-3 text-left text-xs font-medium text-slate-500 uppercase tracking-wider">Branch</th>
                                 <th className="px-6 py-3 text-left text-xs font-medium text-slate-500 uppercase tracking-wider">CGPA/%</th>
@@ -79,11 +214,18 @@ function CoordApplicants() {
                         <tbody className="bg-white divide-y divide-slate-200">
                             {applications.map((app) => (
                                 <tr key={app._id}>
-                                    <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-slate-900">{app.profile_snapshot.name.first} {app.profile_snapshot.name.last}</td>
-                                    <td className="px-6 py-4 whitespace-nowrap text-sm text-slate-600">{app.profile_snapshot.branch}</td>
-                                    <td className="px-6 py-4 whitespace-nowrap text-sm text-slate-600">{app.profile_snapshot.ug_cgpa || app.profile_snapshot.ug_percentage}</td>
+                                    <td className="px-4 py-4">
+                                        <input
+                                            type="checkbox"
+                                            checked={selected.has(app._id)}
+                                            onChange={() => toggleSelected(app._id)}
+                                        />
+                                    </td>
+                                    <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-slate-900">{app.profile?.name?.first} {app.profile?.name?.last}</td>
+                                    <td className="px-6 py-4 whitespace-nowrap text-sm text-slate-600">{app.profile?.branch}</td>
+                                    <td className="px-6 py-4 whitespace-nowrap text-sm text-slate-600">{app.profile?.ug_cgpa || app.profile?.ug_percentage}</td>
                                     <td className="px-6 py-4 whitespace-nowrap text-sm">
-                                        <a href={app.profile_snapshot.resume_url} target="_blank" rel="noopener noreferrer" className="text-indigo-600 hover:text-indigo-800 font-medium">
+                                        <a href={app.profile?.resume_url} target="_blank" rel="noopener noreferrer" className="text-indigo-600 hover:text-indigo-800 font-medium">
                                             View
                                         </a>
                                     </td>
@@ -106,9 +248,28 @@ function CoordApplicants() {
                             ))}
                         </tbody>
                     </table>
+                    <div className="flex items-center justify-between mt-4 text-sm text-slate-600">
+                        <button
+                            disabled={page <= 1}
+                            onClick={() => { setPage(page - 1); setSelected(new Set()); }}
+                            className="px-3 py-1 rounded-md border border-slate-300 disabled:opacity-50"
+                        >
+                            Previous
+                        </button>
+                        <span>Page {page} of {pageCount}</span>
+                        <button
+                            disabled={page >= pageCount}
+                            onClick={() => { setPage(page + 1); setSelected(new Set()); }}
+                            className="px-3 py-1 rounded-md border border-slate-300 disabled:opacity-50"
+                        >
+                            Next
+                        </button>
+                    </div>
                 </div>
             ) : (
-                <p className="text-center text-slate-500 py-8">No applications have been received for this job yet.</p>
+                <p className="text-center text-slate-500 py-8">
+                    {statusFilter ? 'No applications match this filter.' : 'No applications have been received for this job yet.'}
+                </p>
             )}
         </div>
     );
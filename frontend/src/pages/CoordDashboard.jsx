@@ -178,7 +178,14 @@ function CoordDashboard() {
                                                     {isExpired ? 'Expired' : 'Active'}
                                                 </span>
                                             </td>
-                                            <td className="px-6 py-4 whitespace-nowrap text-sm text-slate-600 text-center font-medium">{job.application_count}</td>
+                                            <td className="px-6 py-4 whitespace-nowrap text-sm text-slate-600 text-center font-medium">
+                                                <div>{job.application_count}</div>
+                                                {job.status_counts && job.application_count > 0 && (
+                                                    <div className="text-xs text-slate-400 font-normal">
+                                                        {job.status_counts.Shortlisted} shortlisted · {job.status_counts.Offer} offers · {job.status_counts.Rejected} rejected
+                                                    </div>
+                                                )}
+                                            </td>
                                             <td className="px-6 py-4 whitespace-nowrap text-sm text-slate-600">{new Date(job.deadline).toLocaleDateString('en-US', { year: 'numeric', month: 'long', day: 'numeric' })}</td>
                                             <td className="px-6 py-4 whitespace-nowrap text-right text-sm font-medium">
                                                 <div className="flex items-center justify-end space-x-4">
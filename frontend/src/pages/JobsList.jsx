@@ -7,6 +7,9 @@ import toast from 'react-hot-toast';
 import { useAuth } from '../context/AuthContext'; // Import useAuth to check user role
 import { FaBriefcase, FaBuilding, FaMapMarkerAlt, FaCalendarAlt, FaUsers } from 'react-icons/fa';
 
+// Students browse open jobs a page at a time, without the heavy description/eligibility fields
+const PAGE_SIZE = 24;
+
 // A reusable component for displaying a single job card
 const JobCard = ({ job, user }) => {
     // Determine the correct link based on the user's role
@@ -45,6 +48,8 @@ const JobCard = ({ job, user }) => {
 function JobsList() {
     const [jobs, setJobs] = useState([]);
     const [loading, setLoading] = useState(true);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
     const { user } = useAuth(); // Get the current user from the AuthContext
 
     useEffect(() => {
@@ -52,13 +57,16 @@ function JobsList() {
         setLoading(true);
 
         // Choose the API endpoint based on the user's role
-        const endpoint = user?.role === 'coordinator' ? '/coord/jobs' : '/jobs';
+        const isCoordinator = user?.role === 'coordinator';
+        const endpoint = isCoordinator ? '/coord/jobs' : '/jobs';
+        const params = isCoordinator ? {} : { limit: PAGE_SIZE, fields: 'summary' };
         
         const fetchJobs = () => {
-            api.get(endpoint)
+            api.get(endpoint, { params })
                 .then(res => {
                     if (isMounted) {
-                        setJobs(res.data);
+                        setJobs(isCoordinator ? res.data : res.data.jobs);
+                        setNextCursor(isCoordinator ? null : res.data.next_cursor);
                     }
                 })
                 .catch(err => {
@@ -79,6 +87,21 @@ function JobsList() {
         };
     }, [user]); // Re-run the effect if the user object changes
 
+    const loadMore = () => {
+        if (!nextCursor) return;
+        setLoadingMore(true);
+        api.get('/jobs', { params: { limit: PAGE_SIZE, fields: 'summary', cursor: nextCursor } })
+            .then(res => {
+                setJobs(prev => [...prev, ...res.data.jobs]);
+                setNextCursor(res.data.next_cursor);
+            })
+            .catch(err => {
+                toast.error("Failed to load more jobs.");
+                console.error("Failed to load more jobs:", err);
+            })
+            .finally(() => setLoadingMore(false));
+    };
+
     if (loading) {
         return <div className="text-center py-10">Loading jobs...</div>;
     }
@@ -107,6 +130,14 @@ function JobsList() {
                     </p>
                 </div>
             )}
+
+            {nextCursor && (
+                <div className="text-center">
+                    <button onClick={loadMore} disabled={loadingMore} className="px-4 py-2 bg-white border border-slate-300 text-slate-700 text-sm font-semibold rounded-md hover:bg-slate-50 transition-colors disabled:opacity-50">
+                        {loadingMore ? 'Loading...' : 'Load more jobs'}
+                    </button>
+                </div>
+            )}
         </div>
     );
 }
@@ -24,9 +24,48 @@ function normalizeGaps(gaps = {}) {
   return out;
 }
 
+const API = "http://localhost:5000/api";
+const POLL_INTERVAL_MS = 1500;
+
+/** Polls a queued analysis until it finishes; resolves with the analysis payload */
+async function waitForAnalysis(jobId) {
+  for (;;) {
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+    const res = await fetch(`${API}/resume/analyze/${jobId}`);
+    const data = await res.json();
+    if (!res.ok) throw new Error(data?.error || "Failed to analyze");
+    if (data.status === "done") return data.result;
+    if (data.status === "failed") throw new Error(data.error || "Failed to analyze");
+  }
+}
+
+/** Reads a Server-Sent Events body, calling onEvent(event, data) for each message */
+async function readEventStream(res, onEvent) {
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let boundary;
+    while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+      const raw = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      let event = "message";
+      let data = "";
+      for (const line of raw.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+      onEvent(event, data ? JSON.parse(data) : {});
+    }
+  }
+}
+
 export default function ResumeCoach() {
   const [analysis, setAnalysis] = useState(null);
-  const [resumeSnippet, setResumeSnippet] = useState("");
+  const [sessionId, setSessionId] = useState(null);
   const [messages, setMessages] = useState([]);
   const [loading, setLoading] = useState(false);
   const fileRef = useRef();
@@ -45,19 +84,28 @@ export default function ResumeCoach() {
 
     setLoading(true);
     try {
-      const res = await fetch("http://localhost:5000/api/resume/analyze", { method: "POST", body: form });
-      const data = await res.json();
+      // Async mode returns 202 + job_id; cached analyses come back immediately with 200
+      const res = await fetch(`${API}/resume/analyze?async=true`, { method: "POST", body: form });
+      let data = await res.json();
       if (!res.ok) {
         toast.error(data?.error || "Failed to analyze");
         return;
       }
+      if (res.status === 202) {
+        try {
+          data = await waitForAnalysis(data.job_id);
+        } catch (err) {
+          toast.error(err.message);
+          return;
+        }
+      }
 
       const normalized = {
         ...data.analysis,
         skill_gaps: normalizeGaps(data.analysis?.skill_gaps)
       };
       setAnalysis(normalized);
-      setResumeSnippet(data.resume_snippet);
+      setSessionId(data.session_id);
       setMessages([
         {
           role: "assistant",
@@ -81,17 +129,30 @@ export default function ResumeCoach() {
     setMessages((m) => [...m, userMsg]);
 
     try {
-      const res = await fetch("http://localhost:5000/api/resume/chat", {
+      // Stream the reply token by token instead of waiting for the whole completion
+      const res = await fetch(`${API}/resume/chat?stream=true`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ message: trimmed, analysis, resume_snippet: resumeSnippet })
+        headers: { "Content-Type": "application/json", Accept: "text/event-stream" },
+        // The server keeps the resume, analysis and earlier turns for this session
+        body: JSON.stringify({ session_id: sessionId, message: trimmed })
       });
-      const data = await res.json();
       if (!res.ok) {
-        toast.error(data?.detail || "Chat failed");
+        const data = await res.json().catch(() => ({}));
+        toast.error(res.status === 404 ? data.error : data?.detail || "Chat failed");
         return;
       }
-      setMessages((m) => [...m, { role: "assistant", content: data.reply }]);
+
+      setMessages((m) => [...m, { role: "assistant", content: "" }]);
+      const appendToReply = (delta) =>
+        setMessages((m) => {
+          const last = m[m.length - 1];
+          return [...m.slice(0, -1), { ...last, content: last.content + delta }];
+        });
+
+      await readEventStream(res, (event, data) => {
+        if (event === "error") toast.error(data?.detail || "Chat failed");
+        else if (data.delta) appendToReply(data.delta);
+      });
     } catch {
       toast.error("Chat failed");
     }